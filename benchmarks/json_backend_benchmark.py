@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+"""Compares the installed JSON backends on representative configuration files.
+
+For every installed backend (cf. :data:`argmagiq.json_backend.BACKENDS`), this script measures the time that it takes
+to decode each of the following files, which are generated in a temporary directory:
+
+* ``small``: a flat configuration with a handful of values, like the ones found in ``examples/``,
+* ``wide``: a flat configuration with 1,000 values of mixed types, and
+* ``bundle``: a configuration bundle with embedded arrays, e.g., as used for describing a sweep.
+
+Usage: ``PYTHONPATH=src/main/python python3 benchmarks/json_backend_benchmark.py [REPETITIONS]``
+"""
+
+
+import json
+import os
+import random
+import sys
+import tempfile
+import timeit
+import typing
+
+import argmagiq.json_backend as json_backend
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+DEFAULT_REPETITIONS = 100
+"""int: The default number of times that each file is decoded by each backend."""
+
+
+def create_configs(rng: random.Random) -> typing.Dict[str, typing.Any]:
+    """Creates the configurations that are used for benchmarking.
+
+    Args:
+        rng (random.Random): The random number generator to use.
+
+    Returns:
+        dict[str, any]: Maps the names of the configurations to the same.
+    """
+
+    small = {"first_value": 1, "second_value": 2.5, "verbose": True, "output_dir": "/tmp/out"}
+
+    wide = {}
+    for idx in range(1000):
+        wide[f"int_value_{idx}"] = rng.randint(-10 ** 6, 10 ** 6)
+        wide[f"float_value_{idx}"] = rng.random()
+        wide[f"str_value_{idx}"] = f"value-{rng.getrandbits(64):x}"
+        wide[f"bool_value_{idx}"] = rng.random() < 0.5
+
+    bundle = {
+            "name": "bundle",
+            "learning_rates": [10 ** rng.uniform(-6, -1) for _ in range(10000)],
+            "seeds": [rng.getrandbits(31) for _ in range(10000)],
+            "runs": [
+                    {
+                            "run_id": idx,
+                            "layers": [rng.choice([64, 128, 256]) for _ in range(8)],
+                            "dropout": rng.random(),
+                            "tags": ["baseline" if idx % 2 else "ablation", f"group-{idx % 7}"]
+                    }
+                    for idx in range(2000)
+            ]
+    }
+
+    return {"small": small, "wide": wide, "bundle": bundle}
+
+
+def main(repetitions: int) -> None:
+
+    backends = [json_backend.JsonBackend(name) for name in json_backend.available_backends()]
+    print(f"Installed backends: {', '.join(b.name for b in backends)}")
+    print(f"Default backend:    {json_backend.get_backend().name}")
+    print(f"Repetitions:        {repetitions}")
+    print()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+
+        # write the config files to disk
+        file_paths = {}
+        for config_name, config in create_configs(random.Random(0)).items():
+            file_paths[config_name] = os.path.join(temp_dir, f"{config_name}.json")
+            with open(file_paths[config_name], "w") as f:
+                json.dump(config, f, indent=4)
+
+        print(f"{'file':<8}  {'size':>10}  " + "  ".join(f"{b.name:>12}" for b in backends))
+        for config_name, file_path in file_paths.items():
+
+            # read the file first, since we are interested in the time needed for decoding
+            with open(file_path, "rb") as f:
+                data = f.read()
+
+            # measure the time per decoding for all backends (in microseconds)
+            times = []
+            for backend in backends:
+                assert backend.loads(data) == backends[-1].loads(data)  # -> all backends have to agree
+                times.append(min(timeit.repeat(lambda: backend.loads(data), number=repetitions, repeat=3)))
+                times[-1] = times[-1] / repetitions * 10 ** 6
+
+            print(
+                    f"{config_name:<8}  {len(data):>9}B  " +
+                    "  ".join(f"{t:>10.1f}us" for t in times)
+            )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_REPETITIONS)
@@ -61,6 +61,10 @@ setuptools.setup(
                 (".", ["LICENSE", "README.md"])
         ],
         description="A Python library for parsing command-line args automagically.",
+        extras_require={
+                "fast-json": ["orjson"],
+                "sweeps": ["numpy"]
+        },
         install_requires=[
                 "insanity>=2017.1"
         ],
@@ -31,15 +31,18 @@
 # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
 
-"""A Python library for parsing command-line args automagically."""
+"""A Python library for parsing command-line args automagically.
 
+In order to keep ``import argmagiq`` cheap, the package imports its submodules lazily, i.e., only when they are needed
+for the first time. Notice that this applies to the classes that are exported by the package as well (cf.
+:data:`_LAZY_EXPORTS`).
+"""
 
-import inspect
+
+import importlib
 import typing
 
 from argmagiq.decorators import *
-from argmagiq.magiq_parser import MagiqParser
-from argmagiq.parsers.data_type_parser import DataTypeParser
 
 
 __author__ = "Patrick Hohenecker"
@@ -58,6 +61,54 @@ DEFAULT_PREFIX = "DEFAULT_"
 TEXT_WIDTH = 80
 """int: The maximum text width used for printing the help text."""
 
+_LAZY_EXPORTS = {
+        "CompiledParser": "argmagiq.compiled_parser",
+        "DataTypeParser": "argmagiq.parsers.data_type_parser",
+        "DiskCache": "argmagiq.disk_cache",
+        "GridSweep": "argmagiq.sweeps.grid_sweep",
+        "MagiqParser": "argmagiq.magiq_parser",
+        "ParserRegistry": "argmagiq.parsers.parser_registry",
+        "RandomSweep": "argmagiq.sweeps.random_sweep",
+        "ResultCache": "argmagiq.result_cache",
+        "Shard": "argmagiq.sweeps.shard",
+        "SuccessiveHalving": "argmagiq.sweeps.successive_halving",
+        "SweepRunner": "argmagiq.sweeps.sweep_runner"
+}
+"""dict[str, str]: Maps the names of classes that are exported by the package to the modules that define them."""
+
+__all__ = [
+        "COMPILED_PARSER_KEY",
+        "DEFAULT_PREFIX",
+        "OPTIONAL_KEY",
+        "TEXT_WIDTH",
+        "config",
+        "extract_config",
+        "optional",
+        "parse_args",
+        "register_parser",
+        *_LAZY_EXPORTS
+]
+"""list[str]: The names that are exported by ``from argmagiq import *``, which imports lazy exports as well."""
+
+
+def __dir__() -> typing.List[str]:
+
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
+def __getattr__(name: str) -> typing.Any:
+
+    # ensure that the requested attribute is a lazy export
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    # import the according module, and store the exported attribute for subsequent lookups
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+
+    return value
+
 
 def extract_config(conf: typing.Any) -> typing.Dict[str, typing.Any]:
     """Creates a ``dict`` that summarizes the values stored in a configuration object.
@@ -71,6 +122,8 @@ def extract_config(conf: typing.Any) -> typing.Dict[str, typing.Any]:
         dict: Maps the names of the considered members to their according values.
     """
 
+    import inspect
+
     if conf is None:
         raise TypeError("<conf> must not be None!")
 
@@ -86,10 +139,29 @@ def extract_config(conf: typing.Any) -> typing.Dict[str, typing.Any]:
     return str_conf
 
 
+def register_parser(data_type: type, parser_cls: type) -> None:
+    """Registers a parser for configuration values of a custom data type.
+
+    The parser is used for all subclasses of ``data_type`` as well, unless a more specific parser has been registered.
+    Notice that parsers have to be registered before any configuration class that makes use of them is annotated with
+    :func:`argmagiq.config`.
+
+    Args:
+        data_type (type): The data type that is parsed by ``parser_cls``.
+        parser_cls (type): A subclass of :class:`argmagiq.parsers.data_type_parser.DataTypeParser` that parses
+            ``data_type``.
+    """
+
+    import argmagiq.parsers.parser_registry as parser_registry
+
+    parser_registry.REGISTRY.register(data_type, parser_cls)
+
+
 def parse_args(
         conf_class: type,
         app_name: str = None,
-        app_description: str = None
+        app_description: str = None,
+        use_disk_cache: bool = False
 ):
     """Parses the args of the current application based on the provided configuration class, and returns an instance of
     the same that is populated accordingly.
@@ -98,12 +170,24 @@ def parse_args(
         conf_class (type): The configuration class that specifies the command line args to parse.
         app_name (str): The name of the application that is printed in the synopsis.
         app_description (str): The description of the application that is printed in the synopsis.
+        use_disk_cache (bool): Indicates whether the parser of ``conf_class`` should be cached on disk in the default
+            cache directory (cf. :func:`argmagiq.disk_cache.default_cache_dir`), which speeds up subsequent invocations
+            of the application.
 
     Returns:
         The parsed configuration as an object of type ``conf_class``.
     """
-    return MagiqParser(
+    import argmagiq.magiq_parser as magiq_parser
+
+    if use_disk_cache:
+        import argmagiq.disk_cache as disk_cache
+        persistent_cache = disk_cache.DiskCache()
+    else:
+        persistent_cache = None
+
+    return magiq_parser.MagiqParser(
             conf_class,
             app_name=app_name,
-            app_description=app_description
+            app_description=app_description,
+            persistent_cache=persistent_cache
     ).parse_args()
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+"""Reading of compressed configuration files and of archives that contain any number of configuration files.
+
+Files are considered as compressed based on their extension (cf. :data:`COMPRESSIONS`), and are decompressed on the fly.
+Archives are read member by member, i.e., without extracting them to disk. The modules that implement the supported
+formats are imported only when they are needed for the first time.
+"""
+
+
+import importlib
+import os
+import typing
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+COMPRESSIONS = {
+        ".bz2": "bz2",
+        ".gz": "gzip",
+        ".lzma": "lzma",
+        ".xz": "lzma"
+}
+"""dict[str, str]: Maps the extensions of compressed files to the modules that are used for decompressing them."""
+
+CONFIG_EXTENSION = ".json"
+"""str: The extension of the (uncompressed) configuration files that are read from archives."""
+
+
+def _get_compression(file_path: str) -> typing.Optional[str]:
+    """Determines the module that is used for decompressing the provided file, or ``None``, if it is not compressed."""
+
+    return COMPRESSIONS.get(os.path.splitext(file_path)[1].lower())
+
+
+def _is_config_file(file_name: str) -> bool:
+    """Determines whether a member of an archive is a (possibly compressed) configuration file."""
+
+    if is_compressed(file_name):
+        file_name = os.path.splitext(file_name)[0]
+
+    return file_name.lower().endswith(CONFIG_EXTENSION)
+
+
+def _iter_archive_members(archive_path: str) -> typing.Iterator[typing.Tuple[str, bytes]]:
+    """Implements :func:`iter_archive` without handling errors that are caused by corrupt archives."""
+
+    import tarfile
+    import zipfile
+
+    # read zip archives
+    if zipfile.is_zipfile(archive_path):
+        with zipfile.ZipFile(archive_path) as archive:
+            for member in archive.infolist():
+                if not member.is_dir() and _is_config_file(member.filename):
+                    yield member.filename, archive.read(member)
+        return
+
+    # read tar archives sequentially -> this avoids seeking in (compressed) archives
+    try:
+        archive = tarfile.open(archive_path, mode="r|*")
+    except tarfile.TarError:
+        raise ValueError(f"The specified file is not a tar or zip archive: '{archive_path}'")
+    with archive:
+        for member in archive:
+            if member.isfile() and _is_config_file(member.name):
+                yield member.name, archive.extractfile(member).read()
+
+
+def decompress(file_name: str, data: bytes) -> bytes:
+    """Decompresses the content of a file, if its name indicates that it is compressed.
+
+    Args:
+        file_name (str): The name of the file, whose extension determines how to decompress it.
+        data (bytes): The content of the file.
+
+    Returns:
+        bytes: The decompressed content, which is ``data`` itself, if the file is not compressed.
+
+    Raises:
+        ValueError: If ``data`` cannot be decompressed.
+    """
+
+    compression = _get_compression(file_name)
+    if compression is None:
+        return data
+
+    try:
+        return importlib.import_module(compression).decompress(data)
+    except Exception:  # -> the decompressors raise a variety of errors for corrupt data
+        raise ValueError(f"The file cannot be decompressed: '{file_name}'")
+
+
+def is_compressed(file_path: str) -> bool:
+    """Determines whether a file is compressed, based on its extension.
+
+    Args:
+        file_path (str): The path of the file.
+
+    Returns:
+        bool: ``True``, if the file is compressed, and ``False`` otherwise.
+    """
+
+    return _get_compression(file_path) is not None
+
+
+def iter_archive(archive_path: str) -> typing.Iterator[typing.Tuple[str, bytes]]:
+    """Iterates over all configuration files in a tar or zip archive without extracting the archive.
+
+    All regular files in the archive whose names end in :data:`CONFIG_EXTENSION`, optionally followed by the extension
+    of a compressed file (e.g., ``.json.gz``), are considered as configuration files. Tar archives may be compressed
+    themselves, and are read sequentially.
+
+    Args:
+        archive_path (str): The path of the archive.
+
+    Yields:
+        tuple: The name of the next configuration file in the archive and its content, which has to be decompressed by
+        means of :func:`decompress`.
+
+    Raises:
+        ValueError: If ``archive_path`` does not refer to a tar or zip archive, or if the archive is corrupt. In the
+            latter case, the error is raised as soon as the corrupt part of the archive is reached.
+    """
+
+    members = _iter_archive_members(archive_path)
+    try:
+        while True:
+
+            # read the next member -> the archive and decompressor modules raise a variety of errors for corrupt data
+            try:
+                member = next(members)
+            except StopIteration:
+                return
+            except ValueError:
+                raise
+            except Exception as e:
+                raise ValueError(f"The specified archive is corrupt: '{archive_path}'") from e
+
+            yield member
+
+    finally:
+        members.close()  # -> this closes the archive, even if the iteration is stopped early
+
+
+def open_file(file_path: str) -> typing.BinaryIO:
+    """Opens a file for reading binary data, and decompresses it on the fly, if it is compressed.
+
+    Args:
+        file_path (str): The path of the file to open.
+
+    Returns:
+        A binary file object.
+    """
+
+    compression = _get_compression(file_path)
+    if compression is None:
+        return open(file_path, "rb")
+
+    return importlib.import_module(compression).open(file_path, "rb")
+
+
+def read_file(file_path: str) -> bytes:
+    """Reads the entire content of a file, and decompresses it, if it is compressed.
+
+    Args:
+        file_path (str): The path of the file to read.
+
+    Returns:
+        bytes: The (decompressed) content of the file.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is compressed, but its content cannot be decompressed.
+    """
+
+    with open_file(file_path) as f:
+        try:
+            return f.read()
+        except Exception:  # -> the decompressors raise a variety of errors for corrupt data
+            if not is_compressed(file_path):
+                raise
+            raise ValueError(f"The specified config file cannot be decompressed: '{file_path}'")
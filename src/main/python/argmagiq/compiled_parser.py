@@ -0,0 +1,791 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import collections.abc
+import os
+import sys
+import typing
+
+import insanity
+
+import argmagiq
+import argmagiq.archives as archives
+import argmagiq.config_spec as config_spec
+import argmagiq.json_backend as json_backend
+import argmagiq.json_pointer as json_pointer
+import argmagiq.parsers.data_type_parser as data_type_parser
+import argmagiq.parsers.parser_registry as parser_registry
+
+if typing.TYPE_CHECKING:
+    import argmagiq.result_cache
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+COMMAND_LINE_SOURCE = "<command line>"
+"""str: The source that is recorded by :meth:`CompiledParser.parse_layered` for values specified on the command line."""
+
+DEFAULT_SOURCE = "<default>"
+"""str: The source that is recorded by :meth:`CompiledParser.parse_layered` for values that have not been specified."""
+
+
+class CompiledParser(object):
+    """Parses configurations of a particular :class:`config_spec.ConfigSpec`.
+
+    Modules that are needed by some of the inputs only (e.g., ``json`` for configuration files) are imported when they
+    are used for the first time.
+
+    All of the data structures that are needed for parsing, i.e., the parsers of all configuration values, the index
+    that dispatches command-line args to them, and the set of required configuration values, are created once, when the
+    ``CompiledParser`` is created. Therefore, a ``CompiledParser`` should be reused for parsing any number of
+    configurations of the same spec. Since parsing does not modify a ``CompiledParser``, the same may be used from
+    multiple threads concurrently.
+    """
+
+    #  CONSTRUCTOR  ####################################################################################################
+
+    def __init__(self, spec: config_spec.ConfigSpec):
+        """Creates a new ``CompiledParser`` for the provided spec.
+
+        Args:
+            spec (:class:`config_spec.ConfigSpec`): The spec that describes the configurations to parse.
+
+        Raises:
+            ValueError: If the ``spec`` contains configuration values of an unsupported type.
+        """
+
+        # sanitize args
+        insanity.sanitize_type("spec", spec, config_spec.ConfigSpec)
+
+        # store args
+        self._spec = spec
+
+        # create parsers for all config values, and index them by the names of the configs/args that they are used for
+        # -> the version of the registry is recorded first, such that concurrent registrations render the parser stale
+        self._registry_version = parser_registry.REGISTRY.version
+        self._parsers = tuple(self._create_parsers(spec))
+        self._parsers_by_name = {p.spec.name: p for p in self._parsers}
+        self._dispatch_index, self._fallback_parsers = self._create_dispatch_index(self._parsers)
+
+        # determine which configs have to be provided
+        self._required_names = frozenset(v.name for v in spec if v.required)
+
+        # the help text and the fingerprint are created when they are needed for the first time
+        self._fingerprint = None
+        self._formatted_options = None
+
+    #  PROPERTIES  #####################################################################################################
+
+    @property
+    def fingerprint(self) -> str:
+        """str: A hash of the names, types, and requiredness of all configuration values as well as the parsers used for
+        them, which identifies the results that the ``CompiledParser`` produces for any given input.
+        """
+
+        if self._fingerprint is None:
+
+            import hashlib
+
+            description = repr(
+                    [
+                            (
+                                    p.spec.name,
+                                    f"{p.spec.data_type.__module__}.{p.spec.data_type.__qualname__}",
+                                    p.spec.required,
+                                    f"{type(p).__module__}.{type(p).__qualname__}"
+                            )
+                            for p in self._parsers
+                    ]
+            )
+            self._fingerprint = hashlib.sha256(description.encode("utf-8")).hexdigest()
+
+        return self._fingerprint
+
+    @property
+    def formatted_options(self) -> str:
+        """str: The description of all options as it is printed in the help text."""
+
+        if self._formatted_options is None:
+            self._formatted_options = self._format_options()
+
+        return self._formatted_options
+
+    @property
+    def parsers(self) -> typing.Tuple[data_type_parser.DataTypeParser, ...]:
+        """tuple[:class:`data_type_parser.DataTypeParser`]: The parsers of all configuration values."""
+
+        return self._parsers
+
+    @property
+    def parsers_by_name(self) -> typing.Dict[str, data_type_parser.DataTypeParser]:
+        """dict[str, :class:`data_type_parser.DataTypeParser`]: Maps the names of all configuration values to their
+        parsers.
+        """
+
+        return dict(self._parsers_by_name)
+
+    @property
+    def registry_version(self) -> int:
+        """int: The version of :attr:`parser_registry.REGISTRY` that the parsers of the ``CompiledParser`` have been
+        chosen from.
+        """
+
+        return self._registry_version
+
+    @property
+    def required_names(self) -> typing.FrozenSet[str]:
+        """frozenset[str]: The names of all configuration values that have to be provided."""
+
+        return self._required_names
+
+    @property
+    def spec(self) -> config_spec.ConfigSpec:
+        """:class:`config_spec.ConfigSpec`: The spec of the configurations parsed by the ``CompiledParser``."""
+
+        return self._spec
+
+    #  METHODS  ########################################################################################################
+
+    def _check_required(self, parsed_args: typing.Dict[str, typing.Any], use_arg_names: bool) -> None:
+        """Ensures that all required configuration values have been provided.
+
+        Args:
+            parsed_args (dict): The parsed configuration.
+            use_arg_names (bool): Indicates whether missing values are reported by the names of their command-line args
+                rather than by the names of the configurations.
+
+        Raises:
+            ValueError: If any required value is missing.
+        """
+
+        for value_spec in self._spec:
+            if value_spec.name in self._required_names and value_spec.name not in parsed_args:
+
+                arg_name = (
+                        data_type_parser.DataTypeParser.translate_config_name(value_spec.name)
+                        if use_arg_names
+                        else value_spec.name
+                )
+                raise ValueError(f"Missing required arg {arg_name}")
+
+    @staticmethod
+    def _create_parsers(spec: config_spec.ConfigSpec) -> typing.List[data_type_parser.DataTypeParser]:
+        """Creates all parsers required to parse a configuration of the provided spec.
+
+        Parsers are chosen based on the data types of the configuration values by means of
+        :attr:`parser_registry.REGISTRY`.
+
+        Args:
+            spec (:class:`config_spec.ConfigSpec`): The spec that describes the configuration that needs to be parsed.
+
+        Returns:
+            list[:class:`data_type_parser.DataTypeParser`]: The created parsers.
+
+        Raises:
+            ValueError: If configuration values of an unsupported type are encountered in the ``spec``.
+        """
+
+        field_parsers = []
+        for value_spec in spec:  # -> iterate over config values in the spec
+
+            # create a parser for the currently considered config value
+            parser_cls = parser_registry.REGISTRY.lookup(value_spec.data_type)
+            if parser_cls is None:
+                raise ValueError(
+                        f"Unsupported type of property <{value_spec.name}> in the configuration class: "
+                        f"{value_spec.data_type}"
+                )
+            field_parsers.append(parser_cls(value_spec))
+
+        return field_parsers
+
+    @staticmethod
+    def _create_dispatch_index(
+            field_parsers: typing.Iterable[data_type_parser.DataTypeParser]
+    ) -> typing.Tuple[
+            typing.Dict[str, typing.Tuple[int, data_type_parser.DataTypeParser]],
+            typing.List[typing.Tuple[int, data_type_parser.DataTypeParser]]
+    ]:
+        """Creates an index that maps the names of command-line args directly to the parsers that are responsible for
+        them.
+
+        Parsers that override :meth:`data_type_parser.DataTypeParser.fires` (or its actual implementation
+        :meth:`data_type_parser.DataTypeParser._fires`) cannot be indexed by name, since their firing behavior is not
+        described by their ``arg_names``. Therefore, these are returned separately, and have to be queried one by one
+        for any arg that is not found in the index.
+
+        Both the index and the fallback parsers record the positions of the parsers in ``field_parsers``, which allows
+        for dispatching every arg to the first parser that fires for it, just like querying all parsers in order. In
+        particular, if the same arg name is claimed by more than one parser, then the index contains the first of them.
+
+        Args:
+            field_parsers (iterable[:class:`data_type_parser.DataTypeParser`]): The parsers to index.
+
+        Returns:
+            index (dict[str, tuple[int, :class:`data_type_parser.DataTypeParser`]]): Maps arg names to the positions of
+                the according parsers and the parsers themselves.
+            fallback (list[tuple[int, :class:`data_type_parser.DataTypeParser`]]): The positions of the parsers that
+                have to be queried via :meth:`data_type_parser.DataTypeParser.fires` and the parsers themselves.
+        """
+
+        index = {}
+        fallback = []
+        for position, fp in enumerate(field_parsers):
+
+            # parsers with a custom firing behavior cannot be indexed
+            if (
+                    type(fp).fires is not data_type_parser.DataTypeParser.fires or
+                    type(fp)._fires is not data_type_parser.DataTypeParser._fires
+            ):
+                fallback.append((position, fp))
+                continue
+
+            for arg_name in fp.arg_names:
+                index.setdefault(arg_name, (position, fp))
+
+        return index, fallback
+
+    def _format_options(self) -> str:
+        """Renders the description of all options for the help text."""
+
+        import textwrap
+
+        options = [p.synopsis for p in self._parsers]
+        options.append(("--help (or -h)", "Show this help."))
+        options.sort(key=lambda x: x[0])
+        option_width = max(len(opt[0]) for opt in options)  # -> the width of the left column
+        desc_width = argmagiq.TEXT_WIDTH - option_width - 2  # -> the width of the right column
+        formatted_options = []
+        for opt_syn, opt_desc in options:
+
+            opt_desc = textwrap.wrap(opt_desc, width=desc_width)
+            formatted_lines = [f"{opt_syn.ljust(option_width)}  {opt_desc[0]}"]
+            for desc_line in opt_desc[1:]:
+                formatted_lines.append(f"{' ' * option_width}  {desc_line}")
+            formatted_options.append("\n".join(formatted_lines))
+
+        return "\n".join(formatted_options)
+
+    def _parse_jsonl_lines(
+            self,
+            lines: typing.Iterable[typing.Union[bytes, str]],
+            source_name: str
+    ) -> typing.Iterator[typing.Union[typing.Dict[str, typing.Any], ValueError]]:
+        """Implements :meth:`parse_jsonl` for the provided (already opened) lines.
+
+        Args:
+            lines (iterable[bytes or str]): The lines to parse.
+            source_name (str): A name of the source of ``lines`` that is used in error messages.
+        """
+
+        backend = json_backend.get_backend()
+        for line_number, line in enumerate(lines, start=1):
+
+            # skip empty lines
+            if not line.strip():
+                continue
+
+            try:
+
+                try:
+                    json_data = backend.loads(line)
+                except json_backend.JsonDecodeError:
+                    raise ValueError("The line is not a valid JSON object")
+
+                result = self.parse_dict(json_data)
+
+            except (TypeError, ValueError) as e:
+                result = ValueError(f"Line {line_number} of '{source_name}': {e}")
+
+            yield result
+
+    def _read_args_from_command_line(
+            self,
+            argv: typing.Tuple[str, ...],
+            expand_response_files: bool = False
+    ) -> typing.Dict[str, typing.Any]:
+        """Parses a tuple of command-line args into dictionary of configuration values.
+
+        If ``expand_response_files`` is ``True``, then ``argv`` may contain an arg of the form ``@FILE_PATH`` wherever
+        an option is expected, which refers to a response file that contains further args (cf.
+        :meth:`_read_args_from_response_file`).
+
+        Args:
+            argv (tuple[str]): The command-line args to parse.
+            expand_response_files (bool, optional): Indicates whether response files are expanded. This must be enabled
+                for trusted args only, e.g., the ones of the current application, since it allows for reading any file.
+
+        Returns:
+            dict: The parsed configuration.
+
+        Raises:
+            ValueError: If an unknown arg is encountered, if parsing any arg fails for some reason, or if a response
+                file does not exist or includes itself.
+        """
+
+        # sanitize args
+        # -> this is done once for all args here, which is why parsers are invoked without any further checks below
+        insanity.sanitize_type("argv", argv, tuple)
+        insanity.sanitize_iterable("argv", argv, elements_type=str)
+
+        parsed_args = {}
+        self._read_args_into(argv, parsed_args, () if expand_response_files else None)
+
+        return parsed_args
+
+    def _read_args_from_dict(self, json_data: typing.Any) -> typing.Dict[str, typing.Any]:
+        """Parses a dictionary of configuration values, as read from a JSON file.
+
+        Args:
+            json_data: The data to parse.
+
+        Returns:
+            dict: The parsed configuration.
+
+        Raises:
+            ValueError: If ``json_data`` is not a ``dict``, if an unknown arg is encountered, or if parsing any arg
+                fails for some reason.
+        """
+
+        # ensure that the json data describes a dict of config values
+        if not isinstance(json_data, dict):
+            raise ValueError("The config file does not describe a dictionary of config values")
+
+        # parse all args
+        parsed_args = {}
+        for config_name, config_value in json_data.items():  # -> iterate over all config values in the file
+
+            # ensure that the encountered config exists
+            field_parser = self._parsers_by_name.get(config_name)
+            if field_parser is None:
+                raise ValueError(f"Unknown option: '{config_name}'")
+
+            # parse the value
+            parsed_args[config_name] = field_parser.parse_json(config_value)
+
+        return parsed_args
+
+    def _read_args_from_file(
+            self,
+            file_path: str,
+            result_cache: "argmagiq.result_cache.ResultCache" = None
+    ) -> typing.Dict[str, typing.Any]:
+        """Parses a JSON file into dictionary of configuration values.
+
+        Args:
+            file_path (str): The path of the JSON file to parse, which may be followed by a JSON pointer that specifies
+                the part of the file to parse, e.g., ``record.json#/config/model`` (cf.
+                :func:`json_pointer.split_path`). Compressed files (cf. :data:`archives.COMPRESSIONS`) are decompressed
+                transparently.
+            result_cache (:class:`argmagiq.result_cache.ResultCache`, optional): If provided, then the parsed
+                configuration is loaded from/stored in this cache.
+
+        Returns:
+            dict: The parsed configuration.
+
+        Raises:
+            ValueError: If the ``file_path`` does not exist or refers to file of another format than JSON, if the JSON
+                pointer is invalid or does not refer to any value in the file, if an unknown arg is encountered, or if
+                parsing any arg fails for some reason.
+        """
+
+        # check whether the file has been parsed before
+        key = None
+        if result_cache is not None:
+            key = result_cache.create_key(self, file_path)
+            parsed_args = result_cache.load(key)
+            if parsed_args is not None:
+                return parsed_args
+
+        # separate the JSON pointer that specifies which part of the file to read, if any
+        file_path, pointer = json_pointer.split_path(file_path)
+
+        # ensure that the config file exists
+        if not os.path.isfile(file_path):
+            raise ValueError(f"Config file not found: '{file_path}'")
+
+        # read the json file
+        # -> uncompressed files are memory-mapped for reading the part specified by a JSON pointer, while compressed
+        #    files have to be decompressed in memory in any case
+        try:
+            if pointer is None:
+                json_data = json_backend.get_backend().loads(archives.read_file(file_path))
+            elif archives.is_compressed(file_path):
+                json_data = json_pointer.loads(archives.read_file(file_path), pointer)
+            else:
+                json_data = json_pointer.load(file_path, pointer)
+        except json_backend.JsonDecodeError:
+            raise ValueError(f"The specified config file is not a valid JSON file: '{file_path}'")
+        except KeyError:
+            raise ValueError(f"The specified config file does not contain '{pointer}': '{file_path}'")
+
+        parsed_args = self._read_args_from_dict(json_data)
+        if key is not None:
+            result_cache.store(key, parsed_args)
+
+        return parsed_args
+
+    def _read_args_from_response_file(
+            self,
+            file_path: str,
+            parsed_args: typing.Dict[str, typing.Any],
+            included: typing.Tuple[str, ...]
+    ) -> None:
+        """Parses the args in a response file, i.e., a text file that contains command-line args separated by
+        whitespace, and adds them to the provided configuration.
+
+        Args in response files are split like in a POSIX shell (cf. :func:`shlex.split`). Since every response file is
+        parsed on its own, an option and its value(s) have to be specified in the same file. Response files may include
+        other response files, as long as they do not include themselves.
+
+        Args:
+            file_path (str): The path of the response file.
+            parsed_args (dict): The configuration to add parsed values to.
+            included (tuple[str]): The real paths of all response files that (transitively) include this one.
+        """
+
+        import shlex
+
+        # ensure that the file exists and is not included recursively
+        real_path = os.path.realpath(file_path)
+        if real_path in included:
+            raise ValueError(f"Response file includes itself: '{file_path}'")
+        if not os.path.isfile(file_path):
+            raise ValueError(f"Response file not found: '{file_path}'")
+
+        # split the content of the file into args
+        # -> all args are collected before parsing them, since parsers may look at any number of args after an option
+        with open(file_path, "r") as f:
+            lexer = shlex.shlex(f, posix=True)
+            lexer.commenters = ""
+            lexer.whitespace_split = True
+            argv = tuple(lexer)
+
+        self._read_args_into(argv, parsed_args, included + (real_path,))
+
+    def _read_args_into(
+            self,
+            argv: typing.Tuple[str, ...],
+            parsed_args: typing.Dict[str, typing.Any],
+            included: typing.Tuple[str, ...]
+    ) -> None:
+        """Implements :meth:`_read_args_from_command_line` for already sanitized args.
+
+        Args:
+            argv (tuple[str]): The command-line args to parse.
+            parsed_args (dict): The configuration to add parsed values to.
+            included (tuple[str]): The real paths of all response files that (transitively) include ``argv``, or
+                ``None``, if response files are not expanded.
+        """
+
+        index_of_arg = 0  # -> the position of the next arg to parse
+        while index_of_arg < len(argv):  # -> as long as there are args left
+
+            # look up the parser to use
+            # -> parsers with custom behavior that precede the indexed parser (if any) take precedence, since the arg is
+            #    dispatched to the first parser that fires for it
+            # -> if none fires, then the arg may refer to a response file, if these are expanded
+            position, fp = self._dispatch_index.get(argv[index_of_arg], (len(self._parsers), None))
+            for candidate_position, candidate in self._fallback_parsers:
+                if candidate_position > position:
+                    break
+                if candidate._trusted_fires(argv, index_of_arg):
+                    fp = candidate
+                    break
+            if fp is None:
+                if included is not None and len(argv[index_of_arg]) > 1 and argv[index_of_arg].startswith("@"):
+                    self._read_args_from_response_file(argv[index_of_arg][1:], parsed_args, included)
+                    index_of_arg += 1
+                    continue
+                raise ValueError(f"Unknown option: '{argv[index_of_arg]}'")
+
+            # parse the currently considered arg, and move on to the next one
+            value, num_consumed = fp._parse_at_impl(argv, index_of_arg)
+            if num_consumed < 1:
+                raise ValueError(f"The parser of option '{argv[index_of_arg]}' did not consume any args")
+            parsed_args[fp.spec.name] = value
+            index_of_arg += num_consumed
+
+    def format_help(self, app_name: str, app_description: str) -> str:
+        """Renders the help text of an application that parses configurations by means of the ``CompiledParser``.
+
+        Args:
+            app_name (str): The name of the application that is printed in the synopsis.
+            app_description (str): The description of the application that is printed in the synopsis.
+
+        Returns:
+            str: The help text.
+        """
+
+        import re
+        import textwrap
+
+        # prepare the app description
+        desc_pars = re.split("\\n\\n+", str(app_description))
+        desc_pars = "\n\n".join("\n".join(textwrap.wrap(p.strip(), width=argmagiq.TEXT_WIDTH)) for p in desc_pars)
+
+        return (
+                f"\n"
+                f"{desc_pars}\n"
+                f"\n"
+                f"Usage: {app_name} [OPTION]...\n"
+                f"  or   {app_name} -- FILE_PATH\n"
+                f"\n"
+                f"Options:\n"
+                f"{self.formatted_options}\n"
+        )
+
+    def parse(self, argv: typing.Sequence[str], expand_response_files: bool = False) -> typing.Dict[str, typing.Any]:
+        """Parses a sequence of command-line args.
+
+        Args:
+            argv (sequence[str]): The args to parse, without the name of the application.
+            expand_response_files (bool, optional): Indicates whether args of the form ``@FILE_PATH`` are expanded to
+                the args in the referenced response files (cf. :meth:`_read_args_from_response_file`). This allows for
+                reading any file, and should thus be enabled for the args of the current application only.
+
+        Returns:
+            dict: The parsed configuration, which maps the names of all provided configuration values to the same.
+
+        Raises:
+            ValueError: If an unknown arg is encountered, if parsing any arg fails for some reason, or if any required
+                arg is missing.
+        """
+
+        parsed_args = self._read_args_from_command_line(tuple(argv), expand_response_files=expand_response_files)
+        self._check_required(parsed_args, use_arg_names=True)
+
+        return parsed_args
+
+    def parse_archive(
+            self,
+            archive_path: str
+    ) -> typing.Iterator[typing.Union[typing.Dict[str, typing.Any], ValueError]]:
+        """Parses all JSON configuration files in a tar or zip archive lazily, without extracting the archive.
+
+        Members of the archive are read one at a time, in the order that they are stored in, and are considered as
+        configuration files, if their names end in ``.json``, possibly followed by the extension of a compressed file
+        (cf. :func:`archives.iter_archive`).
+
+        Args:
+            archive_path (str): The path of the archive to parse.
+
+        Yields:
+            For each configuration file in the archive, either the parsed configuration or, if parsing failed, a
+            ``ValueError`` that describes the problem, including the name of the file.
+
+        Raises:
+            ValueError: If the ``archive_path`` does not exist or does not refer to a tar or zip archive, or if the
+                archive is corrupt. In the latter case, the error is raised as soon as the corrupt part is reached.
+        """
+
+        # ensure that the archive exists
+        if not os.path.isfile(archive_path):
+            raise ValueError(f"Archive not found: '{archive_path}'")
+
+        backend = json_backend.get_backend()
+        for member_name, data in archives.iter_archive(archive_path):
+
+            try:
+
+                try:
+                    json_data = backend.loads(archives.decompress(member_name, data))
+                except json_backend.JsonDecodeError:
+                    raise ValueError("The file is not a valid JSON file")
+
+                result = self.parse_dict(json_data)
+
+            except (TypeError, ValueError) as e:
+                result = ValueError(f"File '{member_name}' in '{archive_path}': {e}")
+
+            yield result
+
+    def parse_dict(self, mapping: typing.Mapping[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+        """Parses a mapping from names of configuration values to the same, e.g., as loaded from a JSON file.
+
+        Args:
+            mapping (mapping[str, any]): The mapping to parse.
+
+        Returns:
+            dict: The parsed configuration, which maps the names of all provided configuration values to the same.
+
+        Raises:
+            ValueError: If ``mapping`` is not a mapping, if an unknown arg is encountered, if parsing any arg fails for
+                some reason, or if any required arg is missing.
+        """
+
+        if not isinstance(mapping, collections.abc.Mapping):
+            raise ValueError("The provided data does not describe a dictionary of config values")
+
+        parsed_args = self._read_args_from_dict(dict(mapping))
+        self._check_required(parsed_args, use_arg_names=False)
+
+        return parsed_args
+
+    def parse_jsonl(self, file_path: str) -> typing.Iterator[typing.Union[typing.Dict[str, typing.Any], ValueError]]:
+        """Parses a JSON-Lines file, i.e., a file that contains one configuration, as a JSON object, per line, lazily.
+
+        The file is read one line at a time, which is why it may be arbitrarily large. Empty lines are skipped.
+        Compressed files (cf. :data:`archives.COMPRESSIONS`) are decompressed on the fly.
+
+        Args:
+            file_path (str): The path of the file to parse, or ``"-"`` for reading from ``stdin``.
+
+        Yields:
+            For each non-empty line, in the same order, either the parsed configuration or, if parsing failed, a
+            ``ValueError`` that describes the problem, including the number of the line.
+
+        Raises:
+            ValueError: If the ``file_path`` does not exist.
+        """
+
+        if file_path == "-":
+            stdin = getattr(sys.stdin, "buffer", sys.stdin)  # -> read bytes, unless stdin has been replaced
+            yield from self._parse_jsonl_lines(stdin, "<stdin>")
+        else:
+
+            # ensure that the config file exists
+            if not os.path.isfile(file_path):
+                raise ValueError(f"Config file not found: '{file_path}'")
+
+            with archives.open_file(file_path) as f:
+                yield from self._parse_jsonl_lines(f, file_path)
+
+    def parse_layered(
+            self,
+            file_paths: typing.Sequence[str],
+            argv: typing.Sequence[str],
+            result_cache: "argmagiq.result_cache.ResultCache" = None,
+            expand_response_files: bool = False
+    ) -> typing.Tuple[typing.Dict[str, typing.Any], typing.Dict[str, str]]:
+        """Parses a configuration that is composed of any number of JSON configuration files and command-line args.
+
+        The provided sources are merged from left to right, i.e., values in later files override the same values in
+        earlier ones, and command-line args override all of them. Every source is parsed exactly once, and only the
+        values that it specifies are applied on top of the preceding ones.
+
+        Args:
+            file_paths (sequence[str]): The paths of the JSON files to parse (cf. :meth:`parse_file`).
+            argv (sequence[str]): The command-line args to parse (cf. :meth:`parse`).
+            result_cache (:class:`argmagiq.result_cache.ResultCache`, optional): If provided, then the parsed files are
+                loaded from/stored in this cache.
+            expand_response_files (bool, optional): Indicates whether response files in ``argv`` are expanded (cf.
+                :meth:`parse`).
+
+        Returns:
+            tuple: The parsed configuration, which maps the names of all provided configuration values to the same, and
+            the provenance of all configuration values, which maps their names to the paths of the files that they have
+            been taken from, :data:`COMMAND_LINE_SOURCE`, or :data:`DEFAULT_SOURCE`.
+
+        Raises:
+            ValueError: If any of the sources is invalid (cf. :meth:`parse` and :meth:`parse_file`), or if any required
+                arg is missing from all of them.
+        """
+
+        parsed_args = {}
+        sources = {}
+
+        # merge all sources from left to right
+        for file_path in file_paths:
+            file_args = self._read_args_from_file(file_path, result_cache=result_cache)
+            parsed_args.update(file_args)
+            sources.update(dict.fromkeys(file_args, file_path))
+        if argv:
+            command_line_args = self._read_args_from_command_line(
+                    tuple(argv),
+                    expand_response_files=expand_response_files
+            )
+            parsed_args.update(command_line_args)
+            sources.update(dict.fromkeys(command_line_args, COMMAND_LINE_SOURCE))
+
+        self._check_required(parsed_args, use_arg_names=not file_paths)
+
+        return parsed_args, {p.spec.name: sources.get(p.spec.name, DEFAULT_SOURCE) for p in self._parsers}
+
+    def parse_file(
+            self,
+            file_path: str,
+            result_cache: "argmagiq.result_cache.ResultCache" = None
+    ) -> typing.Dict[str, typing.Any]:
+        """Parses a JSON configuration file.
+
+        Args:
+            file_path (str): The path of the file to parse, which may be followed by a JSON pointer that specifies the
+                part of the file to parse, e.g., ``record.json#/config/model``.
+            result_cache (:class:`argmagiq.result_cache.ResultCache`, optional): If provided, then the parsed
+                configuration is loaded from/stored in this cache.
+
+        Returns:
+            dict: The parsed configuration, which maps the names of all provided configuration values to the same.
+
+        Raises:
+            ValueError: If the ``file_path`` does not exist or refers to file of another format than JSON, if an unknown
+                arg is encountered, if parsing any arg fails for some reason, or if any required arg is missing.
+        """
+
+        parsed_args = self._read_args_from_file(file_path, result_cache=result_cache)
+        self._check_required(parsed_args, use_arg_names=False)
+
+        return parsed_args
+
+    def refresh_registry_version(self) -> bool:
+        """Checks whether the parsers of the ``CompiledParser`` are still the ones that are registered in
+        :attr:`parser_registry.REGISTRY`, and if so, advances :attr:`registry_version` to the current version.
+
+        This allows for reusing a ``CompiledParser`` after unrelated parsers have been registered, e.g., when it is
+        loaded from a :class:`argmagiq.disk_cache.DiskCache`. Since the parsers themselves are not modified, this is
+        safe even if the ``CompiledParser`` is used by other threads concurrently.
+
+        Returns:
+            bool: ``True``, if the parsers are up to date, and ``False`` otherwise, in which case the ``CompiledParser``
+            should be recreated.
+        """
+
+        # the version of the registry is recorded first, such that concurrent registrations render the parser stale
+        registry_version = parser_registry.REGISTRY.version
+        if registry_version == self._registry_version:
+            return True
+        if any(parser_registry.REGISTRY.lookup(p.spec.data_type) is not type(p) for p in self._parsers):
+            return False
+
+        self._registry_version = registry_version
+
+        return True
@@ -31,8 +31,6 @@
 # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
 
-import inspect
-import re
 import typing
 
 import insanity
@@ -62,8 +60,9 @@ class ConfigSpec(object):
     def __init__(self):
         """Creates a new empty ``ConfigSpec``."""
 
-        # create the (empty) list of config values
+        # create the (empty) list of config values, and an index that maps their names to the same
         self._config_values = []
+        self._config_values_by_name = {}
 
     #  MAGIC FUNCTIONS  ################################################################################################
 
@@ -90,10 +89,17 @@ class ConfigSpec(object):
 
         Args:
             spec (:class:`value_spec.ValueSpec`): The specification of the configuration value to add.
+
+        Raises:
+            ValueError: If the ``ConfigSpec`` contains a configuration value of the same name already.
         """
 
         insanity.sanitize_type("spec", spec, value_spec.ValueSpec)
+        if spec.name in self._config_values_by_name:
+            raise ValueError(f"The spec contains a configuration value named <{spec.name}> already")
+
         self._config_values.append(spec)
+        self._config_values_by_name[spec.name] = spec
 
     def get_value_by_name(self, name: str) -> typing.Optional[value_spec.ValueSpec]:
         """Retrieves the specification of the configuration value with the provided name, if it exists.
@@ -106,11 +112,7 @@ class ConfigSpec(object):
                 ``name``.
         """
 
-        for spec in self._config_values:
-            if spec.name == name:
-                return spec
-
-        return None
+        return self._config_values_by_name.get(name)
 
     @classmethod
     def create_from(cls, config_cls: type):
@@ -126,6 +128,10 @@ class ConfigSpec(object):
             config_cls (type): The class that the configuration is based on.
         """
 
+        # -> these are imported here, since they are not needed for specs that have been created ahead of time
+        import inspect
+        import re
+
         spec = ConfigSpec()
 
         # load all default values
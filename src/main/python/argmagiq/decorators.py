@@ -41,10 +41,43 @@ __email__ = "patrick.hohenecker@gmx.at"
 __status__ = "Development"
 
 
+COMPILED_PARSER_KEY = "argmagiq.compiled_parser"
+"""str: The key that is used for storing the :class:`argmagiq.compiled_parser.CompiledParser` of a configuration class.
+"""
+
 OPTIONAL_KEY = "argmagiq.optional"
 """str: The key that is used for storing that an arg is optional."""
 
 
+def config(cls: type) -> type:
+    """This decorator prepares a configuration class for parsing when the class is defined.
+
+    To that end, the :class:`argmagiq.config_spec.ConfigSpec` of the annotated class is created and compiled into a
+    :class:`argmagiq.compiled_parser.CompiledParser`, which is attached to the class. This way, parsing args does not
+    require any inspection of the class, and errors in its definition are raised when the class is defined rather than
+    when args are parsed. Notice that the compiled parser is not inherited by subclasses. Furthermore, it is recreated
+    when args are parsed, if the parsers registered in :attr:`argmagiq.parsers.parser_registry.REGISTRY` have changed
+    since the class has been defined.
+    """
+
+    # -> these are imported here, since importing the decorators must not import the rest of the package
+    import inspect
+
+    import argmagiq.compiled_parser as compiled_parser
+    import argmagiq.config_spec as config_spec
+
+    # make sure that the annotated object is a class with a no-arg constructor
+    if not inspect.isclass(cls):
+        raise TypeError("The decorator @config can be applied to classes only!")
+    if len(inspect.signature(cls.__init__).parameters) != 1:  # -> 1 for self
+        raise ValueError("The decorator @config can be applied to classes with a no-arg constructor only!")
+
+    # create and attach the parser of the annotated class
+    setattr(cls, COMPILED_PARSER_KEY, compiled_parser.CompiledParser(config_spec.ConfigSpec.create_from(cls)))
+
+    return cls
+
+
 def optional(func: property) -> property:
     """This decorator marks a property of a configuration class as optional.
 
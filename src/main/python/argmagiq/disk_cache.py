@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import os
+import sys
+import typing
+
+import insanity
+
+import argmagiq
+import argmagiq.compiled_parser as compiled_parser
+import argmagiq.config_spec as config_spec
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+CACHE_DIR_ENV_VAR = "ARGMAGIQ_CACHE_DIR"
+"""str: The environment variable that may be used for overriding the default cache directory."""
+
+CACHE_FORMAT = 2
+"""int: The version of the format of cache entries, which has to be increased whenever the layout of any of the cached
+classes changes.
+"""
+
+_package_state = None
+"""tuple: The modification times and sizes of all source files of ``argmagiq``, which are determined once per process
+(cf. :func:`_get_package_state`).
+"""
+
+
+def _get_package_state() -> tuple:
+    """Determines the modification times and sizes of all source files of ``argmagiq``.
+
+    These are part of the keys of all cache entries, since cached objects are instances of classes defined by
+    ``argmagiq``, which may change without changing the version of the package (e.g., in an editable install).
+    """
+
+    global _package_state
+
+    if _package_state is None:
+        package_dir = os.path.dirname(os.path.abspath(argmagiq.__file__))
+        state = []
+        for dir_path, dir_names, file_names in os.walk(package_dir):
+            dir_names.sort()
+            for file_name in sorted(file_names):
+                if file_name.endswith(".py"):
+                    file_path = os.path.join(dir_path, file_name)
+                    stat = os.stat(file_path)
+                    state.append((os.path.relpath(file_path, package_dir), stat.st_mtime_ns, stat.st_size))
+        _package_state = tuple(state)
+
+    return _package_state
+
+
+def create_private_directory(directory: str) -> None:
+    """Creates a directory that is accessible by the current user only, unless it exists already.
+
+    Args:
+        directory (str): The path of the directory to create.
+
+    Raises:
+        OSError: If the directory cannot be created.
+    """
+
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+
+
+def default_cache_dir() -> str:
+    """Determines the directory that is used for caching, if no other one is specified explicitly.
+
+    This is the directory specified by the environment variable :attr:`CACHE_DIR_ENV_VAR`, if set, and the directory
+    ``argmagiq`` in the user's cache directory otherwise.
+
+    Returns:
+        str: The path of the cache directory.
+    """
+
+    cache_dir = os.environ.get(CACHE_DIR_ENV_VAR)
+    if cache_dir:
+        return cache_dir
+
+    if sys.platform == "win32":
+        base_dir = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    elif sys.platform == "darwin":
+        base_dir = os.path.expanduser("~/Library/Caches")
+    else:
+        base_dir = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+
+    return os.path.join(base_dir, "argmagiq")
+
+
+def open_trusted_file(file_path: str) -> typing.BinaryIO:
+    """Opens a cache file for reading, if it is owned by the current user and cannot be modified by anyone else.
+
+    Cache entries are unpickled, which may execute arbitrary code. Therefore, files that somebody else could have
+    created or modified, e.g., in a shared cache directory, must never be loaded.
+
+    Args:
+        file_path (str): The path of the file to open.
+
+    Returns:
+        file: The opened file.
+
+    Raises:
+        OSError: If the file cannot be opened, or if it is not trusted.
+    """
+
+    f = open(file_path, "rb")
+    try:
+        stat = os.fstat(f.fileno())  # -> the opened file is checked, which may not be replaced anymore
+        if hasattr(os, "getuid") and (stat.st_uid != os.getuid() or stat.st_mode & 0o022):
+            raise PermissionError(f"Untrusted cache file: '{file_path}'")
+    except BaseException:
+        f.close()
+        raise
+
+    return f
+
+
+def write_pickle(file_path: str, obj: typing.Any) -> None:
+    """Pickles an object into a cache file, and creates the directory that contains it as a private directory, if
+    necessary (cf. :func:`create_private_directory`).
+
+    The object is written to a temporary file first, which is moved into place afterwards. This ensures that
+    concurrently running processes never see a partially written file.
+
+    Args:
+        file_path (str): The path of the file to write.
+        obj: The object to pickle.
+
+    Raises:
+        Exception: If the object cannot be pickled or written, in which case the temporary file is removed.
+    """
+
+    import pickle
+    import tempfile
+
+    directory = os.path.dirname(file_path)
+    create_private_directory(directory)
+
+    temp_path = None
+    try:
+        with tempfile.NamedTemporaryFile("wb", dir=directory, delete=False) as f:
+            temp_path = f.name
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if temp_path is not None and os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+class DiskCache(object):
+    """A cache that persists the :class:`compiled_parser.CompiledParser`\\ s of configuration classes on disk, such that
+    they can be reused by subsequent invocations of an application.
+
+    Every cache entry is validated against the modification time and size of the source files of the configuration class
+    and all of its superclasses as well as of ``argmagiq`` itself, the versions of ``argmagiq``, its cache format, and
+    Python, the current default values of the class, and the parsers that are currently registered for the data types of
+    its configuration values. If any of these has changed, the entry is discarded and recreated. Classes that are not
+    defined at the module level of a source file (e.g., classes defined inside of functions) are never cached.
+
+    The cache directory is created such that it is accessible by the current user only, and entries that are owned by
+    another user or writable by others are ignored (cf. :func:`open_trusted_file`).
+
+    Since a ``DiskCache`` is typically used for reducing the startup time of an application, modules that are needed for
+    storing cache entries only are imported when they are needed for the first time.
+    """
+
+    #  CONSTRUCTOR  ####################################################################################################
+
+    def __init__(self, directory: str = None):
+        """Creates a new ``DiskCache``.
+
+        Args:
+            directory (str, optional): The directory to store cache entries in. This defaults to
+                :func:`default_cache_dir`.
+        """
+
+        self._directory = default_cache_dir() if directory is None else str(directory)
+
+    #  PROPERTIES  #####################################################################################################
+
+    @property
+    def directory(self) -> str:
+        """str: The directory that cache entries are stored in."""
+
+        return self._directory
+
+    #  METHODS  ########################################################################################################
+
+    @staticmethod
+    def _create_key(config_cls: type) -> typing.Optional[tuple]:
+        """Creates the key that a cache entry for the provided class has to match in order to be valid.
+
+        Returns:
+            tuple: The key, or ``None``, if the class cannot be cached.
+        """
+
+        # classes defined inside of functions may differ between invocations of the same
+        if "<locals>" in config_cls.__qualname__:
+            return None
+
+        # gather the states of the source files of the class and all of its superclasses
+        source_states = []
+        for cls in config_cls.__mro__[:-1]:  # -> the last class is object
+
+            module = sys.modules.get(cls.__module__)
+            file_path = getattr(module, "__file__", None)
+            if file_path is None:  # -> the class is not defined in a source file
+                return None
+
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                return None
+            source_states.append((os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size))
+
+        return (
+                CACHE_FORMAT,
+                argmagiq.__version__,
+                _get_package_state(),
+                sys.implementation.cache_tag,
+                config_cls.__module__,
+                config_cls.__qualname__,
+                tuple(source_states)
+        )
+
+    @staticmethod
+    def _get_defaults(config_cls: type) -> tuple:
+        """Retrieves the default values that are currently specified by the provided class."""
+
+        return tuple(
+                (name, getattr(config_cls, name))
+                for name in dir(config_cls)
+                if name.startswith(argmagiq.DEFAULT_PREFIX)
+        )
+
+    def _get_entry_path(self, config_cls: type) -> str:
+        """Determines the path of the file that stores the cache entry of the provided class."""
+
+        import hashlib
+
+        name = hashlib.sha256(f"{config_cls.__module__}:{config_cls.__qualname__}".encode("utf-8")).hexdigest()
+        return os.path.join(self._directory, name + ".pickle")
+
+    def get_compiled(self, config_cls: type) -> compiled_parser.CompiledParser:
+        """Retrieves the parser of the provided configuration class from the cache, or creates it and adds it to the
+        cache, if there is no valid cache entry.
+
+        Args:
+            config_cls (type): The configuration class to retrieve the parser for.
+
+        Returns:
+            :class:`compiled_parser.CompiledParser`: The parser.
+        """
+
+        compiled = self.load(config_cls)
+        if compiled is None:
+            compiled = compiled_parser.CompiledParser(config_spec.ConfigSpec.create_from(config_cls))
+            self.store(config_cls, compiled)
+
+        return compiled
+
+    def load(self, config_cls: type) -> typing.Optional[compiled_parser.CompiledParser]:
+        """Loads the parser of the provided configuration class from the cache.
+
+        Args:
+            config_cls (type): The configuration class to load the parser for.
+
+        Returns:
+            :class:`compiled_parser.CompiledParser`: The cached parser, or ``None``, if there is no valid cache entry.
+        """
+
+        insanity.sanitize_type("config_cls", config_cls, type)
+
+        # determine the key that the cache entry has to match
+        key = self._create_key(config_cls)
+        if key is None:
+            return None
+
+        import pickle
+
+        # load the cache entry -> any cache entry that cannot be loaded or is not trusted is treated as missing
+        try:
+            with open_trusted_file(self._get_entry_path(config_cls)) as f:
+                entry_key, defaults, compiled = pickle.load(f)
+        except Exception:
+            return None
+
+        # ensure that the entry is still valid
+        if entry_key != key or defaults != self._get_defaults(config_cls):
+            return None
+        if not compiled.refresh_registry_version():
+            return None  # -> the registered parsers have changed
+
+        return compiled
+
+    def store(self, config_cls: type, compiled: compiled_parser.CompiledParser) -> bool:
+        """Stores the parser of the provided configuration class in the cache.
+
+        Errors that occur while writing the cache entry, e.g., because the cache directory is not writable, are ignored.
+
+        Args:
+            config_cls (type): The configuration class that the parser belongs to.
+            compiled (:class:`compiled_parser.CompiledParser`): The parser to store.
+
+        Returns:
+            bool: Indicates whether the parser has been stored.
+        """
+
+        insanity.sanitize_type("config_cls", config_cls, type)
+        insanity.sanitize_type("compiled", compiled, compiled_parser.CompiledParser)
+
+        # determine the key that the cache entry is stored with
+        key = self._create_key(config_cls)
+        if key is None:
+            return False
+
+        # render the help text, such that it is cached as well
+        compiled.formatted_options
+
+        # write the cache entry
+        # -> besides IO errors, pickling fails for parsers or default values that cannot be pickled
+        try:
+            write_pickle(self._get_entry_path(config_cls), (key, self._get_defaults(config_cls), compiled))
+        except Exception:
+            return False
+
+        return True
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+"""Decoding of JSON data by means of the fastest JSON library that is available.
+
+``argmagiq`` does not depend on any third-party JSON library. However, if one of the libraries in :data:`BACKENDS` is
+installed, then it is used for decoding configuration files instead of the standard library's ``json`` module. The
+chosen backend may be overridden by means of the environment variable :data:`BACKEND_ENV_VAR`.
+
+Some of the fast backends differ from the standard library, e.g., ``orjson`` rejects ``NaN`` and ``Infinity``, and
+decodes integers that do not fit into 64 bits as floats. Data that is rejected by such a backend is decoded by means of
+the ``json`` module instead, and so is data that contains integer literals with :data:`LONG_INTEGER_DIGITS` or more
+digits, which means that all backends accept the same documents and produce the same results.
+"""
+
+
+import importlib
+import os
+import threading
+import typing
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+BACKEND_ENV_VAR = "ARGMAGIQ_JSON_BACKEND"
+"""str: The environment variable that may be used for choosing the JSON backend explicitly."""
+
+BACKENDS = ("orjson", "simdjson", "ujson", "json")
+"""tuple[str]: The names of all supported JSON backends, in the order of preference."""
+
+LONG_INTEGER_DIGITS = 19
+"""int: The smallest number of digits of integer literals that are decoded by means of the standard library's ``json``
+module, which is the smallest number of digits of integers that do not fit into 64 bits.
+"""
+
+_default_backend = None
+"""JsonBackend: The backend that is used, if none is specified explicitly, or ``None``, if it was not chosen yet."""
+
+_default_backend_lock = threading.Lock()
+"""threading.Lock: Ensures that the default backend is chosen only once, even if it is requested concurrently."""
+
+
+class JsonDecodeError(ValueError):
+    """Indicates that the data provided to :meth:`JsonBackend.loads` is not valid JSON, independently of the backend."""
+
+
+class JsonBackend(object):
+    """A uniform wrapper around the ``loads`` function of a JSON library."""
+
+    #  CONSTRUCTOR  ####################################################################################################
+
+    def __init__(self, name: str):
+        """Creates a new ``JsonBackend``.
+
+        Args:
+            name (str): The name of the JSON library to use, which has to be one of :data:`BACKENDS`.
+
+        Raises:
+            ValueError: If the library ``name`` is not supported or not installed.
+        """
+
+        if name not in BACKENDS:
+            raise ValueError(f"Unsupported JSON backend: '{name}'")
+
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            raise ValueError(f"JSON backend not installed: '{name}'")
+
+        self._loads = module.loads
+        self._name = name
+
+        # create patterns that match long integer literals, which are decoded by means of the standard library
+        # -> these match digits in strings as well, which is fine, since the standard library decodes those correctly
+        self._long_integer_patterns = None
+        if name != "json":
+            import re
+            pattern = rf"(?<![0-9.eE+])[0-9]{{{LONG_INTEGER_DIGITS},}}(?![0-9.eE])"
+            self._long_integer_patterns = re.compile(pattern.encode("ascii")), re.compile(pattern)
+
+    #  MAGIC FUNCTIONS  ################################################################################################
+
+    def __repr__(self) -> str:
+
+        return f"JsonBackend({self._name!r})"
+
+    #  PROPERTIES  #####################################################################################################
+
+    @property
+    def name(self) -> str:
+        """str: The name of the used JSON library."""
+
+        return self._name
+
+    #  METHODS  ########################################################################################################
+
+    def loads(self, data: typing.Union[bytes, str]) -> typing.Any:
+        """Decodes the provided JSON data.
+
+        Args:
+            data (bytes or str): The data to decode. This should be UTF-8 encoded ``bytes``, if possible, since some
+                backends have to encode ``str``\\ s before decoding them.
+
+        Returns:
+            The decoded data.
+
+        Raises:
+            JsonDecodeError: If ``data`` is not valid JSON.
+        """
+
+        # data that contains long integer literals is decoded by means of the standard library right away, since some
+        # backends decode integers that do not fit into 64 bits as floats rather than rejecting them
+        error = None
+        patterns = self._long_integer_patterns
+        if patterns is None or patterns[isinstance(data, str)].search(data) is None:
+            try:
+                return self._loads(data)
+            except ValueError as e:  # -> the decoding errors of all backends are subclasses of ValueError
+                error = e
+
+        # fall back to the standard library, which is more lenient than some of the other backends
+        if self._name != "json":
+            import json
+            try:
+                return json.loads(data)
+            except ValueError as e:
+                error = error or e
+
+        raise JsonDecodeError(str(error)) from error
+
+
+def available_backends() -> typing.List[str]:
+    """Determines which of the supported JSON backends are installed.
+
+    Returns:
+        list[str]: The names of all installed backends, in the order of preference.
+    """
+
+    available = []
+    for name in BACKENDS:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            continue
+        available.append(name)
+
+    return available
+
+
+def get_backend(name: str = None) -> JsonBackend:
+    """Retrieves a JSON backend.
+
+    If no ``name`` is provided, then this is the backend specified by the environment variable :data:`BACKEND_ENV_VAR`,
+    if set, and the first installed backend in :data:`BACKENDS` otherwise. This default backend is chosen once, when it
+    is requested for the first time, and this is thread-safe.
+
+    Args:
+        name (str, optional): The name of the backend to retrieve.
+
+    Returns:
+        :class:`JsonBackend`: The requested backend.
+
+    Raises:
+        ValueError: If the requested backend is not supported or not installed.
+    """
+
+    global _default_backend
+
+    if name is not None:
+        return JsonBackend(name)
+
+    backend = _default_backend
+    if backend is None:
+        with _default_backend_lock:
+
+            # check again, since the backend may have been chosen while waiting for the lock
+            backend = _default_backend
+            if backend is None:
+
+                name = os.environ.get(BACKEND_ENV_VAR)
+                if name:
+                    backend = JsonBackend(name)
+                else:
+                    for name in BACKENDS:
+                        try:
+                            backend = JsonBackend(name)
+                            break
+                        except ValueError:  # -> the backend is not installed
+                            continue
+
+                _default_backend = backend
+
+    return backend
@@ -0,0 +1,411 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+"""Selective loading of parts of JSON files that are addressed by means of JSON pointers (cf. RFC 6901).
+
+Configurations are often embedded in much larger JSON files, e.g., records of experiments that contain metrics and logs
+as well. In order to read such a configuration, :func:`load` scans the file for the addressed value without decoding
+anything else, and decodes only the value itself. To that end, the file is memory-mapped, and all values that are not on
+the path to the addressed one are skipped by means of regular expressions.
+"""
+
+
+import mmap
+import os
+import typing
+
+import argmagiq.json_backend as json_backend
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+POINTER_SEPARATOR = "#"
+"""str: The character that separates the path of a file from a JSON pointer, e.g., ``record.json#/config/model``."""
+
+_CHUNK_SIZE = 1 << 20
+"""int: The number of bytes that are processed at once by :meth:`_Scanner._skip_container`."""
+
+_patterns = None
+"""tuple: The compiled regular expressions used by :class:`_Scanner`, or ``None``, if they were not compiled yet."""
+
+
+def split_path(path: str) -> typing.Tuple[str, typing.Optional[str]]:
+    """Splits a path of the form ``FILE_PATH#POINTER`` into the path of the file and the JSON pointer.
+
+    If ``path`` refers to an existing file or does not contain :data:`POINTER_SEPARATOR`, then it is not split at all.
+    Otherwise, it is split at the last occurrence of the same.
+
+    Args:
+        path (str): The path to split.
+
+    Returns:
+        tuple: The path of the file and the JSON pointer, which is ``None``, if ``path`` does not specify any.
+    """
+
+    if POINTER_SEPARATOR not in path or os.path.isfile(path):
+        return path, None
+
+    file_path, pointer = path.rsplit(POINTER_SEPARATOR, 1)
+
+    return file_path, pointer
+
+
+def parse_pointer(pointer: str) -> typing.List[str]:
+    """Splits a JSON pointer into the (unescaped) reference tokens that it is composed of.
+
+    Args:
+        pointer (str): The JSON pointer to parse, e.g., ``"/config/model"``.
+
+    Returns:
+        list[str]: The reference tokens, e.g., ``["config", "model"]``.
+
+    Raises:
+        ValueError: If ``pointer`` is neither empty nor starts with ``"/"``.
+    """
+
+    if not pointer:
+        return []
+    if not pointer.startswith("/"):
+        raise ValueError(f"Invalid JSON pointer: '{pointer}'")
+
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")]
+
+
+def load(file_path: str, pointer: str, backend: json_backend.JsonBackend = None) -> typing.Any:
+    """Loads the value that the provided JSON pointer refers to from a JSON file.
+
+    Only the addressed value is decoded, and the file is not read into memory as a whole.
+
+    Args:
+        file_path (str): The path of the JSON file.
+        pointer (str): The JSON pointer that specifies the value to load.
+        backend (:class:`json_backend.JsonBackend`, optional): The backend to decode the value with. This defaults to
+            :func:`json_backend.get_backend`.
+
+    Returns:
+        The decoded value.
+
+    Raises:
+        KeyError: If the file does not contain the value that ``pointer`` refers to.
+        json_backend.JsonDecodeError: If the file is not valid JSON (as far as it is scanned).
+        ValueError: If ``pointer`` is invalid.
+    """
+
+    with open(file_path, "rb") as f:
+
+        # empty files cannot be memory-mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return loads(b"", pointer, backend=backend)
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return loads(data, pointer, backend=backend)
+
+
+def loads(data: typing.Union[bytes, mmap.mmap], pointer: str, backend: json_backend.JsonBackend = None) -> typing.Any:
+    """Loads the value that the provided JSON pointer refers to from JSON data, e.g., a decompressed file.
+
+    Just like :func:`load`, this decodes the addressed value only.
+
+    Args:
+        data (bytes or mmap.mmap): The JSON data.
+        pointer (str): The JSON pointer that specifies the value to load.
+        backend (:class:`json_backend.JsonBackend`, optional): The backend to decode the value with. This defaults to
+            :func:`json_backend.get_backend`.
+
+    Returns:
+        The decoded value.
+
+    Raises:
+        KeyError: If ``data`` does not contain the value that ``pointer`` refers to.
+        json_backend.JsonDecodeError: If ``data`` is not valid JSON (as far as it is scanned).
+        ValueError: If ``pointer`` is invalid.
+    """
+
+    if backend is None:
+        backend = json_backend.get_backend()
+    if len(data) == 0:
+        parse_pointer(pointer)  # -> ensure that the pointer is valid
+        return backend.loads(b"")
+
+    start, end = locate(data, pointer, backend=backend)
+
+    return backend.loads(data[start:end])
+
+
+def locate(
+        data: typing.Union[bytes, mmap.mmap],
+        pointer: str,
+        backend: json_backend.JsonBackend = None
+) -> typing.Tuple[int, int]:
+    """Finds the value that the provided JSON pointer refers to in JSON data, without decoding it.
+
+    Args:
+        data (bytes or mmap.mmap): The JSON data.
+        pointer (str): The JSON pointer that specifies the value to find.
+        backend (:class:`json_backend.JsonBackend`, optional): The backend to decode keys that contain escape sequences
+            with. This defaults to :func:`json_backend.get_backend`.
+
+    Returns:
+        tuple[int, int]: The positions where the encoded value starts and ends, i.e., the value is
+            ``data[start:end]``.
+
+    Raises:
+        KeyError: If ``data`` does not contain the value that ``pointer`` refers to.
+        json_backend.JsonDecodeError: If ``data`` is not valid JSON (as far as it is scanned).
+        ValueError: If ``pointer`` is invalid.
+    """
+
+    tokens = parse_pointer(pointer)
+    if backend is None:
+        backend = json_backend.get_backend()
+
+    scanner = _Scanner(data, backend)
+    start = scanner.find(tokens)
+    if start is None:
+        raise KeyError(pointer)
+
+    return start, scanner.skip_value(start)
+
+
+class _Scanner(object):
+    """Finds values in JSON data without decoding any other parts of the data than the keys on the way."""
+
+    def __init__(self, data: typing.Union[bytes, mmap.mmap], backend: json_backend.JsonBackend):
+
+        global _patterns
+
+        if _patterns is None:
+
+            import re
+
+            _patterns = (
+                    re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL),  # -> a string
+                    re.compile(rb'[^,\]}\s]*'),                          # -> a number or literal
+                    re.compile(rb'\\.', re.DOTALL),                      # -> an escape sequence
+                    re.compile(rb'[\[\]{}]'),                            # -> a bracket
+                    re.compile(rb'[ \t\n\r]*')                          # -> whitespace
+            )
+
+        self._backend = backend
+        self._data = data
+        self._string, self._scalar, self._escape, self._bracket, self._whitespace = _patterns
+
+    def _error(self, pos: int) -> json_backend.JsonDecodeError:
+        """Creates the error that is raised if the data is not valid JSON at the provided position."""
+
+        return json_backend.JsonDecodeError(f"Invalid JSON data at position {pos}")
+
+    def _expect(self, pos: int, char: bytes) -> int:
+        """Skips whitespace and ensures that the next char is ``char``, and returns the position after the latter."""
+
+        pos = self._skip_whitespace(pos)
+        if self._data[pos:pos + 1] != char:
+            raise self._error(pos)
+
+        return pos + 1
+
+    def _find_element(self, pos: int, token: str) -> typing.Optional[int]:
+        """Finds the element of the array starting at ``pos`` that ``token`` refers to."""
+
+        if not token.isdigit() or (len(token) > 1 and token[0] == "0"):  # -> not a valid array index
+            return None
+
+        index = int(token)
+        pos = self._skip_whitespace(pos + 1)
+        if self._data[pos:pos + 1] == b"]":  # -> the array is empty
+            return None
+
+        for _ in range(index):
+
+            pos = self._skip_whitespace(self.skip_value(pos))
+            if self._data[pos:pos + 1] == b"]":  # -> the array is too short
+                return None
+            pos = self._skip_whitespace(self._expect(pos, b","))
+
+        return pos
+
+    def _find_member(self, pos: int, token: str) -> typing.Optional[int]:
+        """Finds the value of the member of the object starting at ``pos`` that ``token`` refers to.
+
+        Just like for ``json.loads``, the last member is used, if the object contains the same key multiple times.
+        """
+
+        pos = self._skip_whitespace(pos + 1)
+        if self._data[pos:pos + 1] == b"}":  # -> the object is empty
+            return None
+
+        value_pos = None
+        while True:
+
+            # read the next key
+            match = self._string.match(self._data, pos)
+            if match is None:
+                raise self._error(pos)
+            key = match.group()
+
+            # keys are decoded only if they contain escape sequences
+            if b"\\" in key:
+                key = self._backend.loads(key)
+            else:
+                try:
+                    key = key[1:-1].decode("utf-8")
+                except UnicodeDecodeError:
+                    raise self._error(pos)
+
+            pos = self._skip_whitespace(self._expect(match.end(), b":"))
+            if key == token:
+                value_pos = pos
+
+            # move on to the next key
+            pos = self._skip_whitespace(self.skip_value(pos))
+            if self._data[pos:pos + 1] == b"}":
+                return value_pos
+            pos = self._skip_whitespace(self._expect(pos, b","))
+
+    def _skip_container(self, pos: int) -> int:
+        """Skips the object or array that starts at ``pos``, and returns the position right after it.
+
+        In order to avoid running a Python loop over every single value inside the container, the data is processed in
+        chunks of :data:`_CHUNK_SIZE` bytes. In every chunk, escape sequences are replaced by placeholders of the same
+        length first, which means that strings are delimited by alternating quotes. Brackets outside of strings can then
+        be counted by means of ``bytes`` methods, which run at the speed of C. Only the chunk where the container ends
+        is scanned bracket by bracket.
+        """
+
+        depth = 1
+        in_string = False
+        chunk_start = pos + 1
+        while chunk_start < len(self._data):
+
+            # fetch the next chunk, and ensure that it does not end in the middle of an escape sequence
+            chunk = self._data[chunk_start:chunk_start + _CHUNK_SIZE]
+            if (len(chunk) - len(chunk.rstrip(b"\\"))) % 2 == 1:
+                chunk += self._data[chunk_start + len(chunk):chunk_start + len(chunk) + 1]
+
+            # replace escape sequences, and split the chunk into alternating parts outside and inside of strings
+            if b"\\" in chunk:
+                chunk = self._escape.sub(b"__", chunk)
+            parts = chunk.split(b'"')
+            outside = b"".join(parts[1 if in_string else 0::2])
+
+            # if the container cannot end in this chunk, then we only need to update the depth
+            closes = outside.count(b"]") + outside.count(b"}")
+            if closes < depth:
+
+                depth += outside.count(b"[") + outside.count(b"{") - closes
+                in_string ^= len(parts) % 2 == 0
+                chunk_start += len(chunk)
+                continue
+
+            # otherwise, scan all parts of the chunk outside of strings for the bracket that closes the container
+            offset = chunk_start
+            for part in parts:
+
+                if not in_string:
+                    for match in self._bracket.finditer(part):
+                        depth += 1 if match.group() in (b"[", b"{") else -1
+                        if depth == 0:
+                            return offset + match.end()
+
+                in_string = not in_string
+                offset += len(part) + 1
+
+            in_string = not in_string  # -> the last part is not followed by a quote
+            chunk_start += len(chunk)
+
+        raise self._error(len(self._data))
+
+    def _skip_whitespace(self, pos: int) -> int:
+        """Returns the position of the first char at or after ``pos`` that is not whitespace."""
+
+        return self._whitespace.match(self._data, pos).end()
+
+    def find(self, tokens: typing.Sequence[str]) -> typing.Optional[int]:
+        """Finds the value that the provided reference tokens refer to.
+
+        Args:
+            tokens (sequence[str]): The reference tokens of a JSON pointer (cf. :func:`parse_pointer`).
+
+        Returns:
+            int: The position where the value starts, or ``None``, if there is no such value.
+        """
+
+        pos = self._skip_whitespace(0)
+        for token in tokens:
+
+            char = self._data[pos:pos + 1]
+            if char == b"{":
+                pos = self._find_member(pos, token)
+            elif char == b"[":
+                pos = self._find_element(pos, token)
+            else:  # -> scalars do not have children
+                pos = None
+
+            if pos is None:
+                return None
+
+        return pos
+
+    def skip_value(self, pos: int) -> int:
+        """Skips the value that starts at the provided position.
+
+        Args:
+            pos (int): The position where the value starts (i.e., leading whitespace has been skipped already).
+
+        Returns:
+            int: The position right after the value.
+        """
+
+        char = self._data[pos:pos + 1]
+
+        # strings and scalars are matched by regular expressions
+        if char == b'"':
+            match = self._string.match(self._data, pos)
+            if match is None:
+                raise self._error(pos)
+            return match.end()
+        elif char not in (b"{", b"["):
+            end = self._scalar.match(self._data, pos).end()
+            if end == pos:
+                raise self._error(pos)
+            return end
+
+        return self._skip_container(pos)
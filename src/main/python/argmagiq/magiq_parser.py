@@ -31,23 +31,19 @@
 # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
 
-import inspect
-import json
-import os
-import re
 import sys
-import textwrap
 import typing
 
 import insanity
 
 import argmagiq
-import argmagiq.config_spec as config_spec
-import argmagiq.parsers.bool_parser as bool_parser
-import argmagiq.parsers.data_type_parser as data_type_parser
-import argmagiq.parsers.float_parser as float_parser
-import argmagiq.parsers.int_parser as int_parser
-import argmagiq.parsers.str_parser as str_parser
+import argmagiq.compiled_parser as compiled_parser
+import argmagiq.parsers.parser_registry as parser_registry
+import argmagiq.spec_cache as spec_cache
+
+if typing.TYPE_CHECKING:
+    import argmagiq.disk_cache as disk_cache
+    import argmagiq.result_cache as result_cache
 
 
 __author__ = "Patrick Hohenecker"
@@ -68,8 +64,10 @@ class MagiqParser(object):
     def __init__(
             self,
             spec: type,
-            app_name: str,
-            app_description: str
+            app_name: str = None,
+            app_description: str = None,
+            persistent_cache: "disk_cache.DiskCache" = None,
+            result_cache: "result_cache.ResultCache" = None
     ):
         """Creates a new instance of ``MagiqParser``.
 
@@ -78,183 +76,210 @@ class MagiqParser(object):
             app_name (str): The name of the application whose args are being parsed. This is printed in the help text.
             app_description (str): A description of the application whose args are being parsed. This is printed in the
                 help text.
+            persistent_cache (:class:`argmagiq.disk_cache.DiskCache`, optional): If provided, then the parser of the
+                configuration class is loaded from/stored in this cache, which allows for reusing it across invocations
+                of the application.
+            result_cache (:class:`argmagiq.result_cache.ResultCache`, optional): If provided, then configurations parsed
+                from JSON files are loaded from/stored in this cache, which allows for skipping parsing files
+                repeatedly.
         """
 
         # sanitize args
+        # -> classes annotated with @argmagiq.config have been checked when they were defined
         insanity.sanitize_type("spec", spec, type)
-        if not inspect.isclass(spec):
-            raise TypeError("<spec> has to be class")
-        if len(inspect.signature(spec.__init__).parameters) != 1:  # -> 1 for self
-            raise ValueError("<spec> has to have a no-arg constructor")
+        if argmagiq.COMPILED_PARSER_KEY not in spec.__dict__:
+            import inspect
+            if not inspect.isclass(spec):
+                raise TypeError("<spec> has to be class")
+            if len(inspect.signature(spec.__init__).parameters) != 1:  # -> 1 for self
+                raise ValueError("<spec> has to have a no-arg constructor")
         app_name = str(app_name)
         app_description = str(app_description)
+        if persistent_cache is not None:
+            import argmagiq.disk_cache as disk_cache
+            insanity.sanitize_type("persistent_cache", persistent_cache, disk_cache.DiskCache)
+        if result_cache is not None:
+            import argmagiq.result_cache as result_cache_module  # -> the arg shadows the usual name of the module
+            insanity.sanitize_type("result_cache", result_cache, result_cache_module.ResultCache)
 
         # store args
         self._app_description = app_description
         self._app_name = app_name
+        self._persistent_cache = persistent_cache
+        self._result_cache = result_cache
         self._spec = spec
 
-    #  METHODS  ########################################################################################################
-
-    @staticmethod
-    def _create_parsers(spec: config_spec.ConfigSpec) -> typing.List[data_type_parser.DataTypeParser]:
-        """Creates all parsers required to parse a configuration of the provided spec.
+        # the parser is retrieved when it is needed for the first time
+        self._compiled = None
 
-        Args:
-            spec (:class:`config_spec.ConfigSpec`): The spec that describes the configuration that needs to be parsed.
+    #  PROPERTIES  #####################################################################################################
 
-        Returns:
-            list[:class:`data_type_parser.DataTypeParser`]: The created parsers.
+    @property
+    def compiled(self) -> compiled_parser.CompiledParser:
+        """:class:`compiled_parser.CompiledParser`: The parser that is used for the configuration class of the
+        ``MagiqParser``.
 
-        Raises:
-            ValueError: If configuration values of an unsupported type are encountered in the ``spec``.
+        This is the parser that has been attached to the class by :func:`argmagiq.config`, if the class has been
+        annotated accordingly. Otherwise, it is retrieved from the persistent cache, if one was provided, or from
+        :attr:`spec_cache.SPEC_CACHE`. In any case, the parser is recreated, if any parsers have been registered in (or
+        removed from) :attr:`parser_registry.REGISTRY` since it has been created.
         """
 
-        field_parsers = []
-        for value_spec in spec:  # -> iterate over config values in the spec
-
-            # create a parser for the currently considered config value
-            if value_spec.data_type is bool:
-                field_parsers.append(bool_parser.BoolParser(value_spec))
-            elif value_spec.data_type is float:
-                field_parsers.append(float_parser.FloatParser(value_spec))
-            elif value_spec.data_type is int:
-                field_parsers.append(int_parser.IntParser(value_spec))
-            elif value_spec.data_type is str:
-                field_parsers.append(str_parser.StrParser(value_spec))
-            else:
-                raise ValueError(
-                        f"Unsupported type of property <{value_spec.name} in the configuration class: "
-                        f"{value_spec.data_type}"
-                )
-
-        return field_parsers
-
-    def _print_help_text(self, spec: config_spec.ConfigSpec) -> None:
-        """Prints the help text to the screen."""
-
-        # prepare the app description
-        desc_pars = re.split("\\n\\n+", self._app_description)
-        desc_pars = "\n\n".join("\n".join(textwrap.wrap(p.strip(), width=argmagiq.TEXT_WIDTH)) for p in desc_pars)
-
-        # prepare the option description
-        options = [p.synopsis for p in self._create_parsers(spec)]
-        options.append(("--help (or -h)", "Show this help."))
-        options.sort(key=lambda x: x[0])
-        option_width = max(len(opt[0]) for opt in options)  # -> the width of the left column
-        desc_width = argmagiq.TEXT_WIDTH - option_width - 2  # -> the width of the right column
-        formatted_options = []
-        for opt_syn, opt_desc in options:
-
-            opt_desc = textwrap.wrap(opt_desc, width=desc_width)
-            formatted_lines = [f"{opt_syn.ljust(option_width)}  {opt_desc[0]}"]
-            for desc_line in opt_desc[1:]:
-                formatted_lines.append(f"{' ' * option_width}  {desc_line}")
-            formatted_options.append("\n".join(formatted_lines))
-
-        formatted_options = "\n".join(formatted_options)
-
-        print(
-                (
-                        f"\n"
-                        f"{desc_pars}\n"
-                        f"\n"
-                        f"Usage: {self._app_name} [OPTION]...\n"
-                        f"  or   {self._app_name} -- FILE_PATH\n"
-                        f"\n"
-                        f"Options:\n"
-                        f"{formatted_options}\n"
-                )
-        )
+        registry_version = parser_registry.REGISTRY.version
+        if self._compiled is None or self._compiled.registry_version != registry_version:
+
+            compiled = self._spec.__dict__.get(argmagiq.COMPILED_PARSER_KEY)
+            if compiled is not None and compiled.registry_version != registry_version:
+                # -> the class has been annotated with @argmagiq.config, but the registry has changed since then
+                compiled = compiled_parser.CompiledParser(compiled.spec)
+                setattr(self._spec, argmagiq.COMPILED_PARSER_KEY, compiled)
+            elif compiled is None:
+                if self._persistent_cache is not None:
+                    compiled = self._persistent_cache.get_compiled(self._spec)
+                else:
+                    compiled = spec_cache.SPEC_CACHE.get_compiled(self._spec)
+
+            self._compiled = compiled
+
+        return self._compiled
+
+    #  METHODS  ########################################################################################################
 
-    @classmethod
-    def _read_args_from_command_line(
-            cls,
-            spec: config_spec.ConfigSpec,
-            argv: typing.Tuple[str, ...]
+    def _parse_argv(
+            self,
+            compiled: compiled_parser.CompiledParser,
+            argv: typing.Sequence[str],
+            expand_response_files: bool
     ) -> typing.Dict[str, typing.Any]:
-        """Parses a tuple of command-line args into dictionary of configuration values.
+        """Parses the provided args, which specify the paths of any number of JSON files to read configuration values
+        from (i.e., ``-- FILE_PATH``), followed by configuration values that override the same (cf.
+        :meth:`_split_argv`).
 
         Args:
-            spec (:class:`config_spec.ConfigSpec`): The spec that describes the configuration that needs to be parsed.
-            argv (tuple[str]): The command-line args to parse.
+            compiled (:class:`compiled_parser.CompiledParser`): The parser to use.
+            argv (sequence[str]): The args to parse, without the name of the application.
+            expand_response_files (bool): Indicates whether response files in ``argv`` are expanded (cf.
+                :meth:`compiled_parser.CompiledParser.parse`).
 
         Returns:
             dict: The parsed configuration.
-
-        Raises:
-            ValueError: If an unknown arg is encountered or parsing any arg fails for some reason.
         """
 
-        parsed_args = {}
+        file_paths, argv = self._split_argv(argv)
+
+        # check whether the args have to be parsed from the command line, read from a json file, or both
+        if not file_paths:  # -> args have to be parsed from the command line
+            return compiled.parse(argv, expand_response_files=expand_response_files)
+        elif len(file_paths) == 1 and not argv:  # -> args have to be read from a json file
+            return compiled.parse_file(file_paths[0], result_cache=self._result_cache)
+        else:  # -> args have to be merged from several sources
+            return compiled.parse_layered(
+                    file_paths,
+                    argv,
+                    result_cache=self._result_cache,
+                    expand_response_files=expand_response_files
+            )[0]
 
-        # create parsers for all config values
-        field_parsers = cls._create_parsers(spec)
+    @staticmethod
+    def _split_argv(argv: typing.Sequence[str]) -> typing.Tuple[typing.List[str], typing.Tuple[str, ...]]:
+        """Splits the provided args into the paths of JSON files and the remaining command-line args.
 
-        # parse the args
-        while argv:  # -> as long as there are args left
+        Paths of files are specified as ``-- FILE_PATH`` at the beginning of ``argv``, e.g.,
+        ``-- base.json -- experiment.json --learning-rate 0.1``.
 
-            # find a parser to use
-            for fp in field_parsers:
+        Args:
+            argv (sequence[str]): The args to split, without the name of the application.
 
-                if fp.fires(argv):  # -> the parser can be used to parse the next option
+        Returns:
+            tuple: The paths of all files, in the same order as they were provided, and the remaining args.
+        """
 
-                    # parse the currently considered arg
-                    value, argv = fp.parse(argv)
-                    parsed_args[fp.spec.name] = value
-                    break  # -> move on to the next arg
+        file_paths = []
+        index = 0
+        while index + 1 < len(argv) and argv[index] == "--":
+            file_paths.append(argv[index + 1])
+            index += 2
 
-            else:
-                raise ValueError(f"Unknown option: '{argv[0]}'")
+        return file_paths, tuple(argv[index:])
 
-        return parsed_args
+    def create_config(self, parsed_args: typing.Dict[str, typing.Any]) -> typing.Any:
+        """Creates an instance of the configuration class, and populates it with the provided values.
 
-    @classmethod
-    def _read_args_from_file(cls, spec: config_spec.ConfigSpec, file_path: str) -> typing.Dict[str, typing.Any]:
-        """Parses a JSON file into dictionary of configuration values.
+        The values are not parsed or validated again, i.e., they have to be the output of one of the parsing methods of
+        :class:`compiled_parser.CompiledParser` (or equivalent).
 
         Args:
-            spec (:class:`config_spec.ConfigSpec`): The spec that describes the configuration that needs to be parsed.
-            file_path (str): The path of the JSON file to parse.
+            parsed_args (dict): The parsed configuration.
 
         Returns:
-            dict: The parsed configuration.
+            The created configuration object.
+        """
 
-        Raises:
-            ValueError: If the ``file_path`` does not exist or refers to file of another format than JSON, if an unknown
-                arg is encountered, or if parsing any arg fails for some reason.
+        config = self._spec()
+        for config_name, config_value in parsed_args.items():
+            setattr(config, config_name, config_value)
+
+        return config
+
+    def parse(self, argv: typing.Sequence[str] = None, expand_response_files: bool = None) -> typing.Any:
+        """Parses the provided args based on the configuration class that was handed to the ``MagiqParser``, and returns
+        an instance of this very class that has been populated accordingly.
+
+        Just like the args of an application, ``argv`` may specify configuration values, the paths of JSON files to read
+        them from (i.e., ``-- FILE_PATH``), or both, e.g., ``-- base.json -- experiment.json --learning-rate 0.1``. In
+        the latter case, the sources are merged from left to right, i.e., later files override earlier ones, and
+        command-line args override all files. If ``argv`` contains ``-h`` or ``--help``, then the help text is printed
+        instead.
+
+        Args of the form ``@FILE_PATH`` refer to response files that contain further args. Since these allow for reading
+        any file, they are expanded by default only if the args of the current application are parsed.
+
+        This method does not modify any shared state, and may thus be invoked from multiple threads concurrently.
+
+        Args:
+            argv (sequence[str], optional): The args to parse, without the name of the application. This defaults to the
+                args of the current application (i.e., ``sys.argv[1:]``).
+            expand_response_files (bool, optional): Indicates whether response files are expanded. This defaults to
+                ``True``, if ``argv`` is not provided, and ``False`` otherwise.
+
+        Returns:
+            The parsed configuration or ``None``, if the help text has been requested.
         """
 
-        # ensure that the config file exists
-        if not os.path.isfile(file_path):
-            raise ValueError(f"Config file not found: '{file_path}'")
+        # retrieve the args to parse -> we just remove the name of the application, if they are taken from sys.argv
+        if expand_response_files is None:
+            expand_response_files = argv is None
+        argv = tuple(sys.argv[1:] if argv is None else argv)
+
+        # retrieve the parser for the used configuration class
+        compiled = self.compiled
+
+        # check whether the help text should be printed instead of parsing args
+        if "-h" in argv or "--help" in argv:
 
-        # read the json file
-        try:
-            with open(file_path, "r") as f:
-                json_data = json.load(f)
-        except json.decoder.JSONDecodeError:
-            raise ValueError(f"The specified config file is not a valid JSON file: '{file_path}'")
+            print(compiled.format_help(self._app_name, self._app_description))
+            return None
 
-        # ensure that the json file describes a dict of config values
-        if not isinstance(json_data, dict):
-            raise ValueError("The config file does not describe a dictionary of config values")
+        # parse the args, and create config object based on the same
+        return self.create_config(self._parse_argv(compiled, argv, expand_response_files))
 
-        # create parsers for all config values
-        field_parsers = {p.spec.name: p for p in cls._create_parsers(spec)}
+    def parse_archive(self, archive_path: str) -> typing.Iterator[typing.Any]:
+        """Parses all JSON configuration files in a tar or zip archive lazily, without extracting the archive.
 
-        # parse all args
-        parsed_args = {}
-        for config_name, config_value in json_data.items():  # -> iterate over all config values in the file
+        Args:
+            archive_path (str): The path of the archive to parse (cf.
+                :meth:`compiled_parser.CompiledParser.parse_archive`).
 
-            # ensure that the encountered config exists
-            if config_name not in field_parsers:
-                raise ValueError(f"Unknown option: '{config_name}'")
+        Yields:
+            For each configuration file in the archive, either the parsed configuration or, if parsing failed, a
+            ``ValueError`` that describes the problem, including the name of the file.
 
-            # parse the value
-            parsed_args[config_name] = field_parsers[config_name].parse_json(config_value)
+        Raises:
+            ValueError: If the ``archive_path`` does not exist or does not refer to a tar or zip archive.
+        """
 
-        return parsed_args
+        for result in self.compiled.parse_archive(archive_path):
+            yield result if isinstance(result, ValueError) else self.create_config(result)
 
     def parse_args(self) -> typing.Any:
         """Parses the args of the current application based on the configuration class that was handed to the
@@ -264,42 +289,148 @@ class MagiqParser(object):
             The parsed configuration or ``None``, if the help text has been requested.
         """
 
-        # generate the config spec from the used configuration class
-        spec = config_spec.ConfigSpec.create_from(self._spec)
+        return self.parse()
 
-        # check whether the help text should be printed instead of parsing args
-        if "-h" in sys.argv[1:] or "--help" in sys.argv[1:]:
+    def parse_dict(self, mapping: typing.Mapping[str, typing.Any]) -> typing.Any:
+        """Parses a mapping from names of configuration values to the same, and returns an instance of the configuration
+        class that has been populated accordingly.
 
-            self._print_help_text(spec)
-            return None
+        The values in ``mapping`` are treated like values read from a JSON configuration file. Just like :meth:`parse`,
+        this method may be invoked from multiple threads concurrently.
+
+        Args:
+            mapping (mapping[str, any]): The configuration values to parse.
 
-        # check whether the args have to be parsed from the command line or read from a json file
-        read_from_file = len(sys.argv) == 3 and sys.argv[1] == "--"
-        if read_from_file:  # -> args have to be read from a json file
+        Returns:
+            The parsed configuration.
+        """
 
-            parsed_args = self._read_args_from_file(spec, sys.argv[2])
+        return self.create_config(self.compiled.parse_dict(mapping))
 
-        else:  # -> args have to be parsed from the command line
+    def parse_jsonl(self, file_path: str = None) -> typing.Iterator[typing.Any]:
+        """Parses a JSON-Lines file, which contains one configuration, as a JSON object, per line, lazily.
 
-            parsed_args = self._read_args_from_command_line(
-                    spec,
-                    tuple(sys.argv[1:])  # -> we just remove the name of the application
-            )
+        The file is read one line at a time, and thus memory usage does not depend on its size. Empty lines are skipped.
 
-        # ensure that all required args have been provided
-        for value_spec in spec:
-            if value_spec.required and value_spec.name not in parsed_args:
+        If no ``file_path`` is provided, then it is taken from the args of the current application, which are expected
+        to be of the form ``-- FILE_PATH``. Like in :meth:`parse`, ``-h`` or ``--help`` causes the help text to be
+        printed instead, in which case nothing is yielded.
 
-                arg_name = (
-                        value_spec.name
-                        if read_from_file
-                        else data_type_parser.DataTypeParser.translate_config_name(value_spec.name)
-                )
-                raise ValueError(f"Missing required arg {arg_name}")
+        Args:
+            file_path (str, optional): The path of the file to parse, or ``"-"`` for reading from ``stdin``.
 
-        # create config object based on the parsed args
-        config = self._spec()
-        for config_name, config_value in parsed_args.items():
-            setattr(config, config_name, config_value)
+        Yields:
+            For each non-empty line, in the same order, either the parsed configuration or, if parsing failed, a
+            ``ValueError`` that describes the problem, including the number of the line.
 
-        return config
+        Raises:
+            ValueError: If the file does not exist, or if no ``file_path`` is provided and the args of the application
+                are not of the form ``-- FILE_PATH``.
+        """
+
+        compiled = self.compiled
+
+        # retrieve the path of the file to parse from the args of the application, if necessary
+        if file_path is None:
+
+            argv = sys.argv[1:]
+            if "-h" in argv or "--help" in argv:
+
+                print(compiled.format_help(self._app_name, self._app_description))
+                return
+
+            if len(argv) != 2 or argv[0] != "--":
+                raise ValueError("Expected the args to be of the form '-- FILE_PATH'")
+
+            file_path = argv[1]
+
+        for result in compiled.parse_jsonl(file_path):
+            yield result if isinstance(result, ValueError) else self.create_config(result)
+
+    def parse_many(self, argvs: typing.Iterable[typing.Sequence[str]]) -> typing.Iterator[typing.Any]:
+        """Parses any number of sequences of args lazily.
+
+        Every sequence of args is parsed just like the args of the application would be parsed by :meth:`parse_args`,
+        except that help flags are not treated specially and response files are not expanded. However, the configuration
+        class is prepared for parsing once for all of them, and results are produced one at a time, i.e., the provided
+        ``argvs`` may be an arbitrarily long iterator.
+
+        Args:
+            argvs (iterable[sequence[str]]): The sequences of args to parse, without the name of the application.
+
+        Yields:
+            For each sequence of args, in the same order, either the parsed configuration or, if parsing failed, the
+            ``TypeError`` or ``ValueError`` that was raised.
+        """
+
+        compiled = self.compiled
+        for argv in argvs:
+
+            try:
+                result = self.create_config(self._parse_argv(compiled, argv, False))
+            except (TypeError, ValueError) as e:
+                result = e
+
+            yield result
+
+    def parse_many_files(self, file_paths: typing.Iterable[str]) -> typing.Iterator[typing.Any]:
+        """Parses any number of JSON configuration files lazily.
+
+        This is the equivalent of :meth:`parse_many` for configuration files.
+
+        Args:
+            file_paths (iterable[str]): The paths of the files to parse.
+
+        Yields:
+            For each file, in the same order, either the parsed configuration or, if parsing failed, the ``TypeError``
+            or ``ValueError`` that was raised.
+        """
+
+        compiled = self.compiled
+        for file_path in file_paths:
+
+            try:
+                result = self.create_config(compiled.parse_file(file_path, result_cache=self._result_cache))
+            except (TypeError, ValueError) as e:
+                result = e
+
+            yield result
+
+    def parse_with_provenance(
+            self,
+            argv: typing.Sequence[str] = None,
+            expand_response_files: bool = None
+    ) -> typing.Tuple[typing.Any, typing.Optional[typing.Dict[str, str]]]:
+        """Parses the provided args just like :meth:`parse`, but records where each configuration value was taken from.
+
+        Args:
+            argv (sequence[str], optional): The args to parse, without the name of the application. This defaults to the
+                args of the current application (i.e., ``sys.argv[1:]``).
+            expand_response_files (bool, optional): Indicates whether response files are expanded (cf. :meth:`parse`).
+
+        Returns:
+            tuple: The parsed configuration and its provenance, which maps the names of all configuration values to the
+            paths of the files that they have been taken from, :data:`compiled_parser.COMMAND_LINE_SOURCE`, or
+            :data:`compiled_parser.DEFAULT_SOURCE`. Both are ``None``, if the help text has been requested.
+        """
+
+        if expand_response_files is None:
+            expand_response_files = argv is None
+        argv = tuple(sys.argv[1:] if argv is None else argv)
+        compiled = self.compiled
+
+        # check whether the help text should be printed instead of parsing args
+        if "-h" in argv or "--help" in argv:
+
+            print(compiled.format_help(self._app_name, self._app_description))
+            return None, None
+
+        file_paths, argv = self._split_argv(argv)
+        parsed_args, provenance = compiled.parse_layered(
+                file_paths,
+                argv,
+                result_cache=self._result_cache,
+                expand_response_files=expand_response_files
+        )
+
+        return self.create_config(parsed_args), provenance
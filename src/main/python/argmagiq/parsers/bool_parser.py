@@ -73,4 +73,8 @@ class BoolParser(data_type_parser.DataTypeParser):
 
     def _parse(self, argv: typing.Tuple[str, ...]) -> typing.Tuple[typing.Any, typing.Tuple[str, ...]]:
 
-        return not self._spec.default_value, argv[1:]
+        return super()._parse(argv)
+
+    def _parse_at(self, argv: typing.Tuple[str, ...], index: int) -> typing.Tuple[typing.Any, int]:
+
+        return not self._spec.default_value, 1
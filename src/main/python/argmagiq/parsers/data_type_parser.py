@@ -32,6 +32,7 @@
 
 
 import abc
+import types
 import typing
 
 import insanity
@@ -50,7 +51,15 @@ __status__ = "Development"
 
 
 class DataTypeParser(metaclass=abc.ABCMeta):
-    """An abstract base class for data-type specific arg parsers."""
+    """An abstract base class for data-type specific arg parsers.
+
+    Subclasses implement the actual parsing procedure by overriding :meth:`_parse_at`, which reads args from a shared
+    tuple starting at a given position, and reports how many of them have been consumed, as well as the abstract method
+    :meth:`_parse`, whose default implementation is derived from the former. For backward compatibility, subclasses may
+    override :meth:`_parse` only, which receives the remaining args only, and returns them without those that have been
+    consumed. Whichever of the two methods is defined further down the class hierarchy is used for parsing args by
+    position.
+    """
 
     def __init__(self, spec: value_spec.ValueSpec):
         """Creates a new ``DataTypeParser`` for the provided :class:`value_spec.ValueSpec`.
@@ -68,8 +77,37 @@ class DataTypeParser(metaclass=abc.ABCMeta):
         # compute the name of the according command-line arg
         self._arg_name = self.translate_config_name(spec.name)
 
+        # determine the implementation of parsing by position once, and store it as bound method
+        self._parse_at_impl = self._find_parse_at_impl()
+
+    #  MAGIC FUNCTIONS  ################################################################################################
+
+    def __getstate__(self) -> typing.Dict[str, typing.Any]:
+
+        # -> the bound method is not pickled, since pickle restores it by looking up _parse_at again, which bypasses
+        #    the compatibility layer for legacy parsers
+        state = self.__dict__.copy()
+        del state["_parse_at_impl"]
+
+        return state
+
+    def __setstate__(self, state: typing.Dict[str, typing.Any]) -> None:
+
+        self.__dict__.update(state)
+        self._parse_at_impl = self._find_parse_at_impl()
+
     #  PROPERTIES  #####################################################################################################
 
+    @property
+    def arg_names(self) -> typing.Tuple[str, ...]:
+        """tuple[str]: The names of all command-line args that the ``DataTypeParser`` fires for.
+
+        These are used for dispatching args to parsers by means of a simple lookup. Notice that subclasses that override
+        :meth:`fires` are not dispatched based on their ``arg_names``, but by invoking :meth:`fires` instead.
+        """
+
+        return self._arg_name,
+
     @property
     def spec(self) -> value_spec.ValueSpec:
         """:class:`value_spec.ValueSpec`: The specification used by the ``DataTypeParser``."""
@@ -106,7 +144,60 @@ class DataTypeParser(metaclass=abc.ABCMeta):
 
     @abc.abstractmethod
     def _parse(self, argv: typing.Tuple[str, ...]) -> typing.Tuple[typing.Any, typing.Tuple[str, ...]]:
-        """This is the actual implementation of :meth:`parse`, which is invoked after sanitizing args."""
+        """This is the actual implementation of :meth:`parse`, which is invoked after sanitizing args.
+
+        The default implementation is derived from :meth:`_parse_at`, and may be used by subclasses that implement the
+        latter by means of ``super()``.
+        """
+
+        value, num_consumed = self._parse_at(argv, 0)
+        return value, argv[num_consumed:]
+
+    def _parse_at(self, argv: typing.Tuple[str, ...], index: int) -> typing.Tuple[typing.Any, int]:
+        """This is the actual implementation of :meth:`parse_at`, which is invoked after sanitizing args.
+
+        The default implementation is derived from :meth:`_parse`, and serves as a compatibility layer for subclasses
+        that implement the latter only.
+        """
+
+        value, remaining_argv = self._parse(argv[index:])
+        return value, len(argv) - index - len(remaining_argv)
+
+    def _find_parse_at_impl(self) -> typing.Callable[[typing.Tuple[str, ...], int], typing.Tuple[typing.Any, int]]:
+        """Determines the implementation of parsing by position, which is either :meth:`_parse_at` or, if a class
+        overrides :meth:`_parse` only, the compatibility layer, as an implementation of :meth:`_parse_at` inherited from
+        a superclass must not take precedence in this case.
+        """
+
+        for cls in type(self).__mro__:
+            if "_parse_at" in vars(cls):
+                break
+            if "_parse" in vars(cls):
+                return types.MethodType(DataTypeParser._parse_at, self)
+
+        return self._parse_at
+
+    def _fires(self, argv: typing.Tuple[str, ...], index: int) -> bool:
+        """This is the actual implementation of :meth:`fires`, which is invoked after sanitizing args.
+
+        In contrast to :meth:`fires`, this method evaluates the arg at position ``index`` of ``argv``, which is
+        guaranteed to exist.
+        """
+
+        return argv[index] in self.arg_names
+
+    def _trusted_fires(self, argv: typing.Tuple[str, ...], index: int) -> bool:
+        """Evaluates whether the ``DataTypeParser`` fires for the arg at position ``index`` of ``argv`` without
+        sanitizing args.
+
+        This is meant to be used internally only, i.e., for args that have been sanitized before. Subclasses that
+        override :meth:`fires` rather than :meth:`_fires` are still supported, though without skipping their checks.
+        """
+
+        if type(self).fires is not DataTypeParser.fires:
+            return self.fires(argv[index:])
+
+        return self._fires(argv, index)
 
     def fires(self, argv: typing.Tuple[str, ...]) -> bool:
         """Evaluates whether the ``DataTypeParser`` should be used to parse the next args (at the beginning of the
@@ -126,7 +217,7 @@ class DataTypeParser(metaclass=abc.ABCMeta):
         insanity.sanitize_iterable("argv", argv, elements_type=str)
 
         # determine whether the parser fires
-        return len(argv) > 0 and argv[0] == self._arg_name
+        return len(argv) > 0 and self._fires(argv, 0)
 
     def parse(self, argv: typing.Tuple[str, ...]) -> typing.Tuple[typing.Any, typing.Tuple[str, ...]]:
         """Parses the next arg in the provided tuple of command-line args.
@@ -150,6 +241,39 @@ class DataTypeParser(metaclass=abc.ABCMeta):
         # parse the args
         return self._parse(argv)
 
+    def parse_at(self, argv: typing.Tuple[str, ...], index: int) -> typing.Tuple[typing.Any, int]:
+        """Parses the arg at the provided position of a tuple of command-line args.
+
+        In contrast to :meth:`parse`, this method does not create a copy of the remaining args, which is why it should
+        be preferred for parsing long sequences of args.
+
+        Args:
+            argv (tuple[str]): All command-line args.
+            index (int): The position of the arg to parse in ``argv``.
+
+        Returns:
+            value: The parsed value.
+            num_consumed (int): The number of args, starting at ``index``, that have been consumed by the
+                ``DataTypeParser``.
+
+        Raises:
+            ValueError: If the ``DataTypeParser`` does not fire for the arg at the provided position, or if an error
+                occurred during parsing.
+        """
+
+        # sanitize args
+        insanity.sanitize_type("argv", argv, tuple)
+        insanity.sanitize_iterable("argv", argv, elements_type=str)
+        insanity.sanitize_type("index", index, int)
+        insanity.sanitize_range("index", index, minimum=0)
+
+        # ensure that the parser actually fires
+        if index >= len(argv) or not self._trusted_fires(argv, index):
+            raise ValueError("The parser does not fire for the provided args")
+
+        # parse the args
+        return self._parse_at_impl(argv, index)
+
     def parse_json(self, json_value: typing.Any) -> typing.Any:
         """Parses a value that has been read from a JSON file by means of Python's ``json`` package.
 
@@ -51,13 +51,17 @@ class FloatParser(data_type_parser.DataTypeParser):
 
     def _parse(self, argv: typing.Tuple[str, ...]) -> typing.Tuple[typing.Any, typing.Tuple[str, ...]]:
 
-        if len(argv) < 2:
+        return super()._parse(argv)
+
+    def _parse_at(self, argv: typing.Tuple[str, ...], index: int) -> typing.Tuple[typing.Any, int]:
+
+        if len(argv) < index + 2:
             raise ValueError(f"Argument {self._arg_name} requires an argument")
 
         try:
-            return float(argv[1]), argv[2:]
+            return float(argv[index + 1]), 2
         except ValueError:
-            raise ValueError(f"Argument {self._arg_name} received an illegal value: {argv[1]}")
+            raise ValueError(f"Argument {self._arg_name} received an illegal value: {argv[index + 1]}")
 
     def parse_json(self, json_value: typing.Any) -> typing.Any:
 
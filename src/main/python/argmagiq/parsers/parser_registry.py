@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import enum
+import threading
+import typing
+
+import insanity
+
+import argmagiq.parsers.bool_parser as bool_parser
+import argmagiq.parsers.data_type_parser as data_type_parser
+import argmagiq.parsers.float_parser as float_parser
+import argmagiq.parsers.int_parser as int_parser
+import argmagiq.parsers.str_parser as str_parser
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+ENTRY_POINT_GROUP = "argmagiq.parsers"
+"""str: The group of entry points that third-party packages use for providing parsers.
+
+The name of each entry point is the fully qualified name of a data type (e.g., ``pathlib.Path``), and its value refers
+to the subclass of :class:`data_type_parser.DataTypeParser` that parses this type (e.g., ``some_package.parsers:
+PathParser``).
+"""
+
+
+def _find_entry_points(group: str) -> typing.Iterable[typing.Any]:
+    """Retrieves all installed entry points of the provided group.
+
+    Returns:
+        iterable: The entry points, or an empty iterable, if the installed version of Python does not provide
+            ``importlib.metadata`` and the backport ``importlib_metadata`` is not installed either.
+    """
+
+    try:
+        import importlib.metadata as metadata
+    except ImportError:  # -> Python < 3.8
+        try:
+            import importlib_metadata as metadata
+        except ImportError:
+            return []
+
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, "select"):  # -> Python >= 3.10
+        return entry_points.select(group=group)
+    else:
+        return entry_points.get(group, [])
+
+
+class ParserRegistry(object):
+    """A thread-safe registry that maps data types to the subclasses of :class:`data_type_parser.DataTypeParser` that
+    are used for parsing them.
+
+    Parsers are looked up along the method resolution order of a data type, i.e., a parser that has been registered for
+    a data type is used for all of its subclasses as well, unless a more specific parser has been registered. For enums,
+    only the classes in the MRO that are enums themselves are considered, since the parser of a mixed-in type (e.g.,
+    ``int`` for an :class:`enum.IntEnum`) would produce plain values rather than members of the enum. If no parser has
+    been registered for a class in the MRO explicitly, then the installed entry points of the group
+    :attr:`ENTRY_POINT_GROUP` are considered. These are discovered when they are needed for the first time, and the
+    parsers that they refer to are imported only if they are actually used. The results of all lookups are cached.
+    """
+
+    #  CONSTRUCTOR  ####################################################################################################
+
+    def __init__(self, use_entry_points: bool = True):
+        """Creates a new empty ``ParserRegistry``.
+
+        Args:
+            use_entry_points (bool): Indicates whether parsers that are provided by means of entry points should be
+                considered.
+        """
+
+        self._entry_points = None if use_entry_points else {}  # -> maps type names to entry points (loaded lazily)
+        self._lock = threading.RLock()
+        self._lookup_cache = {}  # -> maps data types to the results of lookups
+        self._parsers = {}  # -> maps data types to the parsers registered for them
+        self._version = 0
+
+    #  MAGIC FUNCTIONS  ################################################################################################
+
+    def __contains__(self, data_type: typing.Any) -> bool:
+
+        return isinstance(data_type, type) and self.lookup(data_type) is not None
+
+    #  PROPERTIES  #####################################################################################################
+
+    @property
+    def version(self) -> int:
+        """int: A counter that is increased whenever the registered parsers change, which may be used for invalidating
+        parsers that have been created based on earlier lookups.
+        """
+
+        return self._version
+
+    #  METHODS  ########################################################################################################
+
+    @staticmethod
+    def _get_type_name(data_type: type) -> str:
+        """Determines the fully qualified name of the provided data type, which is used for finding entry points."""
+
+        return f"{data_type.__module__}.{data_type.__qualname__}"
+
+    def _load_entry_point(self, data_type: type) -> typing.Optional[type]:
+        """Loads the parser that is provided for the given data type by means of an entry point, if any.
+
+        This method must be invoked while holding the lock.
+        """
+
+        # discover installed entry points, if this has not happened before
+        if self._entry_points is None:
+            self._entry_points = {ep.name: ep for ep in _find_entry_points(ENTRY_POINT_GROUP)}
+
+        # check whether there is an entry point for the data type
+        entry_point = self._entry_points.get(self._get_type_name(data_type))
+        if entry_point is None:
+            return None
+
+        # load the parser, and register it for subsequent lookups
+        parser_cls = entry_point.load()
+        self._sanitize_parser_cls(parser_cls)
+        self._parsers[data_type] = parser_cls
+
+        return parser_cls
+
+    @staticmethod
+    def _sanitize_parser_cls(parser_cls: typing.Any) -> None:
+        """Ensures that the provided object is a subclass of :class:`data_type_parser.DataTypeParser`."""
+
+        if not isinstance(parser_cls, type) or not issubclass(parser_cls, data_type_parser.DataTypeParser):
+            raise TypeError(f"Parsers have to be subclasses of DataTypeParser, but encountered: {parser_cls}")
+
+    def lookup(self, data_type: type) -> typing.Optional[type]:
+        """Retrieves the parser that is responsible for the provided data type.
+
+        Args:
+            data_type (type): The data type to retrieve the parser for.
+
+        Returns:
+            type: The subclass of :class:`data_type_parser.DataTypeParser` that is responsible for ``data_type``, or
+                ``None``, if there is none.
+        """
+
+        # check whether the lookup has been performed before -> this is done without locking for the sake of speed
+        try:
+            return self._lookup_cache[data_type]
+        except KeyError:
+            pass
+
+        insanity.sanitize_type("data_type", data_type, type)
+
+        with self._lock:
+
+            # find the most specific parser along the MRO of the data type
+            parser_cls = None
+            for cls in data_type.__mro__:
+                if issubclass(data_type, enum.Enum) and not issubclass(cls, enum.Enum):
+                    continue  # -> mixed-in type (or object)
+                parser_cls = self._parsers.get(cls) or self._load_entry_point(cls)
+                if parser_cls is not None:
+                    break
+
+            self._lookup_cache[data_type] = parser_cls
+
+            return parser_cls
+
+    def register(self, data_type: type, parser_cls: type) -> None:
+        """Registers a parser for the provided data type.
+
+        Any parser that has been registered for the same type before is replaced. Parsers of configuration classes
+        that have been created already (e.g., by means of :func:`argmagiq.config`) are recreated when they are used by
+        :class:`argmagiq.magiq_parser.MagiqParser` next time.
+
+        Args:
+            data_type (type): The data type that is parsed by ``parser_cls``.
+            parser_cls (type): The subclass of :class:`data_type_parser.DataTypeParser` that is used for parsing.
+        """
+
+        insanity.sanitize_type("data_type", data_type, type)
+        self._sanitize_parser_cls(parser_cls)
+
+        with self._lock:
+            self._parsers[data_type] = parser_cls
+            self._lookup_cache = {}
+            self._version += 1
+
+    def unregister(self, data_type: type) -> None:
+        """Removes the parser that has been registered for the provided data type, if any.
+
+        Args:
+            data_type (type): The data type to remove the parser for.
+        """
+
+        with self._lock:
+            if self._parsers.pop(data_type, None) is not None:
+                self._lookup_cache = {}
+                self._version += 1
+
+
+REGISTRY = ParserRegistry()
+"""ParserRegistry: The registry that is used for creating the parsers of configuration classes."""
+
+REGISTRY.register(bool, bool_parser.BoolParser)
+REGISTRY.register(float, float_parser.FloatParser)
+REGISTRY.register(int, int_parser.IntParser)
+REGISTRY.register(str, str_parser.StrParser)
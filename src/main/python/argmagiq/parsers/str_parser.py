@@ -51,10 +51,14 @@ class StrParser(data_type_parser.DataTypeParser):
 
     def _parse(self, argv: typing.Tuple[str, ...]) -> typing.Tuple[typing.Any, typing.Tuple[str, ...]]:
 
-        if len(argv) < 2:
+        return super()._parse(argv)
+
+    def _parse_at(self, argv: typing.Tuple[str, ...], index: int) -> typing.Tuple[typing.Any, int]:
+
+        if len(argv) < index + 2:
             raise ValueError(f"Option {self._arg_name} requires an argument")
 
-        return argv[1], argv[2:]
+        return argv[index + 1], 2
 
     def parse_json(self, json_value: typing.Any) -> typing.Any:
 
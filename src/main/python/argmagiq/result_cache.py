@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import collections
+import os
+import threading
+import typing
+
+import insanity
+
+import argmagiq
+import argmagiq.archives as archives
+import argmagiq.compiled_parser as compiled_parser
+import argmagiq.disk_cache as disk_cache
+import argmagiq.json_pointer as json_pointer
+import argmagiq.spec_cache as spec_cache
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+class ResultCache(object):
+    """A thread-safe cache of configurations that have been parsed from JSON files.
+
+    Every cache entry is keyed by the path of the file, including the JSON pointer, if any, its size and modification
+    time, optionally a hash of its content, and the fingerprint of the :class:`compiled_parser.CompiledParser` that
+    parsed it (cf. :attr:`compiled_parser.CompiledParser.fingerprint`). Hence, a file that is modified or parsed for a
+    different configuration class is parsed anew. Cache hits skip decoding the file as well as parsing any of its
+    values.
+
+    Entries are kept in memory, where the least recently used ones are evicted once there are more than ``max_size`` of
+    them. Furthermore, if a ``directory`` is provided, then entries are stored on disk as well, which allows for reusing
+    them across invocations of an application. Just like for :class:`disk_cache.DiskCache`, the directory is created
+    such that it is accessible by the current user only, and entries that somebody else could have modified are never
+    loaded.
+    """
+
+    #  CONSTRUCTOR  ####################################################################################################
+
+    def __init__(self, max_size: int = 128, directory: str = None, hash_contents: bool = False):
+        """Creates a new ``ResultCache``.
+
+        Args:
+            max_size (int, optional): The maximum number of entries that are kept in memory.
+            directory (str, optional): If provided, then cache entries are stored in this directory as well.
+            hash_contents (bool, optional): Indicates whether entries are keyed by a hash of the content of the files in
+                addition to their size and modification time. This detects modifications that preserve both of these,
+                but requires reading every file on every lookup. If a path contains a JSON pointer, then only the
+                addressed value is hashed, which still requires scanning the file up to the end of that value (and
+                decompressing it, if it is compressed).
+        """
+
+        insanity.sanitize_type("max_size", max_size, int)
+        insanity.sanitize_range("max_size", max_size, minimum=1)
+
+        self._directory = None if directory is None else str(directory)
+        self._entries = collections.OrderedDict()  # -> maps keys to parsed args, the least recently used entry first
+        self._hash_contents = bool(hash_contents)
+        self._hits = 0
+        self._lock = threading.Lock()
+        self._max_size = max_size
+        self._misses = 0
+
+    #  MAGIC FUNCTIONS  ################################################################################################
+
+    def __len__(self) -> int:
+
+        return len(self._entries)
+
+    #  PROPERTIES  #####################################################################################################
+
+    @property
+    def directory(self) -> typing.Optional[str]:
+        """str: The directory that cache entries are stored in, or ``None``, if they are kept in memory only."""
+
+        return self._directory
+
+    @property
+    def hash_contents(self) -> bool:
+        """bool: Indicates whether entries are keyed by a hash of the content of the files."""
+
+        return self._hash_contents
+
+    @property
+    def hits(self) -> int:
+        """int: The number of lookups that have been answered from the cache."""
+
+        return self._hits
+
+    @property
+    def max_size(self) -> int:
+        """int: The maximum number of entries that are kept in memory."""
+
+        return self._max_size
+
+    @property
+    def misses(self) -> int:
+        """int: The number of lookups that could not be answered from the cache."""
+
+        return self._misses
+
+    #  METHODS  ########################################################################################################
+
+    def _get_entry_path(self, key: tuple) -> str:
+        """Determines the path of the file that stores the cache entry with the provided key."""
+
+        import hashlib
+
+        name = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self._directory, name + ".pickle")
+
+    @staticmethod
+    def _hash_file(file_path: str, pointer: typing.Optional[str]) -> str:
+        """Computes the SHA-256 hash of the content of the provided file, or of the value that ``pointer`` refers to.
+
+        If the addressed value cannot be found, e.g., because the file is not valid JSON, then the whole file is hashed.
+        """
+
+        import hashlib
+        import mmap
+
+        file_hash = hashlib.sha256()
+        with open(file_path, "rb") as f:
+
+            # hash the addressed value only, if there is a pointer
+            if pointer is not None and os.fstat(f.fileno()).st_size > 0:
+                try:
+                    if archives.is_compressed(file_path):
+                        data = archives.read_file(file_path)
+                        start, end = json_pointer.locate(data, pointer)
+                        file_hash.update(data[start:end])
+                    else:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                            start, end = json_pointer.locate(data, pointer)
+                            file_hash.update(data[start:end])
+                    return file_hash.hexdigest()
+                except (KeyError, ValueError):  # -> the value does not exist, or the file is invalid
+                    pass
+
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                file_hash.update(chunk)
+
+        return file_hash.hexdigest()
+
+    def _load_from_disk(self, key: tuple) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        """Loads the cache entry with the provided key from the cache directory, or returns ``None``, if there is none.
+
+        Entries that are not trusted (cf. :func:`disk_cache.open_trusted_file`) are treated as missing.
+        """
+
+        import pickle
+
+        # any cache entry that cannot be loaded is treated as missing
+        try:
+            with disk_cache.open_trusted_file(self._get_entry_path(key)) as f:
+                entry_key, parsed_args = pickle.load(f)
+        except Exception:
+            return None
+
+        return parsed_args if entry_key == key else None
+
+    def _put(self, key: tuple, parsed_args: typing.Dict[str, typing.Any]) -> None:
+        """Adds an entry to the memory, and evicts the least recently used one, if necessary.
+
+        This method must be invoked while holding the lock.
+        """
+
+        self._entries[key] = parsed_args
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def _store_on_disk(self, key: tuple, parsed_args: typing.Dict[str, typing.Any]) -> None:
+        """Stores a cache entry in the cache directory, and ignores any errors that occur while doing so."""
+
+        try:
+            disk_cache.write_pickle(self._get_entry_path(key), (key, parsed_args))
+        except Exception:
+            pass
+
+    def cache_info(self) -> spec_cache.CacheInfo:
+        """Summarizes the current state of the cache.
+
+        Returns:
+            :class:`spec_cache.CacheInfo`: The numbers of hits and misses so far, and the number of entries in memory.
+        """
+
+        with self._lock:
+            return spec_cache.CacheInfo(self._hits, self._misses, len(self._entries))
+
+    def clear(self) -> None:
+        """Removes all entries from memory, and resets the counters of hits and misses.
+
+        Entries in the cache directory are not removed, since they may be used by other processes.
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def create_key(self, compiled: compiled_parser.CompiledParser, file_path: str) -> typing.Optional[tuple]:
+        """Creates the key of the cache entry for parsing the provided file with the provided parser.
+
+        Args:
+            compiled (:class:`compiled_parser.CompiledParser`): The parser that is used for parsing the file.
+            file_path (str): The path of the file, which may be followed by a JSON pointer.
+
+        Returns:
+            tuple: The key, or ``None``, if the file cannot be accessed.
+        """
+
+        path, pointer = json_pointer.split_path(str(file_path))
+        try:
+            stat = os.stat(path)
+            content_hash = self._hash_file(path, pointer) if self._hash_contents else None
+        except OSError:
+            return None
+
+        return (
+                argmagiq.__version__,
+                compiled.fingerprint,
+                os.path.realpath(path),
+                pointer,
+                stat.st_size,
+                stat.st_mtime_ns,
+                content_hash
+        )
+
+    def load(self, key: typing.Optional[tuple]) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        """Retrieves the parsed configuration with the provided key from the cache.
+
+        Args:
+            key (tuple): A key created by :meth:`create_key`.
+
+        Returns:
+            dict: A copy of the cached configuration, or ``None``, if there is no such entry (or ``key`` is ``None``).
+        """
+
+        if key is None:
+            return None
+
+        # check whether the entry is kept in memory
+        with self._lock:
+            parsed_args = self._entries.get(key)
+            if parsed_args is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return dict(parsed_args)
+
+        # check whether the entry is stored on disk -> this happens without holding the lock
+        if self._directory is not None:
+            parsed_args = self._load_from_disk(key)
+
+        with self._lock:
+            if parsed_args is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._put(key, parsed_args)
+
+        return dict(parsed_args)
+
+    def store(self, key: typing.Optional[tuple], parsed_args: typing.Dict[str, typing.Any]) -> None:
+        """Adds a parsed configuration to the cache.
+
+        Errors that occur while writing the entry to the cache directory, e.g., because the directory is not writable
+        or the configuration cannot be pickled, are ignored.
+
+        Args:
+            key (tuple): A key created by :meth:`create_key` before the file has been read. If this is ``None``, then
+                nothing is stored.
+            parsed_args (dict): The parsed configuration.
+        """
+
+        if key is None:
+            return
+
+        parsed_args = dict(parsed_args)
+        with self._lock:
+            self._put(key, parsed_args)
+        if self._directory is not None:
+            self._store_on_disk(key, parsed_args)
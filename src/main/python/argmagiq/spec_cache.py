@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import collections
+import threading
+import typing
+import weakref
+
+import insanity
+
+import argmagiq.compiled_parser as compiled_parser
+import argmagiq.config_spec as config_spec
+import argmagiq.parsers.parser_registry as parser_registry
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+CacheInfo = collections.namedtuple("CacheInfo", ["hits", "misses", "size"])
+"""A summary of the state of a :class:`SpecCache`."""
+
+
+class SpecCache(object):
+    """A thread-safe cache of the :class:`config_spec.ConfigSpec`\\ s that have been created for configuration classes,
+    as well as the :class:`compiled_parser.CompiledParser`\\ s for the same.
+
+    Specs are keyed by the module and qualified name of the configuration class, and are only served for the very class
+    object that they have been created for. Therefore, a class that is redefined (e.g., because the module that defines
+    it has been reloaded) causes the stale entry to be replaced. Furthermore, the cache does not keep configuration
+    classes alive, i.e., entries are removed as soon as their class is garbage collected.
+
+    Specs and parsers are created without holding the lock that guards the cache, which means that classes are
+    inspected concurrently, as long as they are different. Nevertheless, every class is inspected only once.
+
+    Notice that cached specs are shared among all callers, and must not be modified. Furthermore, the counters of hits
+    and misses account for lookups of specs only. Cached parsers are recreated whenever the parsers registered in
+    :attr:`parser_registry.REGISTRY` change.
+    """
+
+    #  CONSTRUCTOR  ####################################################################################################
+
+    def __init__(self):
+        """Creates a new empty ``SpecCache``."""
+
+        self._build_locks = collections.defaultdict(threading.Lock)  # -> serialize creating entries per class only
+        self._entries = {}  # -> maps (module, qualname) to lists [weak ref to class, spec, parser, registry version]
+        self._hits = 0
+        self._lock = threading.RLock()  # -> reentrant, since weakref callbacks may be invoked while holding the lock
+        self._misses = 0
+
+    #  MAGIC FUNCTIONS  ################################################################################################
+
+    def __len__(self) -> int:
+
+        return len(self._entries)
+
+    #  PROPERTIES  #####################################################################################################
+
+    @property
+    def hits(self) -> int:
+        """int: The number of lookups that have been answered from the cache."""
+
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """int: The number of lookups that required creating a new spec."""
+
+        return self._misses
+
+    #  METHODS  ########################################################################################################
+
+    def _get_entry(self, config_cls: type) -> list:
+        """Retrieves the cache entry of the provided configuration class, and creates it, if necessary.
+
+        This method must not be invoked while holding the lock.
+        """
+
+        key = config_cls.__module__, config_cls.__qualname__
+
+        # check whether there is a cached spec for the very same class
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0]() is config_cls:
+                self._hits += 1
+                return entry
+            build_lock = self._build_locks[key]
+
+        with build_lock:
+
+            # check again, since the entry may have been created while waiting for the build lock
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0]() is config_cls:
+                    self._hits += 1
+                    return entry
+
+            # create the spec -> this happens while holding the build lock only, which ensures that every class is
+            #    inspected once without blocking lookups of other classes
+            spec = config_spec.ConfigSpec.create_from(config_cls)
+            entry = [weakref.ref(config_cls, lambda ref: self._remove(key, ref)), spec, None, None]
+            with self._lock:
+                self._misses += 1
+                self._entries[key] = entry
+
+        return entry
+
+    def _remove(self, key: typing.Tuple[str, str], ref: weakref.ref) -> None:
+        """Removes the entry with the provided key, if it still refers to the provided (dead) class reference."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is ref:
+                del self._entries[key]
+
+    def cache_info(self) -> CacheInfo:
+        """Summarizes the current state of the cache.
+
+        Returns:
+            :class:`CacheInfo`: The numbers of hits and misses so far, and the number of cached specs.
+        """
+
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, len(self._entries))
+
+    def clear(self) -> None:
+        """Removes all cached specs, and resets the counters of hits and misses."""
+
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def get(self, config_cls: type) -> config_spec.ConfigSpec:
+        """Retrieves the spec of the provided configuration class, and creates it, if it is not cached yet.
+
+        Args:
+            config_cls (type): The configuration class to retrieve the spec for.
+
+        Returns:
+            :class:`config_spec.ConfigSpec`: The spec, as created by :meth:`config_spec.ConfigSpec.create_from`.
+        """
+
+        insanity.sanitize_type("config_cls", config_cls, type)
+
+        return self._get_entry(config_cls)[1]
+
+    def get_compiled(self, config_cls: type) -> compiled_parser.CompiledParser:
+        """Retrieves a :class:`compiled_parser.CompiledParser` for the provided configuration class, and creates it, if
+        it is not cached yet.
+
+        Args:
+            config_cls (type): The configuration class to retrieve the parser for.
+
+        Returns:
+            :class:`compiled_parser.CompiledParser`: The parser, which is based on the spec retrieved by :meth:`get`.
+        """
+
+        insanity.sanitize_type("config_cls", config_cls, type)
+
+        entry = self._get_entry(config_cls)
+        key = config_cls.__module__, config_cls.__qualname__
+
+        # (re)create the parser, if there is none or the registered parsers have changed since it has been created
+        with self._lock:
+            if entry[2] is not None and entry[3] == parser_registry.REGISTRY.version:
+                return entry[2]
+            build_lock = self._build_locks[key]
+
+        with build_lock:
+
+            # check again, since the parser may have been created while waiting for the build lock
+            version = parser_registry.REGISTRY.version
+            with self._lock:
+                if entry[2] is not None and entry[3] == version:
+                    return entry[2]
+
+            parser = compiled_parser.CompiledParser(entry[1])
+            with self._lock:
+                entry[2], entry[3] = parser, version
+
+        return parser
+
+
+SPEC_CACHE = SpecCache()
+"""SpecCache: The process-wide cache that is used by :class:`argmagiq.magiq_parser.MagiqParser`."""
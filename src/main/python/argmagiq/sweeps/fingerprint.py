@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+"""This module provides stable fingerprints of configurations, which identify them across processes and machines."""
+
+
+import hashlib
+import json
+import typing
+
+import argmagiq.spec_cache as spec_cache
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+def fingerprint_config(config: typing.Any) -> str:
+    """Computes the fingerprint of a configuration object, i.e., of all of its values.
+
+    Args:
+        config: The configuration object, whose class is a configuration class.
+
+    Returns:
+        str: The fingerprint, as computed by :func:`fingerprint_values`.
+    """
+
+    spec = spec_cache.SPEC_CACHE.get(type(config))
+
+    return fingerprint_values({value.name: getattr(config, value.name) for value in spec})
+
+
+def fingerprint_values(values: typing.Mapping[str, typing.Any]) -> str:
+    """Computes the fingerprint of the values of a configuration.
+
+    The fingerprint is the SHA-256 hash of the values' JSON representation with sorted keys, which is why it does not
+    depend on the process or the machine that it is computed on (unlike Python's built-in ``hash`` of strings). Values
+    that cannot be represented as JSON are represented by their ``repr``, which therefore has to be stable as well.
+
+    Args:
+        values (mapping[str, any]): Maps names of configuration values to the values.
+
+    Returns:
+        str: The fingerprint, as a hexadecimal string.
+    """
+
+    data = json.dumps(values, sort_keys=True, separators=(",", ":"), default=repr)
+
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import collections.abc
+import functools
+import itertools
+import math
+import operator
+import os
+import typing
+
+import insanity
+
+import argmagiq.archives as archives
+import argmagiq.json_backend as json_backend
+import argmagiq.magiq_parser as magiq_parser
+import argmagiq.parsers.data_type_parser as data_type_parser
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+RANGE_KEY = "range"
+"""str: The key of sweep values that describe ranges, e.g., ``{"range": [0, 10, 2]}``."""
+
+
+class GridSweep(object):
+    """A sweep over all combinations of alternative values for the configuration values of a configuration class.
+
+    A ``GridSweep`` is described by a dictionary, e.g., loaded from a JSON file, that maps names of configuration values
+    to one of the following:
+
+    * a list of alternative values, e.g., ``[0.1, 0.01]``,
+    * a range of numbers, e.g., ``{"range": [0, 10, 2]}``, which specifies ``start``, ``stop``, and, optionally,
+      ``step`` (``1`` by default) just like Python's :class:`range`, except that floats are allowed as well, or
+    * a single value, which is used in all configurations.
+
+    Configuration values that are not part of the sweep take their default values. Every alternative value is parsed
+    and validated exactly once, when the ``GridSweep`` is created, by means of the parser of the according
+    configuration value (cf. :meth:`data_type_parser.DataTypeParser.parse_json`). Configurations, in contrast, are
+    created lazily, i.e., only the alternatives for each value are stored, but not their combinations.
+    """
+
+    #  CONSTRUCTOR  ####################################################################################################
+
+    def __init__(self, spec: type, sweep: typing.Mapping[str, typing.Any]):
+        """Creates a new ``GridSweep``.
+
+        Args:
+            spec (type): The configuration class to create configurations of.
+            sweep (mapping[str, any]): Describes the sweep, as explained above.
+
+        Raises:
+            ValueError: If ``sweep`` contains unknown or invalid values, or if it is missing any required value.
+        """
+
+        # sanitize args
+        insanity.sanitize_type("spec", spec, type)
+        insanity.sanitize_type("sweep", sweep, collections.abc.Mapping)
+
+        self._parser = magiq_parser.MagiqParser(spec)
+
+        # parse the alternatives for all configuration values in the sweep
+        parsers_by_name = self._parser.compiled.parsers_by_name
+        axes = []
+        for name, sweep_value in sweep.items():
+
+            field_parser = parsers_by_name.get(name)
+            if field_parser is None:
+                raise ValueError(f"Unknown option: '{name}'")
+            axes.append(self._parse_alternatives(field_parser, sweep_value))
+
+        # ensure that all required values are part of the sweep
+        missing_names = self._parser.compiled.required_names - set(sweep)
+        if missing_names:
+            raise ValueError(f"Missing required option: '{min(missing_names)}'")
+
+        self._axes = tuple(axes)
+        self._names = tuple(sweep)
+
+    #  MAGIC FUNCTIONS  ################################################################################################
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+
+        for values in self.iter_values():
+            yield self._parser.create_config(values)
+
+    def __len__(self) -> int:
+
+        return functools.reduce(operator.mul, (len(axis) for axis in self._axes), 1)
+
+    #  PROPERTIES  #####################################################################################################
+
+    @property
+    def alternatives(self) -> typing.Dict[str, typing.Tuple[typing.Any, ...]]:
+        """dict[str, tuple]: Maps the names of all configuration values in the sweep to their (parsed) alternatives."""
+
+        return dict(zip(self._names, self._axes))
+
+    @property
+    def parser(self) -> magiq_parser.MagiqParser:
+        """:class:`magiq_parser.MagiqParser`: The parser that is used for creating configurations."""
+
+        return self._parser
+
+    #  METHODS  ########################################################################################################
+
+    @staticmethod
+    def _expand_range(name: str, range_args: typing.Any) -> typing.Sequence[typing.Union[int, float]]:
+        """Expands a range of numbers, as described by the args of a ``{"range": [...]}`` sweep value."""
+
+        if (
+                not isinstance(range_args, list) or
+                not 2 <= len(range_args) <= 3 or
+                not all(isinstance(x, (int, float)) and not isinstance(x, bool) for x in range_args)
+        ):
+            raise ValueError(f"Invalid range for option '{name}': {range_args}")
+
+        start, stop, step = (range_args + [1])[:3]
+        if step == 0:
+            raise ValueError(f"The step of the range for option '{name}' must not be 0")
+
+        # ranges of ints are expanded lazily
+        if all(isinstance(x, int) for x in range_args):
+            return range(start, stop, step)
+
+        # the number of values is rounded to avoid including the end of the range due to floating point errors
+        num_values = max(0, math.ceil(round((stop - start) / step, 9)))
+        return [start + idx * step for idx in range(num_values)]
+
+    @classmethod
+    def _parse_alternatives(
+            cls,
+            field_parser: data_type_parser.DataTypeParser,
+            sweep_value: typing.Any
+    ) -> typing.Tuple[typing.Any, ...]:
+        """Parses the alternatives for a single configuration value of a sweep.
+
+        Every distinct alternative is parsed only once, even if it occurs repeatedly.
+        """
+
+        name = field_parser.spec.name
+
+        # determine the alternatives to parse
+        if isinstance(sweep_value, list):
+            alternatives = sweep_value
+        elif isinstance(sweep_value, dict):
+            if set(sweep_value) != {RANGE_KEY}:
+                raise ValueError(f"Invalid sweep value for option '{name}': {sweep_value}")
+            alternatives = cls._expand_range(name, sweep_value[RANGE_KEY])
+        else:
+            alternatives = [sweep_value]
+
+        if len(alternatives) == 0:
+            raise ValueError(f"No alternatives for option '{name}'")
+
+        # parse all alternatives -> the type is part of the key, since, e.g., 1 == 1.0 == True
+        parsed_values = {}
+        parsed_alternatives = []
+        for value in alternatives:
+
+            try:
+                key = (type(value), value)
+                hash(key)
+            except TypeError:  # -> unhashable values are parsed every time
+                key = None
+
+            if key is None:
+                parsed_alternatives.append(field_parser.parse_json(value))
+            else:
+                if key not in parsed_values:
+                    parsed_values[key] = field_parser.parse_json(value)
+                parsed_alternatives.append(parsed_values[key])
+
+        return tuple(parsed_alternatives)
+
+    @classmethod
+    def from_file(cls, spec: type, file_path: str) -> "GridSweep":
+        """Creates a ``GridSweep`` that is described by a JSON file.
+
+        Args:
+            spec (type): The configuration class to create configurations of.
+            file_path (str): The path of the JSON file that describes the sweep, which may be compressed (cf.
+                :data:`archives.COMPRESSIONS`).
+
+        Returns:
+            :class:`GridSweep`: The created sweep.
+
+        Raises:
+            ValueError: If the file does not exist, is not a valid JSON file, or does not describe a valid sweep.
+        """
+
+        if not os.path.isfile(file_path):
+            raise ValueError(f"Sweep file not found: '{file_path}'")
+
+        try:
+            sweep = json_backend.get_backend().loads(archives.read_file(file_path))
+        except json_backend.JsonDecodeError:
+            raise ValueError(f"The specified sweep file is not a valid JSON file: '{file_path}'")
+        if not isinstance(sweep, dict):
+            raise ValueError(f"The specified sweep file does not describe a dictionary of sweep values: '{file_path}'")
+
+        return cls(spec, sweep)
+
+    def iter_values(self) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+        """Iterates over the (parsed) values of all configurations in the sweep without creating configuration objects.
+
+        Yields:
+            dict: The values of the next configuration, which may be turned into a configuration object by means of
+            :meth:`magiq_parser.MagiqParser.create_config`.
+        """
+
+        for values in itertools.product(*self._axes):
+            yield dict(zip(self._names, values))
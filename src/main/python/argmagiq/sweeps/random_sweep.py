@@ -0,0 +1,364 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import collections.abc
+import math
+import typing
+
+import insanity
+
+import argmagiq.magiq_parser as magiq_parser
+import argmagiq.parsers.data_type_parser as data_type_parser
+
+try:
+    import numpy as np
+except ImportError:  # -> NumPy is an optional dependency, which is needed for random sweeps only
+    np = None
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+DISTRIBUTIONS = ("choice", "loguniform", "randint", "uniform")
+"""tuple[str]: The names of all distributions that values may be sampled from."""
+
+METHODS = ("halton", "random", "sobol")
+"""tuple[str]: The names of all methods that may be used for sampling points in the unit cube."""
+
+
+class RandomSweep(object):
+    """A sweep over configurations whose values are sampled at random or from a low-discrepancy sequence.
+
+    A ``RandomSweep`` is described by a dictionary that maps names of configuration values to one of the following:
+
+    * ``{"uniform": [low, high]}`` for floats that are sampled uniformly from ``[low, high)``,
+    * ``{"loguniform": [low, high]}`` for floats whose logarithm is sampled uniformly, where ``0 < low``,
+    * ``{"randint": [low, high]}`` for ints that are sampled uniformly from ``low, ..., high - 1``,
+    * ``{"choice": [...]}`` or simply a list for values that are chosen uniformly from the provided alternatives, or
+    * a single value, which is used in all configurations.
+
+    Samples are created in batches by transforming points in the unit cube, which has one dimension per sampled
+    configuration value. These points are drawn from NumPy's default random number generator, or from a Halton or a
+    Sobol sequence (the latter requires SciPy). Both the generator and the sequences are seeded deterministically, i.e.,
+    the same ``seed`` always yields the same configurations, independently of the ``batch_size``.
+
+    Bounds and alternatives are parsed and validated once, when the ``RandomSweep`` is created, and batches of samples
+    are NumPy arrays (cf. :meth:`iter_batches`). Configuration objects are created on demand only, when the sweep is
+    iterated over.
+
+    A ``RandomSweep`` requires NumPy, which is an optional dependency of ``argmagiq``.
+    """
+
+    #  CONSTRUCTOR  ####################################################################################################
+
+    def __init__(
+            self,
+            spec: type,
+            distributions: typing.Mapping[str, typing.Any],
+            num_samples: int,
+            seed: int = 0,
+            method: str = "random",
+            batch_size: int = 4096
+    ):
+        """Creates a new ``RandomSweep``.
+
+        Args:
+            spec (type): The configuration class to create configurations of.
+            distributions (mapping[str, any]): Describes the distributions of the sampled values, as explained above.
+            num_samples (int): The number of configurations to sample.
+            seed (int, optional): The seed that is used for sampling.
+            method (str, optional): The method used for sampling points in the unit cube, which is one of
+                :data:`METHODS`.
+            batch_size (int, optional): The number of samples that are drawn at once.
+
+        Raises:
+            ImportError: If NumPy is not installed, or if ``method`` is ``"sobol"`` and SciPy is not installed.
+            ValueError: If ``distributions`` contains unknown or invalid values, or if it is missing any required value.
+        """
+
+        if np is None:
+            raise ImportError("Random sweeps require NumPy, which can be installed via 'pip install argmagiq[sweeps]'")
+
+        # sanitize args
+        insanity.sanitize_type("spec", spec, type)
+        insanity.sanitize_type("distributions", distributions, collections.abc.Mapping)
+        insanity.sanitize_type("num_samples", num_samples, int)
+        insanity.sanitize_range("num_samples", num_samples, minimum=0)
+        insanity.sanitize_type("seed", seed, int)
+        insanity.sanitize_range("seed", seed, minimum=0)
+        method = str(method)
+        if method not in METHODS:
+            raise ValueError(f"Unknown sampling method: '{method}'")
+        if method == "sobol":
+            import scipy.stats.qmc  # -> fail early, if SciPy is not installed
+        insanity.sanitize_type("batch_size", batch_size, int)
+        insanity.sanitize_range("batch_size", batch_size, minimum=1)
+
+        self._batch_size = batch_size
+        self._method = method
+        self._num_samples = num_samples
+        self._parser = magiq_parser.MagiqParser(spec)
+        self._seed = seed
+
+        # parse the distributions of all configuration values
+        parsers_by_name = self._parser.compiled.parsers_by_name
+        self._dimensions = []  # -> (name, distribution, parsed args) for all sampled values
+        self._fixed_values = {}
+        for name, distribution in distributions.items():
+
+            field_parser = parsers_by_name.get(name)
+            if field_parser is None:
+                raise ValueError(f"Unknown option: '{name}'")
+
+            # determine the distribution and its args
+            if isinstance(distribution, list):
+                distribution = {"choice": distribution}
+            if not isinstance(distribution, dict):
+                self._fixed_values[name] = field_parser.parse_json(distribution)
+                continue
+            if len(distribution) != 1 or next(iter(distribution)) not in DISTRIBUTIONS:
+                raise ValueError(f"Invalid distribution for option '{name}': {distribution}")
+            distribution, args = next(iter(distribution.items()))
+
+            self._dimensions.append((name, distribution, self._parse_args(field_parser, distribution, args)))
+
+        # ensure that all required values are part of the sweep
+        missing_names = self._parser.compiled.required_names - set(distributions)
+        if missing_names:
+            raise ValueError(f"Missing required option: '{min(missing_names)}'")
+
+    #  MAGIC FUNCTIONS  ################################################################################################
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+
+        for values in self.iter_values():
+            yield self._parser.create_config(values)
+
+    def __len__(self) -> int:
+
+        return self._num_samples
+
+    #  PROPERTIES  #####################################################################################################
+
+    @property
+    def fixed_values(self) -> typing.Dict[str, typing.Any]:
+        """dict[str, any]: The (parsed) values that are used in all configurations of the sweep."""
+
+        return dict(self._fixed_values)
+
+    @property
+    def method(self) -> str:
+        """str: The method used for sampling points in the unit cube."""
+
+        return self._method
+
+    @property
+    def parser(self) -> magiq_parser.MagiqParser:
+        """:class:`magiq_parser.MagiqParser`: The parser that is used for creating configurations."""
+
+        return self._parser
+
+    @property
+    def seed(self) -> int:
+        """int: The seed that is used for sampling."""
+
+        return self._seed
+
+    #  METHODS  ########################################################################################################
+
+    def _create_point_sampler(self) -> typing.Callable[[int], "np.ndarray"]:
+        """Creates a function that samples the next points in the unit cube, and returns them as an array of shape
+        ``(num_points, num_dimensions)``.
+        """
+
+        num_dimensions = len(self._dimensions)
+
+        if self._method == "random":
+
+            rng = np.random.default_rng(self._seed)
+            return lambda num_points: rng.random((num_points, num_dimensions))
+
+        elif self._method == "halton":
+
+            # the sequence is randomized by a random shift modulo 1 (a.k.a. a Cranley-Patterson rotation)
+            bases = _first_primes(num_dimensions)
+            shift = np.random.default_rng(self._seed).random(num_dimensions)
+            next_index = 0
+
+            def _sample_halton(num_points: int) -> np.ndarray:
+                nonlocal next_index
+                indices = np.arange(next_index, next_index + num_points, dtype=np.int64)
+                next_index += num_points
+                points = np.empty((num_points, num_dimensions))
+                for dim, base in enumerate(bases):
+                    points[:, dim] = _radical_inverse(indices, base)
+                return np.mod(points + shift, 1.0)
+
+            return _sample_halton
+
+        else:  # -> sobol
+
+            import warnings
+
+            import scipy.stats.qmc
+
+            engine = scipy.stats.qmc.Sobol(num_dimensions, scramble=True, seed=self._seed)
+
+            def _sample_sobol(num_points: int) -> np.ndarray:
+                with warnings.catch_warnings():  # -> SciPy warns if the number of points is not a power of 2
+                    warnings.simplefilter("ignore", UserWarning)
+                    return engine.random(num_points)
+
+            return _sample_sobol
+
+    @staticmethod
+    def _parse_args(field_parser: data_type_parser.DataTypeParser, distribution: str, args: typing.Any) -> typing.Any:
+        """Parses and validates the args of the distribution of a single configuration value."""
+
+        name = field_parser.spec.name
+        data_type = field_parser.spec.data_type
+
+        # the alternatives of categorical distributions are stored in an object array to preserve their types
+        if distribution == "choice":
+            if not isinstance(args, list) or len(args) == 0:
+                raise ValueError(f"Invalid alternatives for option '{name}': {args}")
+            alternatives = np.empty(len(args), dtype=object)
+            alternatives[:] = [field_parser.parse_json(x) for x in args]
+            return alternatives
+
+        # all other distributions are specified by their bounds
+        if distribution == "randint" and data_type is not int:
+            raise ValueError(f"Only int options can be sampled from a 'randint' distribution: '{name}'")
+        if distribution != "randint" and data_type is not float:
+            raise ValueError(f"Only float options can be sampled from a '{distribution}' distribution: '{name}'")
+        if not isinstance(args, list) or len(args) != 2:
+            raise ValueError(f"Invalid bounds for option '{name}': {args}")
+        low, high = (field_parser.parse_json(x) for x in args)
+        if not low < high or (distribution == "loguniform" and low <= 0):
+            raise ValueError(f"Invalid bounds for option '{name}': {args}")
+
+        return (math.log(low), math.log(high)) if distribution == "loguniform" else (low, high)
+
+    @staticmethod
+    def _transform(distribution: str, args: typing.Any, points: "np.ndarray") -> "np.ndarray":
+        """Transforms points from the unit interval into samples of the provided distribution."""
+
+        if distribution == "choice":
+            indices = np.minimum((points * len(args)).astype(np.int64), len(args) - 1)
+            return args[indices]
+
+        low, high = args
+        if distribution == "uniform":
+            return low + points * (high - low)
+        elif distribution == "loguniform":
+            return np.exp(low + points * (high - low))
+        else:  # -> randint
+            return np.minimum(low + np.floor(points * (high - low)).astype(np.int64), high - 1)
+
+    def iter_batches(self) -> typing.Iterator[typing.Dict[str, "np.ndarray"]]:
+        """Samples the values of all configurations in batches.
+
+        Yields:
+            dict[str, numpy.ndarray]: Maps the names of all sampled configuration values to arrays of at most
+            ``batch_size`` samples. Values that are the same in all configurations are not included (cf.
+            :attr:`fixed_values`).
+        """
+
+        sample_points = self._create_point_sampler()
+        for batch_start in range(0, self._num_samples, self._batch_size):
+
+            points = sample_points(min(self._batch_size, self._num_samples - batch_start))
+            yield {
+                    name: self._transform(distribution, args, points[:, dim])
+                    for dim, (name, distribution, args) in enumerate(self._dimensions)
+            }
+
+    def iter_values(self) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+        """Iterates over the values of all configurations in the sweep without creating configuration objects.
+
+        Yields:
+            dict: The values of the next configuration, as Python objects (rather than NumPy scalars), which may be
+            turned into a configuration object by means of :meth:`magiq_parser.MagiqParser.create_config`.
+        """
+
+        names = [name for name, _, _ in self._dimensions]
+
+        # if all values are fixed, then batches are empty, but the sweep still consists of num_samples configurations
+        if not names:
+            for _ in range(self._num_samples):
+                yield dict(self._fixed_values)
+            return
+
+        for batch in self.iter_batches():
+
+            columns = [batch[name].tolist() for name in names]
+            for row in zip(*columns):
+                values = dict(self._fixed_values)
+                values.update(zip(names, row))
+                yield values
+
+
+def _first_primes(count: int) -> typing.List[int]:
+    """Computes the first ``count`` prime numbers."""
+
+    primes = []
+    candidate = 2
+    while len(primes) < count:
+        if all(candidate % p != 0 for p in primes if p * p <= candidate):
+            primes.append(candidate)
+        candidate += 1
+
+    return primes
+
+
+def _radical_inverse(indices: "np.ndarray", base: int) -> "np.ndarray":
+    """Computes the radical inverses of the provided indices in the provided base (i.e., one dimension of the Halton
+    sequence) for all indices at once.
+    """
+
+    result = np.zeros(len(indices))
+    remaining = indices.copy()
+    factor = 1.0 / base
+    while np.any(remaining > 0):
+        result += factor * (remaining % base)
+        remaining //= base
+        factor /= base
+
+    return result
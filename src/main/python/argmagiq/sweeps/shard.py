@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import os
+import sys
+import typing
+
+import insanity
+
+import argmagiq.config_spec as config_spec
+import argmagiq.sweeps.fingerprint as fingerprint
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+SHARD_COUNT_ENV_VAR = "ARGMAGIQ_SHARD_COUNT"
+"""str: The environment variable that specifies the number of shards, if it is not provided as command-line arg."""
+
+SHARD_COUNT_OPTION = "--shard-count"
+"""str: The reserved command-line option that specifies the number of shards."""
+
+SHARD_INDEX_ENV_VAR = "ARGMAGIQ_SHARD_INDEX"
+"""str: The environment variable that specifies the index of the shard, if it is not provided as command-line arg."""
+
+SHARD_INDEX_OPTION = "--shard-index"
+"""str: The reserved command-line option that specifies the index of the shard."""
+
+
+class Shard(object):
+    """One of several disjoint parts of a sweep, which allows for running a sweep on multiple machines.
+
+    Every configuration is assigned to a shard based on its fingerprint (cf. :mod:`fingerprint`), which is the same on
+    every machine. Therefore, each machine can select the configurations of its own shard independently, without any
+    coordination among machines or splitting of sweep files. For sweeps (i.e., objects that provide ``iter_values`` and
+    ``parser``, like :class:`GridSweep` and :class:`RandomSweep`), this happens before configuration objects are
+    created, which means that configurations of other shards are skipped at the cost of computing their fingerprints.
+    """
+
+    #  CONSTRUCTOR  ####################################################################################################
+
+    def __init__(self, index: int, count: int):
+        """Creates a new ``Shard``.
+
+        Args:
+            index (int): The index of the shard, which is in ``0, ..., count - 1``.
+            count (int): The total number of shards.
+        """
+
+        # sanitize args
+        insanity.sanitize_type("count", count, int)
+        insanity.sanitize_range("count", count, minimum=1)
+        insanity.sanitize_type("index", index, int)
+        insanity.sanitize_range("index", index, minimum=0, maximum=count, max_inclusive=False)
+
+        self._count = count
+        self._index = index
+
+    #  MAGIC FUNCTIONS  ################################################################################################
+
+    def __eq__(self, other: typing.Any) -> bool:
+
+        return isinstance(other, Shard) and (self._index, self._count) == (other._index, other._count)
+
+    def __repr__(self) -> str:
+
+        return f"Shard(index={self._index}, count={self._count})"
+
+    #  PROPERTIES  #####################################################################################################
+
+    @property
+    def count(self) -> int:
+        """int: The total number of shards."""
+
+        return self._count
+
+    @property
+    def index(self) -> int:
+        """int: The index of the shard."""
+
+        return self._index
+
+    #  METHODS  ########################################################################################################
+
+    def _owns(self, config_fingerprint: str) -> bool:
+        """Determines whether the configuration with the provided fingerprint belongs to the shard."""
+
+        return self._count == 1 or int(config_fingerprint[:16], 16) % self._count == self._index
+
+    @classmethod
+    def from_argv(cls, argv: typing.Sequence[str] = None) -> typing.Tuple["Shard", typing.List[str]]:
+        """Creates a ``Shard`` from the reserved options :data:`SHARD_INDEX_OPTION` and :data:`SHARD_COUNT_OPTION`.
+
+        The reserved options may be provided as ``--shard-index 2`` or as ``--shard-index=2``, and are removed from the
+        command-line args, such that the remaining args can be parsed as usual. Since ``--`` introduces the path of a
+        file (or any other value), the args are scanned up to the first ``--`` only, i.e., the reserved options have to
+        precede it, and everything from there on is kept as is. If they are not present, then the environment
+        variables :data:`SHARD_INDEX_ENV_VAR` and :data:`SHARD_COUNT_ENV_VAR` are used, and if these are not set
+        either, then the created shard is the only one (i.e., it contains all configurations).
+
+        Args:
+            argv (sequence[str], optional): The command-line args, which default to ``sys.argv[1:]``.
+
+        Returns:
+            tuple[:class:`Shard`, list[str]]: The shard and the remaining command-line args.
+
+        Raises:
+            ValueError: If only one of the index and count of the shard is specified, if either of them is missing its
+                value, or if either of them is invalid.
+        """
+
+        if argv is None:
+            argv = sys.argv[1:]
+
+        # extract the reserved options from the args
+        options = {SHARD_COUNT_OPTION: None, SHARD_INDEX_OPTION: None}
+        remaining_args = []
+        index = 0
+        while index < len(argv):
+            arg = argv[index]
+            if arg == "--":  # -> everything from here on may be a value, e.g., the path of a file
+                remaining_args.extend(argv[index:])
+                break
+            option, separator, value = arg.partition("=")
+            if option not in options:
+                remaining_args.append(arg)
+            elif separator:
+                if not value:
+                    raise ValueError(f"Missing value for option: '{option}'")
+                options[option] = value
+            elif index + 1 < len(argv):
+                index += 1
+                options[option] = argv[index]
+            else:
+                raise ValueError(f"Missing value for option: '{option}'")
+            index += 1
+
+        # fall back to environment variables
+        shard_index = options[SHARD_INDEX_OPTION]
+        shard_count = options[SHARD_COUNT_OPTION]
+        if shard_index is None and shard_count is None:
+            shard_index = os.environ.get(SHARD_INDEX_ENV_VAR) or None
+            shard_count = os.environ.get(SHARD_COUNT_ENV_VAR) or None
+        if shard_index is None and shard_count is None:
+            return cls(0, 1), remaining_args
+        if shard_index is None or shard_count is None:
+            raise ValueError(f"The options '{SHARD_INDEX_OPTION}' and '{SHARD_COUNT_OPTION}' have to be used together")
+
+        try:
+            return cls(int(shard_index), int(shard_count)), remaining_args
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid shard: index {shard_index} of {shard_count}")
+
+    def iter_configs(self, sweep: typing.Any) -> typing.Iterator[typing.Any]:
+        """Iterates over the configurations of a sweep that belong to the shard.
+
+        Args:
+            sweep: The sweep, e.g., a :class:`GridSweep` or a :class:`RandomSweep`.
+
+        Yields:
+            The configuration objects of the shard, which are created on demand.
+        """
+
+        for values in self.iter_values(sweep):
+            yield sweep.parser.create_config(values)
+
+    def iter_values(self, sweep: typing.Any) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+        """Iterates over the values of those configurations of a sweep that belong to the shard.
+
+        Args:
+            sweep: The sweep, e.g., a :class:`GridSweep` or a :class:`RandomSweep`.
+
+        Yields:
+            dict: The values of the next configuration of the shard.
+        """
+
+        spec = sweep.parser.compiled.spec
+        for values in sweep.iter_values():
+            if self.owns_values(values, spec=spec):
+                yield values
+
+    def owns_config(self, config: typing.Any) -> bool:
+        """Determines whether a configuration object belongs to the shard.
+
+        This is based on all values of the configuration, and thus agrees with :meth:`owns_values` if the latter is
+        provided with the spec of the configuration (as is the case for sweeps).
+
+        Args:
+            config: The configuration object.
+
+        Returns:
+            bool: ``True``, if the configuration belongs to the shard, and ``False`` otherwise.
+        """
+
+        return self._owns(fingerprint.fingerprint_config(config))
+
+    def owns_values(
+            self,
+            values: typing.Mapping[str, typing.Any],
+            spec: config_spec.ConfigSpec = None
+    ) -> bool:
+        """Determines whether the configuration with the provided values belongs to the shard.
+
+        If a ``spec`` is provided, then the default values of all configuration values that are missing from ``values``
+        are added before computing the fingerprint, which makes the result agree with :meth:`owns_config`. Otherwise,
+        the provided values are considered only.
+
+        Args:
+            values (mapping[str, any]): The values of the configuration, e.g., as provided by a sweep.
+            spec (:class:`config_spec.ConfigSpec`, optional): The spec of the configuration.
+
+        Returns:
+            bool: ``True``, if the configuration belongs to the shard, and ``False`` otherwise.
+        """
+
+        if spec is not None:
+            values = {**{value.name: value.default_value for value in spec}, **values}
+
+        return self._owns(fingerprint.fingerprint_values(values))
+
+    def select(self, configs: typing.Iterable[typing.Any]) -> typing.Iterator[typing.Any]:
+        """Filters an iterable of configuration objects (from any source) down to those that belong to the shard.
+
+        Args:
+            configs (iterable): The configuration objects.
+
+        Yields:
+            The configuration objects that belong to the shard.
+        """
+
+        for config in configs:
+            if self.owns_config(config):
+                yield config
@@ -0,0 +1,350 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import bisect
+import collections
+import concurrent.futures
+import heapq
+import itertools
+import json
+import math
+import os
+import pickle
+import sqlite3
+import typing
+
+import insanity
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+Trial = collections.namedtuple("Trial", ["config_id", "config", "rung", "budget", "score"])
+"""The result of evaluating a single config on one rung of a :class:`SuccessiveHalving` search."""
+
+
+class SuccessiveHalving(object):
+    """An asynchronous successive-halving (ASHA) search over the configurations of a sweep.
+
+    Every configuration of the sweep is evaluated with the smallest budget first (rung 0), and the best configurations
+    are promoted to larger budgets: a configuration is evaluated on rung ``k + 1``, with a budget that is
+    ``reduction_factor`` times as large as the one of rung ``k``, as soon as it is among the best
+    ``1 / reduction_factor`` of all configurations that have been evaluated on rung ``k`` so far. Promotions are
+    decided whenever a worker becomes available, which means that workers never wait for a rung to be completed.
+
+    Configurations are evaluated by a user-provided function ``run(config, budget) -> score`` in a pool of processes,
+    which is why both ``run`` and the configurations have to be picklable (i.e., defined at the top level of a module).
+    Scores that are ``NaN`` (e.g., because training diverged) are replaced with the worst possible score, i.e.,
+    ``inf`` if scores are minimized, and ``-inf`` otherwise.
+    Configurations are drawn from the sweep lazily, whenever a new one is started on rung 0, which means that the sweep
+    may be arbitrarily large.
+
+    The configurations of the search and all scores are stored in an SQLite database, and a search that was interrupted
+    (or failed, since exceptions raised by ``run`` are propagated) resumes where it left off when it is started again
+    with the same database. Only evaluations that were still running are repeated in this case, configurations that
+    have been started before are loaded from the database, and new ones are drawn from the sweep after skipping the
+    ones that were drawn already. Hence, the sweep has to produce the same configurations in the same order every time,
+    which is the case for grid sweeps and random sweeps with a fixed seed.
+    """
+
+    #  CONSTRUCTOR  ####################################################################################################
+
+    def __init__(
+            self,
+            sweep: typing.Any,
+            run: typing.Callable[[typing.Any, typing.Union[int, float]], float],
+            db_path: str,
+            min_budget: typing.Union[int, float] = 1,
+            max_budget: typing.Union[int, float] = 27,
+            reduction_factor: int = 3,
+            minimize: bool = False,
+            max_workers: int = None
+    ):
+        """Creates a new ``SuccessiveHalving`` search.
+
+        Args:
+            sweep: The sweep that samples the configurations to search over, i.e., a :class:`GridSweep` or a
+                :class:`RandomSweep`.
+            run (callable): The function that evaluates a configuration with a given budget, and returns its score.
+            db_path (str): The path of the SQLite database that stores the state of the search.
+            min_budget (int or float, optional): The budget of the lowest rung.
+            max_budget (int or float, optional): The maximum budget that any configuration is evaluated with.
+            reduction_factor (int, optional): The factor that budgets grow by from rung to rung, whose reciprocal is
+                the fraction of configurations that is promoted.
+            minimize (bool, optional): Indicates whether lower scores are better than higher ones.
+            max_workers (int, optional): The number of worker processes, which defaults to the number of CPUs.
+
+        Raises:
+            ValueError: If the database belongs to a search with different budgets.
+        """
+
+        # sanitize args
+        if not hasattr(sweep, "iter_values") or not hasattr(sweep, "parser"):
+            raise TypeError(f"<sweep> has to be a sweep, but is an object of type {type(sweep).__name__}")
+        if not callable(run):
+            raise TypeError("<run> has to be callable")
+        insanity.sanitize_type("db_path", db_path, str)
+        insanity.sanitize_type("min_budget", min_budget, (int, float))
+        insanity.sanitize_range("min_budget", min_budget, minimum=0, min_inclusive=False)
+        insanity.sanitize_type("max_budget", max_budget, (int, float))
+        insanity.sanitize_range("max_budget", max_budget, minimum=min_budget)
+        insanity.sanitize_type("reduction_factor", reduction_factor, int)
+        insanity.sanitize_range("reduction_factor", reduction_factor, minimum=2)
+        minimize = bool(minimize)
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        insanity.sanitize_type("max_workers", max_workers, int)
+        insanity.sanitize_range("max_workers", max_workers, minimum=1)
+
+        self._db_path = db_path
+        self._max_workers = max_workers
+        self._minimize = minimize
+        self._reduction_factor = reduction_factor
+        self._run = run
+        self._sweep = sweep
+
+        # compute the budgets of all rungs
+        self._budgets = [min_budget]
+        while self._budgets[-1] * reduction_factor <= max_budget:
+            self._budgets.append(self._budgets[-1] * reduction_factor)
+
+    #  PROPERTIES  #####################################################################################################
+
+    @property
+    def budgets(self) -> typing.List[typing.Union[int, float]]:
+        """list[int or float]: The budgets of all rungs of the search."""
+
+        return list(self._budgets)
+
+    @property
+    def db_path(self) -> str:
+        """str: The path of the SQLite database that stores the state of the search."""
+
+        return self._db_path
+
+    #  METHODS  ########################################################################################################
+
+    def _connect(self) -> sqlite3.Connection:
+        """Opens the database, and initializes or validates it."""
+
+        connection = sqlite3.connect(self._db_path)
+        connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+                CREATE TABLE IF NOT EXISTS configs (config_id INTEGER PRIMARY KEY, config_values BLOB NOT NULL);
+                CREATE TABLE IF NOT EXISTS trials (
+                        config_id INTEGER NOT NULL,
+                        rung INTEGER NOT NULL,
+                        score REAL NOT NULL,
+                        PRIMARY KEY (config_id, rung)
+                );
+                """
+        )
+
+        # ensure that a previous search, if any, was run with the same settings
+        settings = json.dumps({"budgets": self._budgets, "minimize": self._minimize})
+        row = connection.execute("SELECT value FROM settings WHERE key = 'search'").fetchone()
+        if row is None:
+            with connection:
+                connection.execute("INSERT INTO settings VALUES ('search', ?)", (settings,))
+        elif row[0] != settings:
+            connection.close()
+            raise ValueError(f"The database belongs to a search with different settings: '{self._db_path}'")
+
+        return connection
+
+    def _create_entry(self, config_id: int, score: float) -> typing.Tuple[float, int]:
+        """Creates the entry that represents a score in the ranking of a rung, where smaller entries are better."""
+
+        return score if self._minimize else -score, config_id
+
+    def _create_rankings(
+            self,
+            scores: typing.List[typing.Dict[int, float]]
+    ) -> typing.Tuple[typing.List[typing.List[tuple]], typing.List[typing.List[tuple]]]:
+        """Creates the rankings of all rungs as well as the candidates for promotion from the provided scores.
+
+        The ranking of a rung is a sorted list of the entries (cf. :meth:`_create_entry`) of all configs that have been
+        evaluated on the rung, and the candidates are a heap of the entries of those configs that have not been started
+        on the next rung yet.
+        """
+
+        rankings = [sorted(self._create_entry(c, s) for c, s in rung_scores.items()) for rung_scores in scores]
+        candidates = [
+                [entry for entry in ranking if rung + 1 < len(scores) and entry[1] not in scores[rung + 1]]
+                for rung, ranking in enumerate(rankings)
+        ]
+        for rung_candidates in candidates:
+            heapq.heapify(rung_candidates)
+
+        return rankings, candidates
+
+    def _find_promotion(
+            self,
+            rankings: typing.List[typing.List[tuple]],
+            candidates: typing.List[typing.List[tuple]]
+    ) -> typing.Optional[typing.Tuple[int, int]]:
+        """Determines the config ID and rung of the next promotion, if there is any, and removes it from the candidates.
+
+        Promotions to higher rungs take precedence. A config is promoted, if it is among the best ``1 /
+        reduction_factor`` of all configs on its rung, which has to be checked for the best candidate of each rung only.
+        """
+
+        for rung in reversed(range(len(self._budgets) - 1)):
+            if candidates[rung]:
+                best = candidates[rung][0]
+                if bisect.bisect_left(rankings[rung], best) < len(rankings[rung]) // self._reduction_factor:
+                    heapq.heappop(candidates[rung])
+                    return best[1], rung + 1
+
+        return None
+
+    def run(self) -> typing.List[Trial]:
+        """Runs (or resumes) the search until there are no more configurations to promote.
+
+        If ``run`` raises an exception, then no further evaluations are started, and the exception is propagated after
+        the scores of all evaluations that were running at the time have been stored.
+
+        Returns:
+            list[:class:`Trial`]: The highest-rung trial of each configuration, best configurations first.
+        """
+
+        connection = self._connect()
+        try:
+
+            # restore the configurations and scores of all trials that have been started/completed before
+            config_values = {
+                    config_id: pickle.loads(values)
+                    for config_id, values in connection.execute("SELECT config_id, config_values FROM configs")
+            }
+            scores = [{} for _ in self._budgets]
+            for config_id, rung, score in connection.execute("SELECT config_id, rung, score FROM trials"):
+                scores[rung][config_id] = score
+            rankings, candidates = self._create_rankings(scores)
+
+            # configs that have been sampled before, but were not evaluated on rung 0, are started first
+            unstarted = collections.deque(sorted(c for c in config_values if c not in scores[0]))
+            samples = itertools.islice(self._sweep.iter_values(), len(config_values), None)
+
+            # run trials until there is nothing left to do
+            error = None
+            with concurrent.futures.ProcessPoolExecutor(self._max_workers) as executor:
+
+                running = {}
+                while True:
+
+                    # keep all workers busy, unless a trial failed
+                    while error is None and len(running) < self._max_workers:
+
+                        # promotions take precedence over starting new configs on rung 0
+                        next_trial = self._find_promotion(rankings, candidates)
+                        if next_trial is None:
+
+                            if unstarted:
+                                config_id = unstarted.popleft()
+                            else:
+                                values = next(samples, None)
+                                if values is None:  # -> all configs of the sweep have been started
+                                    break
+                                config_id = len(config_values)
+                                config_values[config_id] = values
+                                with connection:
+                                    connection.execute(
+                                            "INSERT INTO configs VALUES (?, ?)",
+                                            (config_id, pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL))
+                                    )
+
+                            next_trial = config_id, 0
+
+                        config_id, rung = next_trial
+                        config = self._sweep.parser.create_config(config_values[config_id])
+                        future = executor.submit(self._run, config, self._budgets[rung])
+                        running[future] = next_trial
+
+                    if not running:
+                        break
+
+                    # store the scores of all completed trials
+                    done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+
+                        config_id, rung = running.pop(future)
+                        try:
+                            score = float(future.result())
+                        except Exception as e:
+                            if error is None:  # -> the first error is propagated once all running trials are done
+                                error = e
+                            continue
+                        if math.isnan(score):  # -> NaN can be neither stored nor ranked
+                            score = math.inf if self._minimize else -math.inf
+
+                        with connection:
+                            connection.execute("INSERT INTO trials VALUES (?, ?, ?)", (config_id, rung, score))
+                        scores[rung][config_id] = score
+                        entry = self._create_entry(config_id, score)
+                        bisect.insort(rankings[rung], entry)
+                        if rung + 1 < len(self._budgets):
+                            heapq.heappush(candidates[rung], entry)
+
+        finally:
+            connection.close()
+
+        if error is not None:
+            raise error
+
+        # assemble the final trial of each configuration
+        trials = {}
+        for rung, rung_scores in enumerate(scores):
+            for config_id, score in rung_scores.items():
+                trials[config_id] = (config_id, rung, score)
+
+        return sorted(
+                (
+                        Trial(
+                                config_id,
+                                self._sweep.parser.create_config(config_values[config_id]),
+                                rung,
+                                self._budgets[rung],
+                                score
+                        )
+                        for config_id, rung, score in trials.values()
+                ),
+                key=lambda t: (-t.rung, t.score if self._minimize else -t.score, t.config_id)
+        )
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import collections
+import concurrent.futures
+import json
+import os
+import time
+import typing
+
+import insanity
+
+import argmagiq.sweeps.fingerprint as fingerprint
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+EXECUTORS = {
+        "process": concurrent.futures.ProcessPoolExecutor,
+        "thread": concurrent.futures.ThreadPoolExecutor
+}
+"""dict[str, type]: Maps the names of the supported kinds of worker pools to the classes that implement them."""
+
+JobResult = collections.namedtuple("JobResult", ["config", "fingerprint", "result", "error"])
+"""The outcome of running a single job, where ``error`` is the exception raised by the job (if any)."""
+
+
+class SweepRunner(object):
+    """Runs a target function for each of a (possibly very large) number of configurations in a pool of workers.
+
+    Configurations are drawn from the provided iterable lazily, such that at most ``max_pending`` jobs are in flight at
+    any time, and results are yielded in the order that jobs complete. Jobs are handed to the pool only when one of its
+    workers is available, and jobs that do not complete within ``timeout`` seconds after they have been started are
+    reported as failed with a :class:`concurrent.futures.TimeoutError`. Notice, however, that threads cannot be
+    interrupted, i.e., a thread whose job timed out is still busy, and the job is still counted as in flight, until it
+    returns. A process pool, in contrast, is replaced by a new one as soon as one of its jobs times out, and the
+    workers of the old pool are terminated once all of its other jobs have completed.
+
+    If a journal is used, then the fingerprints (cf. :func:`fingerprint.fingerprint_config`) of all configurations
+    whose jobs have completed successfully are appended to it, and configurations that are listed in the journal
+    already are skipped. Therefore, restarting an interrupted sweep with the same journal runs unfinished jobs only.
+    """
+
+    #  CONSTRUCTOR  ####################################################################################################
+
+    def __init__(
+            self,
+            target: typing.Callable[[typing.Any], typing.Any],
+            journal_path: str = None,
+            executor: str = "thread",
+            max_workers: int = None,
+            max_pending: int = None,
+            timeout: float = None
+    ):
+        """Creates a new ``SweepRunner``.
+
+        Args:
+            target (callable): The function that is invoked with each configuration. For process pools, both
+                ``target`` and the configurations have to be picklable.
+            journal_path (str, optional): The path of the JSONL file that completed jobs are recorded in.
+            executor (str, optional): The kind of pool that jobs are run in, i.e., ``"thread"`` or ``"process"``.
+            max_workers (int, optional): The number of workers, which defaults to the number of CPUs.
+            max_pending (int, optional): The maximum number of jobs that are in flight at the same time, which
+                defaults to ``max_workers``.
+            timeout (float, optional): The number of seconds after which a running job is considered as failed.
+        """
+
+        # sanitize args
+        if not callable(target):
+            raise TypeError("<target> has to be callable")
+        insanity.sanitize_type("journal_path", journal_path, str, none_allowed=True)
+        executor = str(executor)
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor: '{executor}'")
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        insanity.sanitize_type("max_workers", max_workers, int)
+        insanity.sanitize_range("max_workers", max_workers, minimum=1)
+        if max_pending is None:
+            max_pending = max_workers
+        insanity.sanitize_type("max_pending", max_pending, int)
+        insanity.sanitize_range("max_pending", max_pending, minimum=1)
+        insanity.sanitize_type("timeout", timeout, (int, float), none_allowed=True)
+        if timeout is not None:
+            insanity.sanitize_range("timeout", timeout, minimum=0, min_inclusive=False)
+
+        self._executor = executor
+        self._journal_path = journal_path
+        self._max_pending = max_pending
+        self._max_workers = max_workers
+        self._target = target
+        self._timeout = timeout
+
+    #  PROPERTIES  #####################################################################################################
+
+    @property
+    def journal_path(self) -> typing.Optional[str]:
+        """str: The path of the journal that completed jobs are recorded in, or ``None``, if there is none."""
+
+        return self._journal_path
+
+    #  METHODS  ########################################################################################################
+
+    def _read_journal(self) -> typing.Set[str]:
+        """Reads the fingerprints of all completed jobs from the journal."""
+
+        if self._journal_path is None or not os.path.isfile(self._journal_path):
+            return set()
+
+        completed = set()
+        with open(self._journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    completed.add(json.loads(line)["fingerprint"])
+                except (ValueError, KeyError, TypeError):  # -> e.g., a line that was truncated by a crash
+                    pass
+
+        return completed
+
+    @staticmethod
+    def _terminate(executor: concurrent.futures.ProcessPoolExecutor) -> None:
+        """Terminates all worker processes of a process pool, and shuts it down.
+
+        Jobs that are still running fail with a :class:`concurrent.futures.process.BrokenProcessPool`. Notice that the
+        workers have to be terminated before the pool is shut down, since the latter discards them.
+        """
+
+        for process in list((getattr(executor, "_processes", None) or {}).values()):
+            process.terminate()
+        executor.shutdown(wait=True)  # -> this returns as soon as the pool has noticed that its workers are gone
+
+    def run(self, configs: typing.Iterable[typing.Any]) -> typing.Iterator[JobResult]:
+        """Runs the target function for all provided configurations that have not been completed before.
+
+        Args:
+            configs (iterable): The configuration objects, which may come from any source (e.g., a sweep or
+                :meth:`magiq_parser.MagiqParser.parse_jsonl`).
+
+        Yields:
+            :class:`JobResult`: The outcome of each job that has been run, in order of completion. Configurations that
+            are skipped because of the journal or because they have been encountered before are not reported.
+        """
+
+        completed = self._read_journal()
+        configs = iter(configs)
+        running = {}  # -> maps futures to (config, fingerprint, deadline)
+        abandoned = set()  # -> the futures of jobs that timed out, but are still running
+        pool_jobs = set()  # -> the futures of all jobs in the current pool that are still running
+        retired = []  # -> process pools that have been replaced, and the futures of their jobs
+        exhausted = False
+        journal = None if self._journal_path is None else open(self._journal_path, "a", encoding="utf-8")
+        executor = EXECUTORS[self._executor](self._max_workers)
+        try:
+            while True:
+
+                # forget about abandoned jobs that returned eventually, and terminate retired pools that are not needed
+                # anymore -> the latter causes their abandoned jobs to fail
+                abandoned = {future for future in abandoned if not future.done()}
+                pool_jobs = {future for future in pool_jobs if not future.done()}
+                still_retired = []
+                for retired_executor, retired_jobs in retired:
+                    if all(future.done() or future in abandoned for future in retired_jobs):
+                        self._terminate(retired_executor)
+                    else:
+                        still_retired.append((retired_executor, retired_jobs))
+                retired = still_retired
+
+                # submit jobs until there are max_pending jobs in flight or all workers are busy
+                # -> since jobs are submitted to available workers only, they are started right away
+                while (
+                        not exhausted and
+                        len(running) + len(abandoned) < self._max_pending and
+                        len(pool_jobs) < self._max_workers
+                ):
+                    try:
+                        config = next(configs)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    config_fingerprint = fingerprint.fingerprint_config(config)
+                    if config_fingerprint in completed:
+                        continue
+                    completed.add(config_fingerprint)  # -> duplicates are run once only
+                    deadline = None if self._timeout is None else time.monotonic() + self._timeout
+                    future = executor.submit(self._target, config)
+                    running[future] = config, config_fingerprint, deadline
+                    pool_jobs.add(future)
+
+                # abandoned jobs are waited for only if they prevent submitting further jobs
+                if not running and (exhausted or not abandoned):
+                    break
+
+                # wait until the next job completes or times out
+                deadlines = [deadline for _, _, deadline in running.values() if deadline is not None]
+                done, _ = concurrent.futures.wait(
+                        set(running) | abandoned,
+                        timeout=max(0, min(deadlines) - time.monotonic()) if deadlines else None,
+                        return_when=concurrent.futures.FIRST_COMPLETED
+                )
+
+                # report all jobs that have completed
+                for future in done:
+                    if future not in running:  # -> an abandoned job
+                        continue
+                    config, config_fingerprint, _ = running.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        if journal is not None:
+                            journal.write(json.dumps({"fingerprint": config_fingerprint}) + "\n")
+                            journal.flush()
+                        yield JobResult(config, config_fingerprint, future.result(), None)
+                    else:
+                        completed.discard(config_fingerprint)
+                        yield JobResult(config, config_fingerprint, None, error)
+
+                # report all jobs that have timed out
+                now = time.monotonic()
+                recycle = False
+                for future, (config, config_fingerprint, deadline) in list(running.items()):
+                    if deadline is not None and deadline <= now:
+                        del running[future]
+                        if not future.cancel():  # -> the job cannot be cancelled, since it is running already
+                            abandoned.add(future)
+                            recycle |= self._executor == "process" and future in pool_jobs
+                        completed.discard(config_fingerprint)
+                        error = concurrent.futures.TimeoutError(f"The job did not complete within {self._timeout}s")
+                        yield JobResult(config, config_fingerprint, None, error)
+
+                # replace a process pool that contains abandoned jobs, whose workers are terminated later on
+                if recycle:
+                    retired.append((executor, pool_jobs))
+                    executor = EXECUTORS[self._executor](self._max_workers)
+                    pool_jobs = set()
+
+        finally:
+            executor.shutdown(wait=not (running or abandoned))  # -> do not wait for jobs that are abandoned
+            for retired_executor, retired_jobs in retired:
+                if any(future in running for future in retired_jobs):
+                    retired_executor.shutdown(wait=False)
+                else:
+                    self._terminate(retired_executor)
+            if journal is not None:
+                journal.close()
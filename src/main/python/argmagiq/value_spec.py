@@ -49,8 +49,12 @@ __status__ = "Development"
 class ValueSpec(object):
     """Describes a single value that is part of a configuration to be parsed, as specified by an instance of
     :class:`argmagiq.config_spec.ConfigSpec`..
+
+    ``ValueSpec``\\ s are immutable, and their hash values are computed once, when they are created.
     """
 
+    __slots__ = ("_data_type", "_default_value", "_description", "_hash", "_name", "_required")
+
     def __init__(
             self,
             name: str,
@@ -79,11 +83,15 @@ class ValueSpec(object):
         required = bool(required)
 
         # store args
-        self._data_type = data_type
-        self._default_value = default_value
-        self._description = description
-        self._name = name
-        self._required = required
+        # -> since instances are immutable, attributes have to be set by means of object.__setattr__
+        object.__setattr__(self, "_data_type", data_type)
+        object.__setattr__(self, "_default_value", default_value)
+        object.__setattr__(self, "_description", description)
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_required", required)
+
+        # precompute the hash based on the fields that identify the specified value
+        object.__setattr__(self, "_hash", hash((name, data_type, required)))
 
     #  MAGIC FUNCTIONS  ################################################################################################
 
@@ -98,9 +106,24 @@ class ValueSpec(object):
                 self._required == other.required
         )
 
+    def __delattr__(self, name: str) -> None:
+
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
     def __hash__(self):
 
-        return hash(str(self))
+        return self._hash
+
+    def __reduce__(self):
+
+        return (
+                type(self),
+                (self._name, self._description, self._data_type, self._required, self._default_value)
+        )
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+
+        raise AttributeError(f"{type(self).__name__} is immutable")
 
     def __str__(self) -> str:
 
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import bz2
+import gzip
+import io
+import lzma
+import os
+import tarfile
+import tempfile
+import unittest
+import zipfile
+
+import argmagiq.archives as archives
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+CONTENT = b'{"conf_2": 666}'
+"""bytes: The content of the (uncompressed) files used for testing."""
+
+
+class ArchivesTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+
+        self.temp_dir.cleanup()
+
+    #  TEST: read_file  ################################################################################################
+
+    def test_read_file_decompresses_compressed_files(self):
+
+        for file_name, compress in [
+                ("config.json", lambda x: x),
+                ("config.json.bz2", bz2.compress),
+                ("config.json.gz", gzip.compress),
+                ("config.json.xz", lzma.compress)
+        ]:
+            with self.subTest(file_name=file_name):
+
+                file_path = os.path.join(self.temp_dir.name, file_name)
+                with open(file_path, "wb") as f:
+                    f.write(compress(CONTENT))
+
+                self.assertEqual(CONTENT, archives.read_file(file_path))
+
+    def test_read_file_raises_a_value_error_if_a_compressed_file_is_corrupt(self):
+
+        file_path = os.path.join(self.temp_dir.name, "config.json.gz")
+        with open(file_path, "wb") as f:
+            f.write(CONTENT)
+
+        with self.assertRaises(ValueError):
+            archives.read_file(file_path)
+
+    #  TEST: iter_archive  #############################################################################################
+
+    def test_iter_archive_yields_all_config_files_in_tar_and_zip_archives(self):
+
+        members = [("a.json", CONTENT), ("b/c.json.gz", gzip.compress(CONTENT)), ("d.txt", b"not a config")]
+        expected = [("a.json", CONTENT), ("b/c.json.gz", CONTENT)]
+
+        zip_path = os.path.join(self.temp_dir.name, "configs.zip")
+        with zipfile.ZipFile(zip_path, "w") as archive:
+            for name, data in members:
+                archive.writestr(name, data)
+
+        tar_path = os.path.join(self.temp_dir.name, "configs.tar.xz")
+        with tarfile.open(tar_path, "w:xz") as archive:
+            for name, data in members:
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                archive.addfile(info, io.BytesIO(data))
+
+        for archive_path in [zip_path, tar_path]:
+            with self.subTest(archive_path=archive_path):
+                self.assertEqual(
+                        expected,
+                        [(name, archives.decompress(name, data)) for name, data in archives.iter_archive(archive_path)]
+                )
+
+    def test_iter_archive_raises_a_value_error_if_the_file_is_not_an_archive(self):
+
+        file_path = os.path.join(self.temp_dir.name, "config.json")
+        with open(file_path, "wb") as f:
+            f.write(CONTENT)
+
+        with self.assertRaises(ValueError):
+            next(archives.iter_archive(file_path))
+
+    def test_iter_archive_raises_a_value_error_if_the_archive_is_corrupt(self):
+
+        data = b"".join(b'{"conf_2": %d}' % i for i in range(1000))
+
+        # corrupt the compressed data of the second member of a zip archive
+        zip_path = os.path.join(self.temp_dir.name, "configs.zip")
+        with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("a.json", CONTENT)
+            archive.writestr("b.json", data)
+        with open(zip_path, "r+b") as f:
+            archive_data = f.read()
+            f.seek(archive_data.index(b"b.json") + 10)
+            f.write(b"\xff" * 40)
+
+        # truncate a compressed tar archive in the middle of its second member
+        tar_path = os.path.join(self.temp_dir.name, "configs.tar.gz")
+        with tarfile.open(tar_path, "w:gz") as archive:
+            for name, member_data in [("a.json", CONTENT), ("b.json", data)]:
+                info = tarfile.TarInfo(name)
+                info.size = len(member_data)
+                archive.addfile(info, io.BytesIO(member_data))
+        with open(tar_path, "r+b") as f:
+            f.truncate(len(f.read()) // 2)
+
+        for archive_path in [zip_path, tar_path]:
+            with self.subTest(archive_path=archive_path):
+                members = archives.iter_archive(archive_path)
+                self.assertEqual(("a.json", CONTENT), next(members))
+                with self.assertRaisesRegex(ValueError, "corrupt.*" + os.path.basename(archive_path)):
+                    next(members)
@@ -0,0 +1,425 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import gzip
+import io
+import os
+import sys
+import tarfile
+import tempfile
+import typing
+import unittest
+import unittest.mock as mock
+import zipfile
+
+import argmagiq.compiled_parser as compiled_parser
+import argmagiq.config_spec as config_spec
+import argmagiq.parsers.bool_parser as bool_parser
+import argmagiq.parsers.int_parser as int_parser
+import argmagiq.parsers.parser_registry as parser_registry
+import argmagiq.parsers.str_parser as str_parser
+import argmagiq.value_spec as value_spec
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+class CompiledParserTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.spec = config_spec.ConfigSpec()
+        self.spec.add_value(value_spec.ValueSpec("conf_1", "No description available.", bool, False, False))
+        self.spec.add_value(value_spec.ValueSpec("conf_2", "No description available.", int, True, None))
+
+        self.parser = compiled_parser.CompiledParser(self.spec)
+
+    #  TEST: __init__  #################################################################################################
+
+    def test_init_creates_parsers_and_required_names_as_expected(self):
+
+        self.assertEqual(["conf_1", "conf_2"], [p.spec.name for p in self.parser.parsers])
+        self.assertIsInstance(self.parser.parsers_by_name["conf_1"], bool_parser.BoolParser)
+        self.assertIsInstance(self.parser.parsers_by_name["conf_2"], int_parser.IntParser)
+        self.assertEqual(frozenset(["conf_2"]), self.parser.required_names)
+
+    #  TEST: _create_dispatch_index  ###################################################################################
+
+    def test_create_dispatch_index_maps_arg_names_to_parsers(self):
+
+        parsers = [
+                bool_parser.BoolParser(value_spec.ValueSpec("flag", "...", bool, False, True)),
+                int_parser.IntParser(value_spec.ValueSpec("number", "...", int, True, None)),
+                _PrefixParser(value_spec.ValueSpec("prefixed", "...", str, False, None))
+        ]
+
+        index, fallback = compiled_parser.CompiledParser._create_dispatch_index(parsers)
+        self.assertEqual({"--no-flag": (0, parsers[0]), "--number": (1, parsers[1])}, index)
+        self.assertEqual([(2, parsers[2])], fallback)
+
+    def test_create_dispatch_index_maps_ambiguous_arg_names_to_the_first_parser(self):
+
+        parsers = [
+                int_parser.IntParser(value_spec.ValueSpec("number", "...", int, True, None)),
+                int_parser.IntParser(value_spec.ValueSpec("NUMBER", "...", int, True, None))
+        ]
+
+        index, _ = compiled_parser.CompiledParser._create_dispatch_index(parsers)
+        self.assertEqual({"--number": (0, parsers[0])}, index)
+
+    #  TEST: _read_args_from_command_line  #############################################################################
+
+    def test_read_args_from_command_line_parses_args_correctly(self):
+
+        parsed_args = self.parser._read_args_from_command_line(("--conf-1", "--conf-2", "666"))
+        self.assertEqual(
+                {"conf_1": True, "conf_2": 666},
+                parsed_args
+        )
+
+    def test_read_args_from_command_line_sanitizes_args_only_once(self):
+
+        with mock.patch.object(
+                compiled_parser.insanity,
+                "sanitize_iterable",
+                wraps=compiled_parser.insanity.sanitize_iterable
+        ) as mock_method:
+
+            self.parser._read_args_from_command_line(
+                    ("--conf-2", "1", "--conf-2", "2", "--conf-1", "--conf-2", "666")
+            )
+
+        mock_method.assert_called_once()
+
+    def test_read_args_from_command_line_raises_a_type_error_if_args_of_an_illegal_type_are_provided(self):
+
+        with self.assertRaises(TypeError):
+            self.parser._read_args_from_command_line(("--conf-2", 666))
+
+    def test_read_args_from_command_line_raises_a_value_error_if_an_unknown_arg_is_encountered(self):
+
+        with self.assertRaises(ValueError):
+            self.parser._read_args_from_command_line(("--conf-1", "--this-one-does-not-exist", "--conf-2", "666"))
+
+    def test_read_args_from_command_line_falls_back_to_parsers_with_custom_firing_behavior(self):
+
+        self.spec.add_value(value_spec.ValueSpec("prefixed", "No description available.", str, False, None))
+
+        with mock.patch.object(compiled_parser.CompiledParser, "_create_parsers", return_value=[
+                bool_parser.BoolParser(self.spec.get_value_by_name("conf_1")),
+                int_parser.IntParser(self.spec.get_value_by_name("conf_2")),
+                _PrefixParser(self.spec.get_value_by_name("prefixed"))
+        ]):
+            parser = compiled_parser.CompiledParser(self.spec)
+
+        self.assertEqual(
+                {"conf_1": True, "conf_2": 666, "prefixed": "abc"},
+                parser._read_args_from_command_line(("--conf-2", "666", "--prefixed=abc", "--conf-1"))
+        )
+
+    def test_read_args_from_command_line_dispatches_args_to_the_first_parser_that_fires(self):
+
+        self.spec.add_value(value_spec.ValueSpec("prefixed", "No description available.", str, False, None))
+
+        # a parser with custom firing behavior takes precedence over indexed parsers that come after it only
+        with mock.patch.object(compiled_parser.CompiledParser, "_create_parsers", return_value=[
+                bool_parser.BoolParser(self.spec.get_value_by_name("conf_1")),
+                _CatchAllParser(self.spec.get_value_by_name("prefixed")),
+                int_parser.IntParser(self.spec.get_value_by_name("conf_2"))
+        ]):
+            parser = compiled_parser.CompiledParser(self.spec)
+
+        self.assertEqual(
+                {"conf_1": True, "prefixed": "666"},
+                parser._read_args_from_command_line(("--conf-1", "--conf-2", "666"))
+        )
+
+    def test_read_args_from_command_line_reads_args_from_response_files(self):
+
+        self.spec.add_value(value_spec.ValueSpec("conf_3", "No description available.", str, False, None))
+        parser = compiled_parser.CompiledParser(self.spec)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+
+            outer_path = os.path.join(temp_dir, "outer.args")
+            inner_path = os.path.join(temp_dir, "inner.args")
+            with open(outer_path, "w") as f:
+                f.write(f"--conf-2 1\n@{inner_path}\n")
+            with open(inner_path, "w") as f:
+                f.write("--conf-3 'a value with  spaces'\n--conf-1")
+
+            self.assertEqual(
+                    {"conf_1": True, "conf_2": 2, "conf_3": "a value with  spaces"},
+                    parser._read_args_from_command_line((f"@{outer_path}", "--conf-2", "2"), expand_response_files=True)
+            )
+            self.assertEqual(  # -> values that start with @ are not treated as response files
+                    {"conf_3": "@not-a-file"},
+                    parser._read_args_from_command_line(("--conf-3", "@not-a-file"), expand_response_files=True)
+            )
+
+    def test_read_args_from_command_line_raises_a_value_error_if_a_response_file_includes_itself(self):
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+
+            first_path = os.path.join(temp_dir, "first.args")
+            second_path = os.path.join(temp_dir, "second.args")
+            with open(first_path, "w") as f:
+                f.write(f"--conf-1 @{second_path}")
+            with open(second_path, "w") as f:
+                f.write(f"@{first_path}")
+
+            with self.assertRaisesRegex(ValueError, "includes itself"):
+                self.parser._read_args_from_command_line((f"@{first_path}",), expand_response_files=True)
+            with self.assertRaisesRegex(ValueError, "not found"):
+                self.parser._read_args_from_command_line(
+                        (f"@{temp_dir}/does-not-exist.args",),
+                        expand_response_files=True
+                )
+
+    def test_read_args_from_command_line_does_not_expand_response_files_unless_requested(self):
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+
+            file_path = os.path.join(temp_dir, "secret.args")
+            with open(file_path, "w") as f:
+                f.write("--conf-2 1")
+
+            with self.assertRaisesRegex(ValueError, "Unknown option: '@"):
+                self.parser._read_args_from_command_line((f"@{file_path}",))
+            with self.assertRaisesRegex(ValueError, "Unknown option: '@"):
+                self.parser.parse((f"@{file_path}",))
+            self.assertEqual({"conf_2": 1}, self.parser.parse((f"@{file_path}",), expand_response_files=True))
+
+    #  TEST: _read_args_from_file  #####################################################################################
+
+    def test_read_args_from_file_parses_args_correctly(self):
+
+        parsed_args = self.parser._read_args_from_file("src/test/resources/valid_test_config.json")
+        self.assertEqual(
+                {"conf_1": True, "conf_2": 666},
+                parsed_args
+        )
+
+    def test_read_args_from_file_raises_a_value_error_if_an_unknown_arg_is_encountered(self):
+
+        with self.assertRaises(ValueError):
+            self.parser._read_args_from_file("src/test/resources/invalid_test_config.json")
+
+    def test_read_args_from_file_raises_a_value_error_if_the_config_file_does_not_exist(self):
+
+        with self.assertRaises(ValueError):
+            self.parser._read_args_from_file("/does/not/exist.json")
+
+    def test_read_args_from_file_parses_the_part_of_the_file_specified_by_a_json_pointer(self):
+
+        parsed_args = self.parser._read_args_from_file("src/test/resources/valid_test_record.json#/config/model")
+        self.assertEqual({"conf_1": True, "conf_2": 666}, parsed_args)
+
+        with self.assertRaisesRegex(ValueError, "/config/optimizer"):
+            self.parser._read_args_from_file("src/test/resources/valid_test_record.json#/config/optimizer")
+
+    #  TEST: format_help  ##############################################################################################
+
+    def test_format_help_describes_the_app_and_all_options(self):
+
+        help_text = self.parser.format_help("name", "description")
+
+        self.assertIn("Usage: name [OPTION]...", help_text)
+        self.assertIn("description", help_text)
+        self.assertIn("--conf-1", help_text)
+        self.assertIn("--conf-2 VALUE", help_text)
+        self.assertIn("--help (or -h)", help_text)
+
+    #  TEST: parse  ####################################################################################################
+
+    def test_parse_raises_a_value_error_if_a_required_arg_is_missing(self):
+
+        self.assertEqual({"conf_1": True, "conf_2": 666}, self.parser.parse(["--conf-1", "--conf-2", "666"]))
+        with self.assertRaisesRegex(ValueError, "--conf-2"):
+            self.parser.parse(["--conf-1"])
+
+    #  TEST: parse_layered  ############################################################################################
+
+    def test_parse_layered_applies_later_sources_on_top_of_earlier_ones(self):
+
+        parsed_args, provenance = self.parser.parse_layered(
+                ["src/test/resources/valid_test_config.json"],
+                ["--conf-2", "1"]
+        )
+        self.assertEqual({"conf_1": True, "conf_2": 1}, parsed_args)
+        self.assertEqual(
+                {"conf_1": "src/test/resources/valid_test_config.json", "conf_2": compiled_parser.COMMAND_LINE_SOURCE},
+                provenance
+        )
+
+        with self.assertRaisesRegex(ValueError, "--conf-2"):
+            self.parser.parse_layered([], ["--conf-1"])
+
+    #  TEST: parse_archive  ############################################################################################
+
+    def test_parse_archive_parses_all_config_files_in_the_archive(self):
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+
+            archive_path = os.path.join(temp_dir, "configs.zip")
+            with zipfile.ZipFile(archive_path, "w") as archive:
+                archive.writestr("1.json", '{"conf_2": 1}')
+                archive.writestr("2.json", '{"conf_2": "not a number"}')
+                archive.writestr("3.json.gz", gzip.compress(b'{"conf_1": true, "conf_2": 3}'))
+
+            results = list(self.parser.parse_archive(archive_path))
+
+        self.assertEqual(3, len(results))
+        self.assertEqual({"conf_2": 1}, results[0])
+        self.assertIsInstance(results[1], ValueError)
+        self.assertIn("2.json", str(results[1]))
+        self.assertEqual({"conf_1": True, "conf_2": 3}, results[2])
+
+    def test_parse_archive_raises_a_value_error_if_the_archive_is_corrupt(self):
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+
+            # create a compressed tar archive, and truncate it in the middle of the second file
+            archive_path = os.path.join(temp_dir, "configs.tar.gz")
+            with tarfile.open(archive_path, "w:gz") as archive:
+                for name, data in [("1.json", b'{"conf_2": 1}'), ("2.json", os.urandom(1 << 14))]:
+                    info = tarfile.TarInfo(name)
+                    info.size = len(data)
+                    archive.addfile(info, io.BytesIO(data))
+            with open(archive_path, "r+b") as f:
+                f.truncate(len(f.read()) // 2)
+
+            results = self.parser.parse_archive(archive_path)
+            self.assertEqual({"conf_2": 1}, next(results))
+            with self.assertRaisesRegex(ValueError, "configs.tar.gz"):
+                next(results)
+
+    #  TEST: parse_file  ###############################################################################################
+
+    def test_parse_file_raises_a_value_error_if_a_required_arg_is_missing(self):
+
+        self.spec.add_value(value_spec.ValueSpec("conf_3", "No description available.", str, True, None))
+        parser = compiled_parser.CompiledParser(self.spec)
+
+        with self.assertRaisesRegex(ValueError, "conf_3"):
+            parser.parse_file("src/test/resources/valid_test_config.json")
+
+    def test_parse_file_parses_compressed_files(self):
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+
+            file_path = os.path.join(temp_dir, "record.json.gz")
+            with gzip.open(file_path, "wb") as f:
+                f.write(b'{"config": {"conf_2": 666}}')
+
+            self.assertEqual({"conf_2": 666}, self.parser.parse_file(file_path + "#/config"))
+
+    #  TEST: parse_jsonl  ##############################################################################################
+
+    def test_parse_jsonl_parses_one_config_per_line_and_yields_errors_per_line(self):
+
+        results = list(self.parser.parse_jsonl("src/test/resources/valid_test_configs.jsonl"))
+
+        self.assertEqual(4, len(results))
+        self.assertEqual({"conf_1": True, "conf_2": 1}, results[0])
+        self.assertIsInstance(results[1], ValueError)
+        self.assertIn("Line 2", str(results[1]))
+        self.assertIsInstance(results[2], ValueError)
+        self.assertIn("Line 4", str(results[2]))
+        self.assertEqual({"conf_2": 4}, results[3])
+
+    def test_parse_jsonl_reads_from_stdin_if_the_file_path_is_a_dash(self):
+
+        with mock.patch.object(sys, "stdin", io.StringIO('{"conf_2": 1}\n{"conf_2": 2}\n')):
+            self.assertEqual([{"conf_2": 1}, {"conf_2": 2}], list(self.parser.parse_jsonl("-")))
+
+    def test_parse_jsonl_raises_a_value_error_if_the_file_does_not_exist(self):
+
+        with self.assertRaises(ValueError):
+            next(self.parser.parse_jsonl("/does/not/exist.jsonl"))
+
+
+    #  TEST: refresh_registry_version  #################################################################################
+
+    def test_refresh_registry_version_advances_the_version_only_if_the_parsers_are_up_to_date(self):
+
+        try:
+            parser_registry.REGISTRY.register(_Unrelated, str_parser.StrParser)
+            self.assertTrue(self.parser.refresh_registry_version())
+            self.assertEqual(parser_registry.REGISTRY.version, self.parser.registry_version)
+
+            parser_registry.REGISTRY.register(int, _CustomIntParser)
+            self.assertFalse(self.parser.refresh_registry_version())
+            self.assertNotEqual(parser_registry.REGISTRY.version, self.parser.registry_version)
+        finally:
+            parser_registry.REGISTRY.unregister(_Unrelated)
+            parser_registry.REGISTRY.register(int, int_parser.IntParser)
+
+
+class _CatchAllParser(str_parser.StrParser):
+    """A parser with custom firing behavior, which fires for every arg, and consumes the last arg of an option."""
+
+    def fires(self, argv: typing.Tuple[str, ...]) -> bool:
+
+        return len(argv) > 0
+
+    def _parse(self, argv: typing.Tuple[str, ...]) -> typing.Tuple[typing.Any, typing.Tuple[str, ...]]:
+
+        return argv[1], argv[2:]
+
+
+class _PrefixParser(str_parser.StrParser):
+    """A parser with custom firing behavior, which accepts args of the form ``--name=VALUE``."""
+
+    def fires(self, argv: typing.Tuple[str, ...]) -> bool:
+
+        return len(argv) > 0 and argv[0].startswith(self._arg_name + "=")
+
+    def _parse(self, argv: typing.Tuple[str, ...]) -> typing.Tuple[typing.Any, typing.Tuple[str, ...]]:
+
+        return argv[0][len(self._arg_name) + 1:], argv[1:]
+
+
+class _CustomIntParser(int_parser.IntParser):
+    """A parser that is registered for ``int`` instead of the default one."""
+
+
+class _Unrelated(object):
+    """A data type that none of the configuration values is of."""
@@ -62,6 +62,15 @@ class ConfigSpecTest(unittest.TestCase):
         with self.assertRaises(TypeError):
             spec.add_value("value")
 
+    def test_add_value_raises_a_value_error_if_a_value_of_the_same_name_exists_already(self):
+
+        spec = config_spec.ConfigSpec()
+        spec.add_value(value_spec.ValueSpec("val", "val", str, False, None))
+
+        with self.assertRaises(ValueError):
+            spec.add_value(value_spec.ValueSpec("val", "another val", int, True, None))
+        self.assertEqual(1, len(spec))
+
     def test_add_value_stores_value_specs_as_expected(self):
 
         spec = config_spec.ConfigSpec()
@@ -78,6 +87,27 @@ class ConfigSpecTest(unittest.TestCase):
         self.assertEqual(2, len(spec))
         self.assertEqual({value_1, value_2}, set(spec))
 
+    #  TEST: __eq__  ###################################################################################################
+
+    def test_eq_compares_specs_regardless_of_the_order_of_values(self):
+
+        value_1 = value_spec.ValueSpec("val-1", "val-1", str, False, None)
+        value_2 = value_spec.ValueSpec("val-2", "val-2", str, False, None)
+
+        spec_1 = config_spec.ConfigSpec()
+        spec_1.add_value(value_1)
+        spec_1.add_value(value_2)
+        spec_2 = config_spec.ConfigSpec()
+        spec_2.add_value(value_2)
+        spec_2.add_value(value_1)
+        spec_3 = config_spec.ConfigSpec()
+        spec_3.add_value(value_1)
+        spec_3.add_value(value_spec.ValueSpec("val-2", "val-2", int, False, None))
+
+        self.assertEqual(spec_1, spec_2)
+        self.assertNotEqual(spec_1, spec_3)
+        self.assertNotEqual(spec_1, "not a spec")
+
     #  TEST: create_from  ##############################################################################################
 
     def test_create_from_all_supported_data_types_correctly(self):
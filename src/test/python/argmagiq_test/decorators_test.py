@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import inspect
+import sys
+import typing
+import unittest
+import unittest.mock as mock
+
+import argmagiq
+import argmagiq.compiled_parser as compiled_parser
+import argmagiq.config_spec as config_spec
+import argmagiq.magiq_parser as magiq_parser
+import argmagiq.parsers.int_parser as int_parser
+import argmagiq.parsers.parser_registry as parser_registry
+import argmagiq.spec_cache as spec_cache
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+class DecoratorsTest(unittest.TestCase):
+
+    #  TEST: config  ###################################################################################################
+
+    def test_config_attaches_a_compiled_parser_to_the_class(self):
+
+        compiled = _DecoratedConfig.__dict__[argmagiq.COMPILED_PARSER_KEY]
+
+        self.assertIsInstance(compiled, compiled_parser.CompiledParser)
+        self.assertEqual(config_spec.ConfigSpec.create_from(_DecoratedConfig), compiled.spec)
+
+    def test_config_raises_errors_when_the_class_is_defined(self):
+
+        with self.assertRaises(ValueError):
+
+            @argmagiq.config
+            class _Config(object):
+
+                def __init__(self):
+                    self._value = None
+
+                @property
+                def value(self) -> typing.Union[int, str]:
+                    return self._value
+
+                @value.setter
+                def value(self, value: typing.Union[int, str]) -> None:
+                    self._value = value
+
+        with self.assertRaises(TypeError):
+            argmagiq.config("not a class")
+
+    def test_config_classes_are_parsed_without_inspection(self):
+
+        with mock.patch.object(spec_cache.SPEC_CACHE, "get_compiled") as mock_get_compiled:
+            with mock.patch.object(inspect, "signature") as mock_signature:
+
+                sys.argv = ["app", "--value", "666"]
+                config = argmagiq.parse_args(_DecoratedConfig, "name", "description")
+
+        mock_get_compiled.assert_not_called()
+        mock_signature.assert_not_called()
+        self.assertEqual(666, config.value)
+
+    def test_config_parsers_are_not_inherited(self):
+
+        class _SubConfig(_DecoratedConfig):
+            pass
+
+        self.assertIsNot(
+                _DecoratedConfig.__dict__[argmagiq.COMPILED_PARSER_KEY],
+                magiq_parser.MagiqParser(_SubConfig, "name", "description").compiled
+        )
+
+    def test_config_parsers_are_recreated_if_the_registry_changes(self):
+
+        parser = magiq_parser.MagiqParser(_DecoratedConfig, "name", "description")
+        self.assertEqual(3, parser.parse(["--value", "3"]).value)
+
+        try:
+            parser_registry.REGISTRY.register(int, _DoublingIntParser)
+            self.assertEqual(6, parser.parse(["--value", "3"]).value)
+            self.assertIsInstance(
+                    _DecoratedConfig.__dict__[argmagiq.COMPILED_PARSER_KEY].parsers[0],
+                    _DoublingIntParser
+            )
+        finally:
+            parser_registry.REGISTRY.register(int, int_parser.IntParser)
+
+        self.assertEqual(3, parser.parse(["--value", "3"]).value)
+
+    #  TEST: optional  #################################################################################################
+
+    def test_optional_raises_a_type_error_if_applied_to_anything_but_a_property(self):
+
+        with self.assertRaises(TypeError):
+            argmagiq.optional(lambda x: x)
+
+
+@argmagiq.config
+class _DecoratedConfig(object):
+
+    def __init__(self):
+        self._value = None
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    @value.setter
+    def value(self, value: int) -> None:
+        self._value = value
+
+
+class _DoublingIntParser(int_parser.IntParser):
+
+    def _parse_at(self, argv: typing.Tuple[str, ...], index: int) -> typing.Tuple[typing.Any, int]:
+
+        value, num_consumed = super()._parse_at(argv, index)
+        return 2 * value, num_consumed
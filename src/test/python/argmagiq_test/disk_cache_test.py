@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import importlib
+import os
+import pickle
+import sys
+import tempfile
+import typing
+import unittest
+import unittest.mock as mock
+
+import argmagiq
+import argmagiq.config_spec as config_spec
+import argmagiq.disk_cache as disk_cache
+import argmagiq.parsers.int_parser as int_parser
+import argmagiq.parsers.parser_registry as parser_registry
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+MODULE_NAME = "_argmagiq_disk_cache_test_config"
+"""str: The name of the module that defines the configuration class used in the tests."""
+
+MODULE_SOURCE = """
+class Config(object):
+
+    DEFAULT_VALUE = {default_value}
+
+    def __init__(self):
+        self._value = self.DEFAULT_VALUE
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    @value.setter
+    def value(self, value: int) -> None:
+        self._value = value
+"""
+"""str: The source of the module that defines the configuration class used in the tests."""
+
+
+class DiskCacheTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = disk_cache.DiskCache(os.path.join(self.temp_dir.name, "cache"))
+
+        # create a module that defines a configuration class
+        self.module_path = os.path.join(self.temp_dir.name, MODULE_NAME + ".py")
+        self._write_module(default_value=1)
+        sys.path.insert(0, self.temp_dir.name)
+        self.module = importlib.import_module(MODULE_NAME)
+
+    def tearDown(self):
+
+        sys.path.remove(self.temp_dir.name)
+        del sys.modules[MODULE_NAME]
+        self.temp_dir.cleanup()
+
+    def _write_module(self, default_value: int) -> None:
+
+        with open(self.module_path, "w") as f:
+            f.write(MODULE_SOURCE.format(default_value=default_value))
+
+    #  TEST: default_cache_dir  ########################################################################################
+
+    def test_default_cache_dir_can_be_overridden_by_an_environment_variable(self):
+
+        with mock.patch.dict(os.environ, {disk_cache.CACHE_DIR_ENV_VAR: "/some/dir"}):
+            self.assertEqual("/some/dir", disk_cache.default_cache_dir())
+
+    #  TEST: get_compiled  #############################################################################################
+
+    def test_get_compiled_stores_parsers_that_are_loaded_subsequently(self):
+
+        self.assertIsNone(self.cache.load(self.module.Config))
+
+        compiled = self.cache.get_compiled(self.module.Config)
+        self.assertEqual(config_spec.ConfigSpec.create_from(self.module.Config), compiled.spec)
+
+        with mock.patch.object(config_spec.ConfigSpec, "create_from") as mock_method:
+            cached_compiled = self.cache.get_compiled(self.module.Config)
+
+        mock_method.assert_not_called()
+        self.assertEqual(compiled.spec, cached_compiled.spec)
+        self.assertEqual(compiled.formatted_options, cached_compiled._formatted_options)
+
+    def test_get_compiled_loads_legacy_parsers_that_override_parse_only(self):
+
+        try:
+            parser_registry.REGISTRY.register(int, _LegacyIntParser)
+            self.cache.get_compiled(self.module.Config)
+            cached_compiled = self.cache.load(self.module.Config)
+        finally:
+            parser_registry.REGISTRY.register(int, int_parser.IntParser)
+
+        self.assertIsInstance(cached_compiled.parsers[0], _LegacyIntParser)
+        self.assertEqual({"value": 200}, cached_compiled.parse(["--value", "2"]))
+
+    #  TEST: load  #####################################################################################################
+
+    def test_load_discards_entries_if_the_source_file_changed(self):
+
+        self.cache.get_compiled(self.module.Config)
+
+        # change the default value, and make sure that the modification time changes as well
+        self._write_module(default_value=2)
+        stat = os.stat(self.module_path)
+        os.utime(self.module_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+        self.assertIsNone(self.cache.load(self.module.Config))
+
+        self.module = importlib.reload(self.module)
+        self.assertIsNone(self.cache.load(self.module.Config))
+        self.assertEqual(2, self.cache.get_compiled(self.module.Config).spec.get_value_by_name("value").default_value)
+
+    def test_load_discards_entries_if_default_values_changed(self):
+
+        self.cache.get_compiled(self.module.Config)
+
+        with mock.patch.object(self.module.Config, "DEFAULT_VALUE", 2):
+            self.assertIsNone(self.cache.load(self.module.Config))
+
+    def test_load_discards_entries_of_other_versions_of_argmagiq(self):
+
+        self.cache.get_compiled(self.module.Config)
+
+        with mock.patch.object(argmagiq, "__version__", "0.0.0"):
+            self.assertIsNone(self.cache.load(self.module.Config))
+
+    def test_load_discards_entries_if_argmagiq_changed(self):
+
+        self.cache.get_compiled(self.module.Config)
+
+        with mock.patch.object(disk_cache, "_package_state", (("compiled_parser.py", 0, 0),)):
+            self.assertIsNone(self.cache.load(self.module.Config))
+        with mock.patch.object(disk_cache, "CACHE_FORMAT", disk_cache.CACHE_FORMAT + 1):
+            self.assertIsNone(self.cache.load(self.module.Config))
+
+    @unittest.skipUnless(hasattr(os, "getuid"), "file ownership is not available on this platform")
+    def test_load_ignores_entries_that_are_not_owned_by_the_current_user(self):
+
+        self.cache.get_compiled(self.module.Config)
+        self.assertIsNotNone(self.cache.load(self.module.Config))
+
+        with mock.patch.object(os, "getuid", return_value=os.getuid() + 1):
+            self.assertIsNone(self.cache.load(self.module.Config))
+
+        # entries that are writable by others are ignored as well
+        entry_path = self.cache._get_entry_path(self.module.Config)
+        os.chmod(entry_path, 0o666)
+        self.assertIsNone(self.cache.load(self.module.Config))
+
+    #  TEST: store  ####################################################################################################
+
+    def test_store_creates_a_private_cache_directory(self):
+
+        self.cache.get_compiled(self.module.Config)
+
+        self.assertEqual(0o700, os.stat(self.cache.directory).st_mode & 0o777)
+
+    def test_store_ignores_classes_that_are_not_defined_in_a_module(self):
+
+        class _Config(self.module.Config):
+            pass
+
+        compiled = self.cache.get_compiled(_Config)
+        self.assertFalse(self.cache.store(_Config, compiled))
+        self.assertIsNone(self.cache.load(_Config))
+
+    #  TEST: write_pickle  #############################################################################################
+
+    def test_write_pickle_removes_the_temporary_file_if_writing_fails(self):
+
+        file_path = os.path.join(self.cache.directory, "entry.pickle")
+        disk_cache.write_pickle(file_path, {"value": 1})
+        with disk_cache.open_trusted_file(file_path) as f:
+            self.assertEqual({"value": 1}, pickle.load(f))
+
+        with self.assertRaises(Exception):
+            disk_cache.write_pickle(file_path, lambda: None)
+        self.assertEqual(["entry.pickle"], os.listdir(self.cache.directory))
+
+
+class _LegacyIntParser(int_parser.IntParser):
+
+    def _parse(self, argv: typing.Tuple[str, ...]) -> typing.Tuple[typing.Any, typing.Tuple[str, ...]]:
+
+        return 100 * int(argv[1]), argv[2:]
@@ -31,6 +31,10 @@
 # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
 
+import os
+import subprocess
+import sys
+import tempfile
 import typing
 import unittest
 
@@ -47,8 +51,138 @@ __email__ = "patrick.hohenecker@gmx.at"
 __status__ = "Development"
 
 
+IMPORT_TIME_BUDGET = 50000
+"""int: The maximum time, in microseconds, that ``import argmagiq`` may take according to ``python -X importtime``."""
+
+HEAVY_MODULES = (
+        "argmagiq.compiled_parser",
+        "argmagiq.config_spec",
+        "argmagiq.disk_cache",
+        "argmagiq.magiq_parser",
+        "insanity",
+        "inspect",
+        "json",
+        "pickle",
+        "textwrap"
+)
+"""tuple[str]: Modules that must not be imported by ``import argmagiq``."""
+
+PARSE_SCRIPT = """
+import sys
+
+import argmagiq
+
+
+class Config(object):
+
+    def __init__(self):
+        self._value = None
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    @value.setter
+    def value(self, value: int) -> None:
+        self._value = value
+
+
+sys.argv = ["app"] + {argv!r}
+argmagiq.parse_args(Config, "app", "An app.")
+print(",".join(m for m in {modules!r} if m in sys.modules))
+"""
+"""str: A script that parses the provided args, and prints which of the provided modules have been imported."""
+
+
 class InitTest(unittest.TestCase):
 
+    @staticmethod
+    def _run_python(*args: str) -> subprocess.CompletedProcess:
+        """Runs a Python process that can import ``argmagiq``, and returns the completed process."""
+
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.path.dirname(os.path.dirname(os.path.abspath(argmagiq.__file__)))
+
+        return subprocess.run([sys.executable, *args], env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                              universal_newlines=True, check=True)
+
+    def _run_parse_script(self, argv: typing.List[str], modules: typing.Iterable[str]) -> typing.List[str]:
+        """Parses the provided args in a separate process, and returns which of the provided modules were imported."""
+
+        process = self._run_python("-c", PARSE_SCRIPT.format(argv=argv, modules=tuple(modules)))
+        imported = process.stdout.splitlines()[-1]
+
+        return imported.split(",") if imported else []
+
+    #  TEST: import argmagiq  ##########################################################################################
+
+    def test_import_argmagiq_does_not_import_heavy_modules(self):
+
+        process = self._run_python(
+                "-c",
+                f"import sys, argmagiq; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+        )
+
+        self.assertEqual("", process.stdout.strip())
+
+    def test_import_argmagiq_stays_within_the_import_time_budget(self):
+
+        process = self._run_python("-X", "importtime", "-c", "import argmagiq")
+
+        # find the cumulative import time of the package in the output, which has the following format:
+        # import time: self [us] | cumulative | imported package
+        for line in process.stderr.splitlines():
+            fields = [f.strip() for f in line.split("|")]
+            if len(fields) == 3 and fields[2] == "argmagiq":
+                self.assertLess(int(fields[1]), IMPORT_TIME_BUDGET)
+                break
+        else:
+            self.fail("The import time of argmagiq was not reported")
+
+    def test_import_argmagiq_exports_classes_lazily(self):
+
+        import argmagiq.magiq_parser as magiq_parser
+
+        self.assertIs(magiq_parser.MagiqParser, argmagiq.MagiqParser)
+        self.assertIn("MagiqParser", dir(argmagiq))
+        with self.assertRaises(AttributeError):
+            argmagiq.DoesNotExist
+
+    def test_import_star_exports_all_public_names(self):
+
+        import argmagiq.magiq_parser as magiq_parser
+        import argmagiq.parsers.data_type_parser as data_type_parser
+
+        namespace = {}
+        exec("from argmagiq import *", namespace)
+
+        self.assertIs(magiq_parser.MagiqParser, namespace["MagiqParser"])
+        self.assertIs(data_type_parser.DataTypeParser, namespace["DataTypeParser"])
+        self.assertIs(argmagiq.config, namespace["config"])
+        self.assertIs(argmagiq.parse_args, namespace["parse_args"])
+        self.assertLessEqual(set(argmagiq.__all__), set(namespace))
+
+    def test_parsing_args_imports_the_modules_needed_for_the_chosen_path_only(self):
+
+        self.assertEqual(
+                [],
+                self._run_parse_script(["--value", "1"], ["json", "pickle", "textwrap"])
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+
+            config_path = os.path.join(temp_dir, "config.json")
+            with open(config_path, "w") as f:
+                f.write('{"value": 1}')
+
+            self.assertEqual(
+                    ["json"],
+                    self._run_parse_script(["--", config_path], ["json", "pickle", "textwrap"])
+            )
+        self.assertEqual(
+                ["textwrap"],
+                self._run_parse_script(["--help"], ["json", "pickle", "textwrap"])
+        )
+
     #  TEST: extract_config  ###########################################################################################
 
     def test_extract_config_raises_a_type_error_if_none_is_provided(self):
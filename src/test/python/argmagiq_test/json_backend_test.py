@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import os
+import unittest
+import unittest.mock as mock
+
+import argmagiq.json_backend as json_backend
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+class JsonBackendTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.backends = [json_backend.JsonBackend(name) for name in json_backend.available_backends()]
+
+    #  TEST: __init__  #################################################################################################
+
+    def test_init_raises_a_value_error_if_the_backend_is_not_supported(self):
+
+        with self.assertRaises(ValueError):
+            json_backend.JsonBackend("pickle")
+
+    #  TEST: loads  ####################################################################################################
+
+    def test_loads_decodes_the_same_data_with_all_backends(self):
+
+        data = b'{"conf_1": true, "conf_2": 666, "conf_3": 0.5, "conf_4": "\\u00e4", "conf_5": [1, 2, null]}'
+        expected = {"conf_1": True, "conf_2": 666, "conf_3": 0.5, "conf_4": "ä", "conf_5": [1, 2, None]}
+
+        self.assertIn("json", [b.name for b in self.backends])
+        for backend in self.backends:
+            with self.subTest(backend=backend.name):
+                self.assertEqual(expected, backend.loads(data))
+                self.assertEqual(expected, backend.loads(data.decode()))
+
+    def test_loads_decodes_data_that_is_only_supported_by_the_standard_library_with_all_backends(self):
+
+        for data, expected in [
+                (b'{"conf": Infinity}', {"conf": float("inf")}),
+                (b'{"conf": -Infinity}', {"conf": float("-inf")}),
+                (b'{"conf": 123456789012345678901234567890}', {"conf": 123456789012345678901234567890}),
+                (b'{"conf": -9223372036854775809}', {"conf": -9223372036854775809}),
+                (b'{"conf": [18446744073709551616]}', {"conf": [18446744073709551616]})
+        ]:
+            for backend in self.backends:
+                with self.subTest(backend=backend.name, data=data):
+                    for value in [backend.loads(data), backend.loads(data.decode())]:
+                        self.assertEqual(expected, value)
+                        self.assertEqual(type(expected["conf"]), type(value["conf"]))
+
+    def test_loads_decodes_long_floats_and_strings_with_all_backends(self):
+
+        data = b'{"conf_1": 12345678901234567890.5, "conf_2": 1.12345678901234567890, "conf_3": "12345678901234567890"}'
+        expected = {"conf_1": 12345678901234567890.5, "conf_2": 1.1234567890123457, "conf_3": "12345678901234567890"}
+
+        for backend in self.backends:
+            with self.subTest(backend=backend.name):
+                self.assertEqual(expected, backend.loads(data))
+
+    def test_loads_raises_a_json_decode_error_if_the_data_is_invalid(self):
+
+        for backend in self.backends:
+            with self.subTest(backend=backend.name):
+                with self.assertRaises(json_backend.JsonDecodeError):
+                    backend.loads(b'{"conf_1": ')
+
+    #  TEST: get_backend  ##############################################################################################
+
+    def test_get_backend_prefers_the_backend_specified_by_the_environment(self):
+
+        with mock.patch.object(json_backend, "_default_backend", None):
+            with mock.patch.dict(os.environ, {json_backend.BACKEND_ENV_VAR: "json"}):
+                backend = json_backend.get_backend()
+            self.assertEqual("json", backend.name)
+            self.assertIs(backend, json_backend.get_backend())
+
+    def test_get_backend_chooses_the_first_available_backend_by_default(self):
+
+        with mock.patch.object(json_backend, "_default_backend", None):
+            with mock.patch.dict(os.environ):
+                os.environ.pop(json_backend.BACKEND_ENV_VAR, None)
+                self.assertEqual(json_backend.available_backends()[0], json_backend.get_backend().name)
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import os
+import tempfile
+import unittest
+import unittest.mock as mock
+
+import argmagiq.json_backend as json_backend
+import argmagiq.json_pointer as json_pointer
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+RECORD_PATH = "src/test/resources/valid_test_record.json"
+"""str: The path of a JSON file that contains a configuration among other data."""
+
+
+class JsonPointerTest(unittest.TestCase):
+
+    #  TEST: split_path  ###############################################################################################
+
+    def test_split_path_splits_off_the_json_pointer_at_the_last_separator(self):
+
+        self.assertEqual((RECORD_PATH, None), json_pointer.split_path(RECORD_PATH))
+        self.assertEqual((RECORD_PATH, "/config/model"), json_pointer.split_path(RECORD_PATH + "#/config/model"))
+        self.assertEqual(("a#b.json", "/c"), json_pointer.split_path("a#b.json#/c"))
+
+    def test_split_path_does_not_split_paths_of_existing_files(self):
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+
+            file_path = os.path.join(temp_dir, "config.json#a")
+            open(file_path, "w").close()
+
+            self.assertEqual((file_path, None), json_pointer.split_path(file_path))
+
+    #  TEST: parse_pointer  ############################################################################################
+
+    def test_parse_pointer_unescapes_reference_tokens(self):
+
+        self.assertEqual([], json_pointer.parse_pointer(""))
+        self.assertEqual(["a/b", "c~d", ""], json_pointer.parse_pointer("/a~1b/c~0d/"))
+        with self.assertRaises(ValueError):
+            json_pointer.parse_pointer("config")
+
+    #  TEST: load  #####################################################################################################
+
+    def test_load_loads_the_addressed_value(self):
+
+        self.assertEqual({"conf_1": True, "conf_2": 666}, json_pointer.load(RECORD_PATH, "/config/model"))
+        self.assertEqual(0.5, json_pointer.load(RECORD_PATH, "/metrics/loss/1"))
+        self.assertEqual({"step": 1}, json_pointer.load(RECORD_PATH, "/log/1"))
+        self.assertIsNone(json_pointer.load(RECORD_PATH, "/log/2"))
+        self.assertEqual(
+                "braces {[ and \"quotes\" in strings",
+                json_pointer.load(RECORD_PATH, "/metrics/notes")
+        )
+
+    def test_load_decodes_the_addressed_value_only(self):
+
+        class _RecordingBackend(json_backend.JsonBackend):
+
+            def __init__(self):
+                super().__init__("json")
+                self.decoded = []
+
+            def loads(self, data):
+                self.decoded.append(bytes(data))
+                return super().loads(data)
+
+        backend = _RecordingBackend()
+        json_pointer.load(RECORD_PATH, "/config/model", backend=backend)
+
+        self.assertEqual([b'{"conf_1": true, "conf_2": 666}'], backend.decoded)
+
+    def test_load_skips_containers_that_span_multiple_chunks(self):
+
+        for chunk_size in range(1, 8):
+            with self.subTest(chunk_size=chunk_size):
+                with mock.patch.object(json_pointer, "_CHUNK_SIZE", chunk_size):
+                    self.assertEqual({"conf_1": True, "conf_2": 666}, json_pointer.load(RECORD_PATH, "/config/model"))
+                    self.assertEqual({"step": 1}, json_pointer.load(RECORD_PATH, "/log/1"))
+
+    def test_load_handles_escaped_keys(self):
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+
+            file_path = os.path.join(temp_dir, "record.json")
+            with open(file_path, "w") as f:
+                f.write('{"a\\"b": 1, "c/d": {"\\u00e4": [2, 3]}}')
+
+            self.assertEqual(1, json_pointer.load(file_path, '/a"b'))
+            self.assertEqual(3, json_pointer.load(file_path, "/c~1d/ä/1"))
+
+    def test_load_uses_the_last_member_if_a_key_occurs_multiple_times(self):
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+
+            file_path = os.path.join(temp_dir, "record.json")
+            with open(file_path, "w") as f:
+                f.write('{"config": {"lr": 1}, "seed": 1, "config": {"lr": 2}}')
+
+            self.assertEqual({"lr": 2}, json_pointer.load(file_path, "/config"))
+
+    def test_load_raises_a_key_error_if_the_addressed_value_does_not_exist(self):
+
+        for pointer in ["/does-not-exist", "/config/model/conf_3", "/log/4", "/log/01", "/config/model/conf_1/x"]:
+            with self.subTest(pointer=pointer):
+                with self.assertRaises(KeyError):
+                    json_pointer.load(RECORD_PATH, pointer)
+
+    def test_load_raises_a_json_decode_error_if_the_file_is_invalid(self):
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+
+            file_path = os.path.join(temp_dir, "record.json")
+            for content in [b'{"a": [1, 2', b'{"a" 1}', b"", b'{"a": {"b": }, "c": 1}', b'{"\xff": 1, "a": 2}']:
+                with self.subTest(content=content):
+
+                    with open(file_path, "wb") as f:
+                        f.write(content)
+
+                    with self.assertRaises(json_backend.JsonDecodeError):
+                        json_pointer.load(file_path, "/a/5")
+
+    #  TEST: locate  ###################################################################################################
+
+    def test_locate_finds_the_encoded_addressed_value(self):
+
+        data = b'{"config": {"model": {"conf_1": true}, "seed": 1}, "log": [1, 2]}'
+
+        start, end = json_pointer.locate(data, "/config/model")
+        self.assertEqual(b'{"conf_1": true}', data[start:end])
+        start, end = json_pointer.locate(data, "/log/1")
+        self.assertEqual(b"2", data[start:end])
+        with self.assertRaises(KeyError):
+            json_pointer.locate(data, "/config/conf_2")
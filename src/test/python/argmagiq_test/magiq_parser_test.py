@@ -31,12 +31,19 @@
 # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
 
+import concurrent.futures
+import io
+import os
 import sys
+import tempfile
+import typing
 import unittest
 import unittest.mock as mock
 
+import argmagiq.compiled_parser as compiled_parser
 import argmagiq.config_spec as config_spec
 import argmagiq.magiq_parser as magiq_parser
+import argmagiq.result_cache as result_cache
 import argmagiq.value_spec as value_spec
 
 
@@ -60,80 +67,223 @@ class MagiqParserTest(unittest.TestCase):
 
         self.parser = magiq_parser.MagiqParser(_TestConfig, "name", "description")
 
-    #  TEST: _read_args_from_command_line  #############################################################################
+    #  TEST: parse_args  ###############################################################################################
 
-    def test_read_args_from_command_line_parses_args_correctly(self):
+    def test_parse_args_invokes_the_right_method_for_parsing_args(self):
 
-        parsed_args = magiq_parser.MagiqParser._read_args_from_command_line(
-                self.spec,
-                ("--conf-1", "--conf-2", "666")
-        )
-        self.assertEqual(
-                {"conf_1": True, "conf_2": 666},
-                parsed_args
-        )
+        parsed_args = {"conf_1": True, "conf_2": 666}
 
-    def test_read_args_from_command_line_raises_a_value_error_if_an_unknown_arg_is_encountered(self):
+        self.assertEqual(self.spec, self.parser.compiled.spec)
 
-        with self.assertRaises(ValueError):
-            magiq_parser.MagiqParser._read_args_from_command_line(
-                    self.spec,
-                    ("--conf-1", "--this-one-does-not-exist", "--conf-2", "666")
-            )
+        with mock.patch.object(
+                compiled_parser.CompiledParser,
+                "parse",
+                return_value=parsed_args
+        ) as mock_method:
+
+            sys.argv = ["app", "--conf-1", "--conf-2", "666"]
+            self.parser.parse_args()
 
-    #  TEST: _read_args_from_file  #####################################################################################
+        mock_method.assert_called_once_with(("--conf-1", "--conf-2", "666"), expand_response_files=True)
 
-    def test_read_args_from_file_parses_args_correctly(self):
+        with mock.patch.object(
+                compiled_parser.CompiledParser,
+                "parse_file",
+                return_value=parsed_args
+        ) as mock_method:
 
-        parsed_args = magiq_parser.MagiqParser._read_args_from_file(
-                self.spec,
-                "src/test/resources/valid_test_config.json"
-        )
-        self.assertEqual(
-                {"conf_1": True, "conf_2": 666},
-                parsed_args
+            sys.argv = ["app", "--", "/src/main/resources/valid_test_config.json"]
+            self.parser.parse_args()
+
+        mock_method.assert_called_once_with("/src/main/resources/valid_test_config.json", result_cache=None)
+
+    def test_parse_args_populates_the_configuration_class(self):
+
+        sys.argv = ["app", "--conf-1", "--conf-2", "666"]
+        config = self.parser.parse_args()
+
+        self.assertIsInstance(config, _TestConfig)
+        self.assertTrue(config.conf_1)
+        self.assertEqual(666, config.conf_2)
+
+    def test_parse_args_reuses_the_compiled_parser(self):
+
+        self.assertIs(
+                self.parser.compiled,
+                magiq_parser.MagiqParser(_TestConfig, "another name", "another description").compiled
         )
 
-    def test_read_args_from_file_raises_a_value_error_if_an_unknown_arg_is_encountered(self):
 
-        with self.assertRaises(ValueError):
-            magiq_parser.MagiqParser._read_args_from_file(
-                    self.spec,
-                    "src/test/resources/invalid_test_config.json"
-            )
+    #  TEST: parse  ####################################################################################################
+
+    def test_parse_parses_the_provided_args_instead_of_sys_argv(self):
+
+        sys.argv = ["app", "--conf-2", "1"]
+        config = self.parser.parse(["--conf-1", "--conf-2", "666"])
+
+        self.assertEqual((True, 666), (config.conf_1, config.conf_2))
+        self.assertEqual(1, self.parser.parse().conf_2)
+
+    def test_parse_expands_response_files_in_sys_argv_only(self):
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+
+            file_path = os.path.join(temp_dir, "args.txt")
+            with open(file_path, "w") as f:
+                f.write("--conf-1 --conf-2 666")
+
+            sys.argv = ["app", f"@{file_path}"]
+            config = self.parser.parse()
+            self.assertEqual((True, 666), (config.conf_1, config.conf_2))
+
+            with self.assertRaisesRegex(ValueError, "Unknown option: '@"):
+                self.parser.parse([f"@{file_path}"])
+            self.assertIsInstance(next(self.parser.parse_many([[f"@{file_path}"]])), ValueError)
+
+            config = self.parser.parse([f"@{file_path}"], expand_response_files=True)
+            self.assertEqual((True, 666), (config.conf_1, config.conf_2))
+
+    def test_parse_merges_files_and_command_line_args_from_left_to_right(self):
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+
+            override_path = os.path.join(temp_dir, "override.json")
+            with open(override_path, "w") as f:
+                f.write('{"conf_2": 1}')
+
+            config = self.parser.parse(["--", "src/test/resources/valid_test_config.json", "--", override_path])
+            self.assertEqual((True, 1), (config.conf_1, config.conf_2))
+
+            config = self.parser.parse(["--", "src/test/resources/valid_test_config.json", "--conf-2", "2"])
+            self.assertEqual((True, 2), (config.conf_1, config.conf_2))
+
+    def test_parse_uses_the_result_cache_for_config_files(self):
+
+        cache = result_cache.ResultCache()
+        parser = magiq_parser.MagiqParser(_TestConfig, result_cache=cache)
 
-    def test_read_args_from_file_raises_a_value_error_if_the_config_file_does_not_exist(self):
+        for _ in range(3):
+            config = parser.parse(["--", "src/test/resources/valid_test_config.json", "--conf-2", "1"])
+            self.assertEqual((True, 1), (config.conf_1, config.conf_2))
 
+        self.assertEqual((2, 1), (cache.hits, cache.misses))
+
+    def test_parse_can_be_invoked_from_multiple_threads_concurrently(self):
+
+        def _parse(i: int) -> typing.Tuple[int, typing.Any]:
+            if i % 3 == 0:
+                return i, self.parser.parse(["--conf-2", str(i)] + (["--conf-1"] if i % 2 else []))
+            elif i % 3 == 1:
+                return i, self.parser.parse_dict({"conf_1": i % 2 == 1, "conf_2": i})
+            else:
+                return i, magiq_parser.MagiqParser(_TestConfig).parse(["--conf-1", "--conf-2", str(i)])
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(_parse, range(3000)))
+
+        for i, config in results:
+            self.assertEqual(i, config.conf_2)
+            self.assertEqual(i % 3 == 2 or i % 2 == 1, config.conf_1)
+
+    #  TEST: parse_dict  ###############################################################################################
+
+    def test_parse_dict_parses_the_provided_mapping(self):
+
+        config = self.parser.parse_dict({"conf_1": True, "conf_2": 666})
+        self.assertEqual((True, 666), (config.conf_1, config.conf_2))
+
+        with self.assertRaises(ValueError):
+            self.parser.parse_dict({"conf_1": True})
         with self.assertRaises(ValueError):
-            magiq_parser.MagiqParser._read_args_from_file(self.spec, "/does/not/exist.json")
+            self.parser.parse_dict({"conf_2": 666, "conf_3": "does not exist"})
+        with self.assertRaises(ValueError):
+            self.parser.parse_dict(["not", "a", "mapping"])
 
-    #  TEST: parse_args  ###############################################################################################
+    #  TEST: parse_jsonl  ##############################################################################################
 
-    def test_parse_args_invokes_the_right_method_for_parsing_args(self):
+    def test_parse_jsonl_creates_one_config_per_line(self):
 
-        parsed_args = {"conf_1": True, "conf_2": 666}
+        results = list(self.parser.parse_jsonl("src/test/resources/valid_test_configs.jsonl"))
 
-        with mock.patch.object(
-                magiq_parser.MagiqParser,
-                "_read_args_from_command_line",
-                return_value=parsed_args
-        ) as mock_method:
+        self.assertEqual(4, len(results))
+        self.assertEqual((True, 1), (results[0].conf_1, results[0].conf_2))
+        self.assertIsInstance(results[1], ValueError)
+        self.assertIsInstance(results[2], ValueError)
+        self.assertEqual((False, 4), (results[3].conf_1, results[3].conf_2))
 
-            sys.argv = ["app", "--conf-1", "--conf-2", "666"]
-            self.parser.parse_args()
+    def test_parse_jsonl_reads_the_file_path_from_sys_argv_by_default(self):
 
-        mock_method.assert_called_once_with(self.spec, ("--conf-1", "--conf-2", "666"))
+        with mock.patch.object(sys, "argv", ["name", "--", "-"]):
+            with mock.patch.object(sys, "stdin", io.StringIO('{"conf_2": 1}\n')):
+                results = list(self.parser.parse_jsonl())
 
-        with mock.patch.object(
-                magiq_parser.MagiqParser,
-                "_read_args_from_file",
-                return_value=parsed_args
-        ) as mock_method:
+        self.assertEqual(1, len(results))
+        self.assertEqual(1, results[0].conf_2)
 
-            sys.argv = ["app", "--", "/src/main/resources/valid_test_config.json"]
-            self.parser.parse_args()
+        with mock.patch.object(sys, "argv", ["name", "--conf-2", "1"]):
+            with self.assertRaises(ValueError):
+                next(self.parser.parse_jsonl())
+
+    #  TEST: parse_many  ###############################################################################################
+
+    def test_parse_many_parses_all_args_lazily_and_yields_errors_per_item(self):
+
+        def _generate_argvs():
+            yield ["--conf-2", "1"]
+            yield ["--conf-2", "not-a-number"]
+            yield ["--conf-1", "--conf-2", "3"]
+            yield ["--", "src/test/resources/valid_test_config.json"]
+            raise AssertionError("parse_many has to be lazy")
+
+        results = self.parser.parse_many(_generate_argvs())
+
+        config = next(results)
+        self.assertEqual((False, 1), (config.conf_1, config.conf_2))
+        self.assertIsInstance(next(results), ValueError)
+        config = next(results)
+        self.assertEqual((True, 3), (config.conf_1, config.conf_2))
+        config = next(results)
+        self.assertEqual((True, 666), (config.conf_1, config.conf_2))
+
+    #  TEST: parse_many_files  #########################################################################################
+
+    def test_parse_many_files_parses_all_files_and_yields_errors_per_item(self):
+
+        results = list(
+                self.parser.parse_many_files(
+                        [
+                                "src/test/resources/valid_test_config.json",
+                                "src/test/resources/invalid_test_config.json",
+                                "/does/not/exist.json"
+                        ]
+                )
+        )
 
-        mock_method.assert_called_once_with(self.spec, "/src/main/resources/valid_test_config.json")
+        self.assertEqual(3, len(results))
+        self.assertEqual((True, 666), (results[0].conf_1, results[0].conf_2))
+        self.assertIsInstance(results[1], ValueError)
+        self.assertIsInstance(results[2], ValueError)
+
+
+    #  TEST: parse_with_provenance  ####################################################################################
+
+    def test_parse_with_provenance_records_the_source_of_every_value(self):
+
+        config, provenance = self.parser.parse_with_provenance(
+                ["--", "src/test/resources/valid_test_config.json", "--conf-2", "2"]
+        )
+        self.assertEqual((True, 2), (config.conf_1, config.conf_2))
+        self.assertEqual(
+                {"conf_1": "src/test/resources/valid_test_config.json", "conf_2": compiled_parser.COMMAND_LINE_SOURCE},
+                provenance
+        )
+
+        config, provenance = self.parser.parse_with_provenance(["--conf-2", "3"])
+        self.assertEqual((False, 3), (config.conf_1, config.conf_2))
+        self.assertEqual(
+                {"conf_1": compiled_parser.DEFAULT_SOURCE, "conf_2": compiled_parser.COMMAND_LINE_SOURCE},
+                provenance
+        )
 
 
 class _TestConfig(object):
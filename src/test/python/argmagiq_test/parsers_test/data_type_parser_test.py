@@ -35,6 +35,7 @@ import typing
 import unittest
 
 import argmagiq.parsers.data_type_parser as data_type_parser
+import argmagiq.parsers.str_parser as str_parser
 import argmagiq.value_spec as value_spec
 
 
@@ -50,6 +51,16 @@ __status__ = "Development"
 
 class DataTypeParserTest(unittest.TestCase):
 
+    #  TEST: __init__  #################################################################################################
+
+    def test_init_raises_a_type_error_if_no_parsing_procedure_is_implemented(self):
+
+        class _IncompleteParser(data_type_parser.DataTypeParser):
+            pass
+
+        with self.assertRaises(TypeError):
+            _IncompleteParser(value_spec.ValueSpec("some_config", "Just a test", str, True, None))
+
     #  TEST: fires  ####################################################################################################
 
     def test_fires_yields_the_expected_values(self):
@@ -72,6 +83,32 @@ class DataTypeParserTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             parser.parse(("smth different entirely",))
 
+    #  TEST: parse_at  #################################################################################################
+
+    def test_parse_at_is_derived_from_parse_for_legacy_parsers(self):
+
+        parser = _LegacyParser(value_spec.ValueSpec("some_config", "Just a test", str, True, None))
+
+        self.assertEqual(("value", 2), parser.parse_at(("--smth-else", "--some-config", "value", "--smth-else"), 1))
+
+    def test_parse_at_prefers_legacy_parse_over_inherited_parse_at(self):
+
+        class _LegacyStrParser(str_parser.StrParser):
+
+            def _parse(self, argv: typing.Tuple[str, ...]) -> typing.Tuple[typing.Any, typing.Tuple[str, ...]]:
+                return "legacy", argv[1:]
+
+        parser = _LegacyStrParser(value_spec.ValueSpec("some_config", "Just a test", str, True, None))
+
+        self.assertEqual(("legacy", 1), parser.parse_at(("--some-config", "value"), 0))
+
+    def test_parse_at_raises_a_value_error_if_the_parser_does_not_fire(self):
+
+        parser = _LegacyParser(value_spec.ValueSpec("some_config", "Just a test", str, True, None))
+
+        with self.assertRaises(ValueError):
+            parser.parse_at(("--some-config", "value"), 1)
+
     #  TEST: parse_json  ###############################################################################################
 
     def test_parse_json_raises_a_type_error_if_the_provided_value_does_not_comply_with_the_spec(self):
@@ -93,3 +130,10 @@ class _DummyParser(data_type_parser.DataTypeParser):
     def _parse(self, argv: typing.Tuple[str, ...]) -> typing.Tuple[typing.Any, typing.Tuple[str, ...]]:
 
         return "nothing", argv
+
+
+class _LegacyParser(data_type_parser.DataTypeParser):
+
+    def _parse(self, argv: typing.Tuple[str, ...]) -> typing.Tuple[typing.Any, typing.Tuple[str, ...]]:
+
+        return argv[1], argv[2:]
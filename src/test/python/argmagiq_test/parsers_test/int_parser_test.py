@@ -80,3 +80,14 @@ class IntParserTest(unittest.TestCase):
         value, argv = parser._parse(("--some-config", "666"))
         self.assertIsInstance(value, int)
         self.assertEqual((666, tuple()), (value, argv))
+
+    #  TEST: _parse_at  ################################################################################################
+
+    def test_parse_at_extracts_args_at_the_provided_position_as_expected(self):
+
+        parser = int_parser.IntParser(value_spec.ValueSpec("some_config", "Just a test", int, True, None))
+        argv = "--another-config", "another value", "--some-config", "666"
+
+        self.assertEqual((666, 2), parser._parse_at(argv, 2))
+        with self.assertRaises(ValueError):
+            parser._parse_at(argv[:3], 2)
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import enum
+import pathlib
+import typing
+import unittest
+import unittest.mock as mock
+
+import argmagiq.compiled_parser as compiled_parser
+import argmagiq.config_spec as config_spec
+import argmagiq.parsers.bool_parser as bool_parser
+import argmagiq.parsers.int_parser as int_parser
+import argmagiq.parsers.parser_registry as parser_registry
+import argmagiq.parsers.str_parser as str_parser
+import argmagiq.value_spec as value_spec
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+class ParserRegistryTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.registry = parser_registry.ParserRegistry(use_entry_points=False)
+
+    #  TEST: lookup  ###################################################################################################
+
+    def test_lookup_finds_the_builtin_parsers_in_the_default_registry(self):
+
+        self.assertIs(bool_parser.BoolParser, parser_registry.REGISTRY.lookup(bool))
+        self.assertIs(int_parser.IntParser, parser_registry.REGISTRY.lookup(int))
+        self.assertIs(str_parser.StrParser, parser_registry.REGISTRY.lookup(str))
+
+    def test_lookup_follows_the_mro_of_data_types(self):
+
+        self.registry.register(pathlib.PurePath, _PathParser)
+        self.registry.register(int, int_parser.IntParser)
+
+        self.assertIs(_PathParser, self.registry.lookup(pathlib.PosixPath))
+        self.assertIs(int_parser.IntParser, self.registry.lookup(bool))
+        self.assertIsNone(self.registry.lookup(float))
+
+        self.registry.register(bool, bool_parser.BoolParser)
+        self.assertIs(bool_parser.BoolParser, self.registry.lookup(bool))
+
+    def test_lookup_does_not_use_parsers_of_types_that_are_mixed_into_enums(self):
+
+        self.registry.register(int, int_parser.IntParser)
+        self.registry.register(str, str_parser.StrParser)
+
+        self.assertIsNone(self.registry.lookup(_IntColor))
+        self.assertIsNone(self.registry.lookup(_StrColor))
+
+        self.registry.register(enum.Enum, _PathParser)
+        self.assertIs(_PathParser, self.registry.lookup(_IntColor))
+        self.assertIs(_PathParser, self.registry.lookup(_StrColor))
+
+    def test_lookup_loads_parsers_from_entry_points_lazily(self):
+
+        entry_point = mock.Mock()
+        entry_point.name = "pathlib.PurePath"
+        entry_point.load.return_value = _PathParser
+
+        with mock.patch.object(parser_registry, "_find_entry_points", return_value=[entry_point]) as mock_find:
+
+            registry = parser_registry.ParserRegistry()
+            registry.register(int, int_parser.IntParser)
+            self.assertIs(int_parser.IntParser, registry.lookup(int))
+            mock_find.assert_not_called()
+
+            self.assertIs(_PathParser, registry.lookup(pathlib.Path))
+            self.assertIs(_PathParser, registry.lookup(pathlib.PurePosixPath))
+            mock_find.assert_called_once_with(parser_registry.ENTRY_POINT_GROUP)
+            entry_point.load.assert_called_once()
+
+    def test_lookup_raises_a_type_error_if_an_entry_point_does_not_provide_a_parser(self):
+
+        entry_point = mock.Mock()
+        entry_point.name = "pathlib.PurePath"
+        entry_point.load.return_value = str
+
+        with mock.patch.object(parser_registry, "_find_entry_points", return_value=[entry_point]):
+            with self.assertRaises(TypeError):
+                parser_registry.ParserRegistry().lookup(pathlib.Path)
+
+    #  TEST: register  #################################################################################################
+
+    def test_register_raises_a_type_error_if_args_of_an_illegal_type_are_provided(self):
+
+        with self.assertRaises(TypeError):
+            self.registry.register("not a type", _PathParser)
+        with self.assertRaises(TypeError):
+            self.registry.register(pathlib.Path, str)
+
+    def test_register_invalidates_cached_lookups(self):
+
+        self.assertIsNone(self.registry.lookup(pathlib.Path))
+        version = self.registry.version
+
+        self.registry.register(pathlib.Path, _PathParser)
+        self.assertIs(_PathParser, self.registry.lookup(pathlib.Path))
+        self.assertGreater(self.registry.version, version)
+
+        self.registry.unregister(pathlib.Path)
+        self.assertIsNone(self.registry.lookup(pathlib.Path))
+
+    def test_registered_parsers_are_used_for_parsing_configurations(self):
+
+        spec = config_spec.ConfigSpec()
+        spec.add_value(value_spec.ValueSpec("path", "A path.", pathlib.Path, True, None))
+
+        with self.assertRaises(ValueError):
+            compiled_parser.CompiledParser(spec)
+
+        with mock.patch.object(parser_registry, "REGISTRY", self.registry):
+            self.registry.register(pathlib.Path, _PathParser)
+            parser = compiled_parser.CompiledParser(spec)
+
+        self.assertEqual({"path": pathlib.Path("/some/path")}, parser.parse(["--path", "/some/path"]))
+
+
+class _IntColor(enum.IntEnum):
+
+    RED = 1
+    GREEN = 2
+
+
+class _StrColor(str, enum.Enum):
+
+    RED = "red"
+    GREEN = "green"
+
+
+class _PathParser(str_parser.StrParser):
+
+    def _parse_at(self, argv: typing.Tuple[str, ...], index: int) -> typing.Tuple[typing.Any, int]:
+
+        value, num_consumed = super()._parse_at(argv, index)
+        return pathlib.Path(value), num_consumed
+
+    def parse_json(self, json_value: typing.Any) -> typing.Any:
+
+        return pathlib.Path(json_value)
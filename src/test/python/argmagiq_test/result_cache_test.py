@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import hashlib
+import os
+import tempfile
+import unittest
+import unittest.mock as mock
+
+import argmagiq.compiled_parser as compiled_parser
+import argmagiq.config_spec as config_spec
+import argmagiq.result_cache as result_cache
+import argmagiq.value_spec as value_spec
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+class ResultCacheTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.spec = config_spec.ConfigSpec()
+        self.spec.add_value(value_spec.ValueSpec("conf_1", "No description available.", bool, False, False))
+        self.spec.add_value(value_spec.ValueSpec("conf_2", "No description available.", int, True, None))
+
+        self.parser = compiled_parser.CompiledParser(self.spec)
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.config_path = os.path.join(self.temp_dir.name, "config.json")
+        self._write_config('{"conf_1": true, "conf_2": 666}')
+
+    def tearDown(self):
+
+        self.temp_dir.cleanup()
+
+    def _write_config(self, content: str, mtime_ns: int = None) -> None:
+        """Writes the config file used for testing."""
+
+        with open(self.config_path, "w") as f:
+            f.write(content)
+        if mtime_ns is not None:
+            os.utime(self.config_path, ns=(mtime_ns, mtime_ns))
+
+    #  TEST: load  #####################################################################################################
+
+    def test_load_serves_repeated_parses_from_memory_without_decoding(self):
+
+        cache = result_cache.ResultCache()
+
+        self.assertEqual({"conf_1": True, "conf_2": 666}, self.parser.parse_file(self.config_path, result_cache=cache))
+        with mock.patch.object(compiled_parser.CompiledParser, "_read_args_from_dict") as mock_method:
+            self.assertEqual(
+                    {"conf_1": True, "conf_2": 666},
+                    self.parser.parse_file(self.config_path, result_cache=cache)
+            )
+        mock_method.assert_not_called()
+        self.assertEqual((1, 1, 1), tuple(cache.cache_info()))
+
+    def test_load_ignores_entries_of_modified_files(self):
+
+        cache = result_cache.ResultCache()
+
+        self.parser.parse_file(self.config_path, result_cache=cache)
+        self._write_config('{"conf_2": 1}', mtime_ns=os.stat(self.config_path).st_mtime_ns + 10 ** 9)
+
+        self.assertEqual({"conf_2": 1}, self.parser.parse_file(self.config_path, result_cache=cache))
+
+    def test_load_detects_modifications_that_preserve_size_and_mtime_if_contents_are_hashed(self):
+
+        cache = result_cache.ResultCache(hash_contents=True)
+        mtime_ns = os.stat(self.config_path).st_mtime_ns
+
+        self.parser.parse_file(self.config_path, result_cache=cache)
+        self._write_config('{"conf_1": true, "conf_2": 777}', mtime_ns=mtime_ns)
+
+        self.assertEqual({"conf_1": True, "conf_2": 777}, self.parser.parse_file(self.config_path, result_cache=cache))
+
+    def test_load_hashes_only_the_addressed_value_of_files_with_json_pointers(self):
+
+        cache = result_cache.ResultCache(hash_contents=True)
+        self._write_config('{"model": {"conf_1": true, "conf_2": 666}, "log": [1]}')
+
+        with open(self.config_path, "rb") as f:
+            file_hash = hashlib.sha256(f.read()).hexdigest()
+        self.assertEqual(file_hash, cache.create_key(self.parser, self.config_path)[-1])
+        self.assertEqual(
+                hashlib.sha256(b'{"conf_1": true, "conf_2": 666}').hexdigest(),
+                cache.create_key(self.parser, self.config_path + "#/model")[-1]
+        )
+
+        # the value is hashed as part of the key, which is why modifying it invalidates the cache entry
+        mtime_ns = os.stat(self.config_path).st_mtime_ns
+        self.parser.parse_file(self.config_path + "#/model", result_cache=cache)
+        self._write_config('{"model": {"conf_1": true, "conf_2": 777}, "log": [1]}', mtime_ns=mtime_ns)
+        self.assertEqual(
+                {"conf_1": True, "conf_2": 777},
+                self.parser.parse_file(self.config_path + "#/model", result_cache=cache)
+        )
+
+    def test_load_ignores_entries_of_other_parsers(self):
+
+        cache = result_cache.ResultCache()
+        self.parser.parse_file(self.config_path, result_cache=cache)
+
+        spec = config_spec.ConfigSpec()
+        spec.add_value(value_spec.ValueSpec("conf_1", "No description available.", bool, False, False))
+        spec.add_value(value_spec.ValueSpec("conf_2", "No description available.", float, True, None))
+        parsed_args = compiled_parser.CompiledParser(spec).parse_file(self.config_path, result_cache=cache)
+
+        self.assertIsInstance(parsed_args["conf_2"], float)
+        self.assertEqual(2, cache.misses)
+
+    def test_load_reads_entries_from_the_cache_directory(self):
+
+        cache_dir = os.path.join(self.temp_dir.name, "cache")
+        self.parser.parse_file(self.config_path, result_cache=result_cache.ResultCache(directory=cache_dir))
+
+        cache = result_cache.ResultCache(directory=cache_dir)
+        with mock.patch.object(compiled_parser.CompiledParser, "_read_args_from_dict") as mock_method:
+            self.assertEqual(
+                    {"conf_1": True, "conf_2": 666},
+                    self.parser.parse_file(self.config_path, result_cache=cache)
+            )
+        mock_method.assert_not_called()
+        self.assertEqual(1, cache.hits)
+
+    def test_load_ignores_entries_that_are_not_owned_by_the_current_user(self):
+
+        cache_dir = os.path.join(self.temp_dir.name, "cache")
+        cache = result_cache.ResultCache(directory=cache_dir)
+        cache.store(("key",), {"conf_2": 666})
+
+        with mock.patch.object(os, "getuid", return_value=os.getuid() + 1):
+            self.assertIsNone(result_cache.ResultCache(directory=cache_dir).load(("key",)))
+        self.assertEqual({"conf_2": 666}, result_cache.ResultCache(directory=cache_dir).load(("key",)))
+
+        # entries that are writable by others are ignored as well
+        os.chmod(cache._get_entry_path(("key",)), 0o666)
+        self.assertIsNone(result_cache.ResultCache(directory=cache_dir).load(("key",)))
+
+    #  TEST: store  ####################################################################################################
+
+    def test_store_creates_a_private_cache_directory(self):
+
+        cache_dir = os.path.join(self.temp_dir.name, "cache")
+        result_cache.ResultCache(directory=cache_dir).store(("key",), {"conf_2": 666})
+
+        self.assertEqual(0o700, os.stat(cache_dir).st_mode & 0o777)
+
+    def test_store_evicts_the_least_recently_used_entries(self):
+
+        cache = result_cache.ResultCache(max_size=2)
+        keys = [(idx,) for idx in range(3)]
+
+        cache.store(keys[0], {"conf_2": 0})
+        cache.store(keys[1], {"conf_2": 1})
+        self.assertEqual({"conf_2": 0}, cache.load(keys[0]))  # -> keys[1] becomes the least recently used entry
+        cache.store(keys[2], {"conf_2": 2})
+
+        self.assertEqual(2, len(cache))
+        self.assertIsNone(cache.load(keys[1]))
+        self.assertEqual({"conf_2": 0}, cache.load(keys[0]))
+        self.assertEqual({"conf_2": 2}, cache.load(keys[2]))
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import concurrent.futures
+import gc
+import threading
+import unittest
+import unittest.mock as mock
+
+import argmagiq.config_spec as config_spec
+import argmagiq.spec_cache as spec_cache
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+class SpecCacheTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.cache = spec_cache.SpecCache()
+
+    #  TEST: get  ######################################################################################################
+
+    def test_get_creates_specs_once_and_counts_hits_and_misses(self):
+
+        config_cls = _define_config_class()
+
+        spec = self.cache.get(config_cls)
+        self.assertEqual(config_spec.ConfigSpec.create_from(config_cls), spec)
+        self.assertEqual(spec_cache.CacheInfo(hits=0, misses=1, size=1), self.cache.cache_info())
+
+        self.assertIs(spec, self.cache.get(config_cls))
+        self.assertEqual(spec_cache.CacheInfo(hits=1, misses=1, size=1), self.cache.cache_info())
+
+    def test_get_replaces_specs_of_redefined_classes(self):
+
+        old_cls = _define_config_class()
+        new_cls = _define_config_class(with_default=True)
+        self.assertEqual(old_cls.__qualname__, new_cls.__qualname__)
+
+        self.assertTrue(self.cache.get(old_cls).get_value_by_name("value").required)
+        self.assertFalse(self.cache.get(new_cls).get_value_by_name("value").required)
+        self.assertEqual(spec_cache.CacheInfo(hits=0, misses=2, size=1), self.cache.cache_info())
+
+    def test_get_drops_specs_of_garbage_collected_classes(self):
+
+        self.cache.get(_define_config_class())
+        gc.collect()
+
+        self.assertEqual(0, len(self.cache))
+
+    def test_get_inspects_every_class_once_if_invoked_concurrently(self):
+
+        config_cls = _define_config_class()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            specs = list(executor.map(lambda _: self.cache.get(config_cls), range(100)))
+
+        self.assertTrue(all(s is specs[0] for s in specs))
+        self.assertEqual(spec_cache.CacheInfo(hits=99, misses=1, size=1), self.cache.cache_info())
+
+    def test_get_inspects_different_classes_concurrently(self):
+
+        slow_cls = _define_config_class()
+        other_cls = _define_config_class()
+        other_cls.__qualname__ = "_OtherConfig"
+
+        # inspecting slow_cls blocks until other_cls has been inspected, which would deadlock, if the cache was locked
+        slow_cls_started = threading.Event()
+        other_cls_done = threading.Event()
+        create_from = config_spec.ConfigSpec.create_from
+
+        def create_spec(config_cls: type) -> config_spec.ConfigSpec:
+            if config_cls is slow_cls:
+                slow_cls_started.set()
+                self.assertTrue(other_cls_done.wait(timeout=10))
+            return create_from(config_cls)
+
+        with mock.patch.object(config_spec.ConfigSpec, "create_from", side_effect=create_spec):
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                slow_future = executor.submit(self.cache.get, slow_cls)
+                self.assertTrue(slow_cls_started.wait(timeout=10))
+                self.cache.get(other_cls)
+                other_cls_done.set()
+                slow_future.result()
+
+        self.assertEqual(spec_cache.CacheInfo(hits=0, misses=2, size=2), self.cache.cache_info())
+
+    def test_get_raises_a_type_error_if_no_class_is_provided(self):
+
+        with self.assertRaises(TypeError):
+            self.cache.get("not a class")
+
+    #  TEST: get_compiled  #############################################################################################
+
+    def test_get_compiled_creates_parsers_once_for_the_cached_spec(self):
+
+        config_cls = _define_config_class()
+
+        compiled = self.cache.get_compiled(config_cls)
+        self.assertIs(self.cache.get(config_cls), compiled.spec)
+        self.assertIs(compiled, self.cache.get_compiled(config_cls))
+
+    #  TEST: clear  ####################################################################################################
+
+    def test_clear_removes_all_entries_and_resets_counters(self):
+
+        config_cls = _define_config_class()
+        self.cache.get(config_cls)
+        self.cache.get(config_cls)
+
+        self.cache.clear()
+        self.assertEqual(spec_cache.CacheInfo(hits=0, misses=0, size=0), self.cache.cache_info())
+
+
+def _define_config_class(with_default: bool = False) -> type:
+    """Defines a new configuration class, whose qualified name is the same for every invocation."""
+
+    class _Config(object):
+
+        def __init__(self):
+            self._value = None
+
+        @property
+        def value(self) -> int:
+            return self._value
+
+        @value.setter
+        def value(self, value: int) -> None:
+            self._value = value
+
+    if with_default:
+        _Config.DEFAULT_VALUE = 1
+
+    return _Config
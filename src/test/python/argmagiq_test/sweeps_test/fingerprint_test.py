@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import unittest
+
+import argmagiq.sweeps.fingerprint as fingerprint
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+class FingerprintTest(unittest.TestCase):
+
+    #  TEST: fingerprint_config  #######################################################################################
+
+    def test_fingerprint_config_depends_on_all_values_of_the_config(self):
+
+        config = _Config()
+        config.steps = 3
+        other_config = _Config()
+        other_config.steps = 3
+
+        self.assertEqual(fingerprint.fingerprint_config(config), fingerprint.fingerprint_config(other_config))
+        self.assertEqual(fingerprint.fingerprint_values({"steps": 3}), fingerprint.fingerprint_config(config))
+
+        other_config.steps = 4
+        self.assertNotEqual(fingerprint.fingerprint_config(config), fingerprint.fingerprint_config(other_config))
+
+    #  TEST: fingerprint_values  #######################################################################################
+
+    def test_fingerprint_values_is_independent_of_the_order_of_values(self):
+
+        self.assertEqual(
+                fingerprint.fingerprint_values({"a": 1, "b": [0.1, "x"]}),
+                fingerprint.fingerprint_values({"b": [0.1, "x"], "a": 1})
+        )
+        self.assertEqual(64, len(fingerprint.fingerprint_values({"a": object()})))  # -> falls back to repr
+
+
+class _Config(object):
+
+    def __init__(self):
+        self._steps = None
+
+    @property
+    def steps(self) -> int:
+        return self._steps
+
+    @steps.setter
+    def steps(self, steps: int) -> None:
+        self._steps = steps
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import gzip
+import os
+import tempfile
+import unittest
+import unittest.mock as mock
+
+import argmagiq.parsers.float_parser as float_parser
+import argmagiq.sweeps.grid_sweep as grid_sweep
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+class GridSweepTest(unittest.TestCase):
+
+    #  TEST: __init__  #################################################################################################
+
+    def test_init_raises_a_value_error_if_the_sweep_is_invalid(self):
+
+        for sweep in [
+                {"steps": 1, "does_not_exist": [1, 2]},
+                {"steps": {"range": [0]}},
+                {"steps": {"range": [0, 10, 0]}},
+                {"steps": {"values": [1, 2]}},
+                {"steps": []},
+                {"learning_rate": [0.1]}  # -> steps is required
+        ]:
+            with self.subTest(sweep=sweep):
+                with self.assertRaises(ValueError):
+                    grid_sweep.GridSweep(_SweepConfig, sweep)
+
+        with self.assertRaises(TypeError):
+            grid_sweep.GridSweep(_SweepConfig, {"steps": ["not an int"]})
+
+    def test_init_parses_every_distinct_alternative_once(self):
+
+        with mock.patch.object(
+                float_parser.FloatParser,
+                "parse_json",
+                autospec=True,
+                side_effect=lambda self, value: float(value)
+        ) as mock_method:
+            sweep = grid_sweep.GridSweep(
+                    _SweepConfig,
+                    {"steps": {"range": [0, 1000]}, "learning_rate": [0.1, 0.01, 0.1], "name": ["a", "b"]}
+            )
+            configs = list(sweep)
+
+        self.assertEqual(6000, len(configs))
+        self.assertEqual(2, mock_method.call_count)
+
+    #  TEST: __iter__  #################################################################################################
+
+    def test_iter_creates_all_combinations_lazily(self):
+
+        sweep = grid_sweep.GridSweep(
+                _SweepConfig,
+                {"steps": {"range": [0, 1000]}, "learning_rate": [0.1, 0.01], "name": "x"}
+        )
+        configs = iter(sweep)
+
+        config = next(configs)
+        self.assertEqual((0, 0.1, "x", False), (config.steps, config.learning_rate, config.name, config.verbose))
+        config = next(configs)
+        self.assertEqual((0, 0.01, "x"), (config.steps, config.learning_rate, config.name))
+        config = next(configs)
+        self.assertEqual((1, 0.1, "x"), (config.steps, config.learning_rate, config.name))
+
+    #  TEST: __len__  ##################################################################################################
+
+    def test_len_computes_the_number_of_configurations_without_enumerating_them(self):
+
+        sweep = grid_sweep.GridSweep(
+                _SweepConfig,
+                {
+                        "steps": {"range": [0, 1000, 2]},
+                        "learning_rate": {"range": [0.0, 1.0, 0.1]},
+                        "verbose": [True, False]
+                }
+        )
+
+        self.assertEqual(500 * 10 * 2, len(sweep))
+        self.assertEqual(
+                [0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9],
+                [round(x, 9) for x in sweep.alternatives["learning_rate"]]
+        )
+
+    #  TEST: from_file  ################################################################################################
+
+    def test_from_file_loads_the_sweep_from_a_json_file(self):
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+
+            file_path = os.path.join(temp_dir, "sweep.json.gz")
+            with gzip.open(file_path, "wt") as f:
+                f.write('{"steps": [1, 2], "name": ["a", "b", "c"]}')
+
+            sweep = grid_sweep.GridSweep.from_file(_SweepConfig, file_path)
+
+        self.assertEqual(6, len(sweep))
+        self.assertEqual({"steps": (1, 2), "name": ("a", "b", "c")}, sweep.alternatives)
+
+        with self.assertRaises(ValueError):
+            grid_sweep.GridSweep.from_file(_SweepConfig, "/does/not/exist.json")
+
+
+class _SweepConfig(object):
+
+    DEFAULT_LEARNING_RATE = 0.1
+    DEFAULT_NAME = "default"
+    DEFAULT_VERBOSE = False
+
+    def __init__(self):
+        self._learning_rate = self.DEFAULT_LEARNING_RATE
+        self._name = self.DEFAULT_NAME
+        self._steps = None
+        self._verbose = self.DEFAULT_VERBOSE
+
+    @property
+    def learning_rate(self) -> float:
+        return self._learning_rate
+
+    @learning_rate.setter
+    def learning_rate(self, learning_rate: float) -> None:
+        self._learning_rate = learning_rate
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, name: str) -> None:
+        self._name = name
+
+    @property
+    def steps(self) -> int:
+        return self._steps
+
+    @steps.setter
+    def steps(self, steps: int) -> None:
+        self._steps = steps
+
+    @property
+    def verbose(self) -> bool:
+        return self._verbose
+
+    @verbose.setter
+    def verbose(self, verbose: bool) -> None:
+        self._verbose = verbose
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import importlib.util
+import math
+import unittest
+
+import argmagiq.sweeps.random_sweep as random_sweep
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+DISTRIBUTIONS = {
+        "learning_rate": {"loguniform": [1e-4, 1e-1]},
+        "momentum": {"uniform": [0, 1]},
+        "name": ["a", "b", "c"],
+        "steps": {"randint": [10, 20]},
+        "verbose": True
+}
+"""dict: The distributions that are used in the tests."""
+
+
+@unittest.skipIf(random_sweep.np is None, "NumPy is not installed")
+class RandomSweepTest(unittest.TestCase):
+
+    #  TEST: __init__  #################################################################################################
+
+    def test_init_raises_a_value_error_if_the_distributions_are_invalid(self):
+
+        for distributions in [
+                {"steps": 1, "does_not_exist": [1, 2]},
+                {"steps": {"normal": [0, 1]}},
+                {"steps": {"randint": [10]}},
+                {"steps": {"randint": [10, 10]}},
+                {"steps": {"uniform": [0, 10]}},
+                {"steps": 1, "momentum": {"randint": [0, 1]}},
+                {"steps": 1, "learning_rate": {"loguniform": [0, 1]}},
+                {"steps": 1, "name": {"choice": []}},
+                {"learning_rate": {"uniform": [0, 1]}}  # -> steps is required
+        ]:
+            with self.subTest(distributions=distributions):
+                with self.assertRaises(ValueError):
+                    random_sweep.RandomSweep(_SweepConfig, distributions, 10)
+
+        with self.assertRaises(ValueError):
+            random_sweep.RandomSweep(_SweepConfig, {"steps": 1}, 10, method="grid")
+
+    #  TEST: __iter__  #################################################################################################
+
+    def test_iter_creates_configurations_within_the_specified_bounds(self):
+
+        for method in ["halton", "random"]:
+            with self.subTest(method=method):
+
+                configs = list(random_sweep.RandomSweep(_SweepConfig, DISTRIBUTIONS, 500, method=method))
+
+                self.assertEqual(500, len(configs))
+                for config in configs:
+                    self.assertIsInstance(config.learning_rate, float)
+                    self.assertTrue(1e-4 <= config.learning_rate < 1e-1)
+                    self.assertIsInstance(config.momentum, float)
+                    self.assertTrue(0 <= config.momentum < 1)
+                    self.assertIn(config.name, ("a", "b", "c"))
+                    self.assertIsInstance(config.steps, int)
+                    self.assertTrue(10 <= config.steps < 20)
+                    self.assertIs(True, config.verbose)
+
+                # all alternatives should be sampled
+                self.assertEqual({"a", "b", "c"}, {config.name for config in configs})
+                self.assertEqual(set(range(10, 20)), {config.steps for config in configs})
+
+    #  TEST: iter_batches  #############################################################################################
+
+    def test_iter_batches_samples_at_most_batch_size_values_at_once(self):
+
+        sweep = random_sweep.RandomSweep(_SweepConfig, DISTRIBUTIONS, 10, batch_size=4)
+        batches = list(sweep.iter_batches())
+
+        self.assertEqual([4, 4, 2], [len(batch["steps"]) for batch in batches])
+        self.assertEqual({"learning_rate", "momentum", "name", "steps"}, set(batches[0]))
+        self.assertEqual({"verbose": True}, sweep.fixed_values)
+
+    def test_iter_batches_yields_nothing_if_no_samples_are_requested(self):
+
+        sweep = random_sweep.RandomSweep(_SweepConfig, DISTRIBUTIONS, 0)
+
+        self.assertEqual([], list(sweep.iter_batches()))
+        self.assertEqual([], list(sweep))
+
+    #  TEST: iter_values  ##############################################################################################
+
+    def test_iter_values_is_deterministic_given_the_seed(self):
+
+        for method in ["halton", "random"]:
+            with self.subTest(method=method):
+
+                values = list(random_sweep.RandomSweep(_SweepConfig, DISTRIBUTIONS, 50, method=method).iter_values())
+                other_values = list(
+                        random_sweep.RandomSweep(
+                                _SweepConfig, DISTRIBUTIONS, 50, method=method, batch_size=7
+                        ).iter_values()
+                )
+                different_values = list(
+                        random_sweep.RandomSweep(_SweepConfig, DISTRIBUTIONS, 50, seed=1, method=method).iter_values()
+                )
+
+                self.assertEqual(values, other_values)
+                self.assertNotEqual(values, different_values)
+
+    def test_iter_values_covers_the_unit_cube_evenly_for_halton_sequences(self):
+
+        sweep = random_sweep.RandomSweep(
+                _SweepConfig, {"steps": 1, "momentum": {"uniform": [0, 1]}}, 64, method="halton"
+        )
+        momenta = sorted(values["momentum"] for values in sweep.iter_values())
+
+        # each of 64 equally sized intervals contains exactly one of the first 64 points of a (shifted) base-2 sequence
+        self.assertEqual(list(range(64)), [math.floor(m * 64) for m in momenta])
+
+    def test_iter_values_yields_the_fixed_values_once_per_sample_if_nothing_is_sampled(self):
+
+        sweep = random_sweep.RandomSweep(_SweepConfig, {"steps": 10, "verbose": True}, 5, batch_size=2)
+
+        self.assertEqual(5, len(sweep))
+        self.assertEqual([{"steps": 10, "verbose": True}] * 5, list(sweep.iter_values()))
+        self.assertEqual([10] * 5, [config.steps for config in sweep])
+
+    @unittest.skipIf(importlib.util.find_spec("scipy") is None, "SciPy is not installed")
+    def test_iter_values_supports_sobol_sequences(self):
+
+        sweep = random_sweep.RandomSweep(_SweepConfig, DISTRIBUTIONS, 64, method="sobol")
+        values = list(sweep.iter_values())
+
+        self.assertEqual(64, len(values))
+        self.assertEqual(
+                values,
+                list(random_sweep.RandomSweep(_SweepConfig, DISTRIBUTIONS, 64, method="sobol").iter_values())
+        )
+
+
+class _SweepConfig(object):
+
+    DEFAULT_LEARNING_RATE = 0.1
+    DEFAULT_MOMENTUM = 0.0
+    DEFAULT_NAME = "default"
+    DEFAULT_VERBOSE = False
+
+    def __init__(self):
+        self._learning_rate = self.DEFAULT_LEARNING_RATE
+        self._momentum = self.DEFAULT_MOMENTUM
+        self._name = self.DEFAULT_NAME
+        self._steps = None
+        self._verbose = self.DEFAULT_VERBOSE
+
+    @property
+    def learning_rate(self) -> float:
+        return self._learning_rate
+
+    @learning_rate.setter
+    def learning_rate(self, learning_rate: float) -> None:
+        self._learning_rate = learning_rate
+
+    @property
+    def momentum(self) -> float:
+        return self._momentum
+
+    @momentum.setter
+    def momentum(self, momentum: float) -> None:
+        self._momentum = momentum
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, name: str) -> None:
+        self._name = name
+
+    @property
+    def steps(self) -> int:
+        return self._steps
+
+    @steps.setter
+    def steps(self, steps: int) -> None:
+        self._steps = steps
+
+    @property
+    def verbose(self) -> bool:
+        return self._verbose
+
+    @verbose.setter
+    def verbose(self, verbose: bool) -> None:
+        self._verbose = verbose
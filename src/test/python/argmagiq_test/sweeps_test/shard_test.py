@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import os
+import unittest
+import unittest.mock as mock
+
+import argmagiq.sweeps.grid_sweep as grid_sweep
+import argmagiq.sweeps.shard as shard
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+class ShardTest(unittest.TestCase):
+
+    def setUp(self):
+        self.sweep = grid_sweep.GridSweep(_Config, {"steps": {"range": [0, 300]}, "name": ["a", "b"]})
+
+    #  TEST: __init__  #################################################################################################
+
+    def test_init_raises_a_value_error_if_the_index_is_out_of_range(self):
+
+        for index, count in [(-1, 2), (2, 2), (0, 0)]:
+            with self.subTest(index=index, count=count):
+                with self.assertRaises(ValueError):
+                    shard.Shard(index, count)
+
+    #  TEST: from_argv  ################################################################################################
+
+    def test_from_argv_removes_the_reserved_options_from_the_args(self):
+
+        self.assertEqual(
+                (shard.Shard(2, 4), ["--name", "x", "--", "sweep.json"]),
+                shard.Shard.from_argv(["--shard-index", "2", "--name", "x", "--shard-count=4", "--", "sweep.json"])
+        )
+
+    def test_from_argv_keeps_all_args_after_a_double_dash(self):
+
+        with mock.patch.dict(os.environ, clear=True):
+            self.assertEqual(
+                    (shard.Shard(0, 1), ["--", "--shard-index", "--", "--shard-count=2"]),
+                    shard.Shard.from_argv(["--", "--shard-index", "--", "--shard-count=2"])
+            )
+        self.assertEqual(
+                (shard.Shard(1, 2), ["--", "--shard-index=0"]),
+                shard.Shard.from_argv(["--shard-index=1", "--shard-count", "2", "--", "--shard-index=0"])
+        )
+
+    def test_from_argv_falls_back_to_environment_variables(self):
+
+        with mock.patch.dict(os.environ, {shard.SHARD_INDEX_ENV_VAR: "1", shard.SHARD_COUNT_ENV_VAR: "3"}):
+            self.assertEqual((shard.Shard(1, 3), ["--name", "x"]), shard.Shard.from_argv(["--name", "x"]))
+            self.assertEqual((shard.Shard(0, 2), []), shard.Shard.from_argv(["--shard-index=0", "--shard-count=2"]))
+
+        with mock.patch.dict(os.environ, clear=True):
+            self.assertEqual((shard.Shard(0, 1), []), shard.Shard.from_argv([]))
+
+    def test_from_argv_raises_a_value_error_if_the_shard_is_invalid(self):
+
+        for argv in [
+                ["--shard-index", "1"],
+                ["--shard-count", "2", "--shard-index"],
+                ["--shard-count=2", "--shard-index="],
+                ["--shard-index", "x", "--shard-count", "2"],
+                ["--shard-index", "2", "--shard-count", "2"]
+        ]:
+            with self.subTest(argv=argv):
+                with mock.patch.dict(os.environ, clear=True):
+                    with self.assertRaises(ValueError):
+                        shard.Shard.from_argv(argv)
+
+    #  TEST: iter_configs  #############################################################################################
+
+    def test_iter_configs_partitions_the_sweep(self):
+
+        shards = [shard.Shard(index, 3) for index in range(3)]
+        configs = [[(c.steps, c.name) for c in s.iter_configs(self.sweep)] for s in shards]
+
+        # every config belongs to exactly one shard, and all shards are of similar size
+        self.assertEqual(sorted((c.steps, c.name) for c in self.sweep), sorted(sum(configs, [])))
+        self.assertTrue(all(150 <= len(c) <= 250 for c in configs))
+
+        # the partition is deterministic
+        self.assertEqual(configs[1], [(c.steps, c.name) for c in shard.Shard(1, 3).iter_configs(self.sweep)])
+
+    def test_iter_configs_creates_configs_of_the_shard_only(self):
+
+        create_config = self.sweep.parser.create_config
+        with mock.patch.object(self.sweep.parser, "create_config", wraps=create_config) as mock_create:
+            configs = list(shard.Shard(0, 4).iter_configs(self.sweep))
+
+        self.assertEqual(len(configs), mock_create.call_count)
+
+    #  TEST: owns_values  ##############################################################################################
+
+    def test_owns_values_agrees_with_owns_config_if_the_spec_is_provided(self):
+
+        sweep = grid_sweep.GridSweep(_Config, {"steps": {"range": [0, 100]}})
+        spec = sweep.parser.compiled.spec
+        for index in range(3):
+            s = shard.Shard(index, 3)
+            for values in sweep.iter_values():
+                with self.subTest(shard=index, values=values):
+                    config = sweep.parser.create_config(values)
+                    self.assertEqual(s.owns_config(config), s.owns_values(values, spec=spec))
+
+        # -> iterating over a sweep selects the same configs as filtering them
+        self.assertEqual([c.steps for c in s.select(sweep)], [c.steps for c in s.iter_configs(sweep)])
+
+    #  TEST: select  ###################################################################################################
+
+    def test_select_partitions_any_iterable_of_configs(self):
+
+        shards = [shard.Shard(index, 2) for index in range(2)]
+        configs = [{(c.steps, c.name) for c in s.select(self.sweep)} for s in shards]
+
+        self.assertEqual(600, len(configs[0] | configs[1]))
+        self.assertFalse(configs[0] & configs[1])
+
+
+class _Config(object):
+
+    DEFAULT_NAME = "default"
+
+    def __init__(self):
+        self._name = self.DEFAULT_NAME
+        self._steps = None
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, name: str) -> None:
+        self._name = name
+
+    @property
+    def steps(self) -> int:
+        return self._steps
+
+    @steps.setter
+    def steps(self, steps: int) -> None:
+        self._steps = steps
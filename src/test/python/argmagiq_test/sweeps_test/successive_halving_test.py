@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import contextlib
+import os
+import sqlite3
+import tempfile
+import unittest
+
+import argmagiq.sweeps.grid_sweep as grid_sweep
+import argmagiq.sweeps.successive_halving as successive_halving
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+class SuccessiveHalvingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "search.db")
+        self.sweep = grid_sweep.GridSweep(_Config, {"learning_rate": [x / 10 for x in range(1, 10)]})
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    #  TEST: __init__  #################################################################################################
+
+    def test_init_computes_the_budgets_of_all_rungs(self):
+
+        search = successive_halving.SuccessiveHalving(self.sweep, _evaluate, self.db_path, 1, 30)
+        self.assertEqual([1, 3, 9, 27], search.budgets)
+
+        search = successive_halving.SuccessiveHalving(self.sweep, _evaluate, self.db_path, 0.5, 2, reduction_factor=2)
+        self.assertEqual([0.5, 1.0, 2.0], search.budgets)
+
+    #  TEST: _find_promotion  ##########################################################################################
+
+    def test_find_promotion_promotes_every_config_among_the_best_that_has_not_been_promoted_yet(self):
+
+        search = successive_halving.SuccessiveHalving(self.sweep, _evaluate, self.db_path, 1, 2, reduction_factor=2)
+        rankings, candidates = search._create_rankings([{0: 5, 1: 4, 2: 1, 3: 9}, {0: 5, 1: 4}])
+
+        # configs 0 and 1 were promoted before config 3 was evaluated, which is among the best half now as well
+        self.assertEqual((3, 1), search._find_promotion(rankings, candidates))
+        self.assertIsNone(search._find_promotion(rankings, candidates))
+
+    #  TEST: run  ######################################################################################################
+
+    def test_run_promotes_the_best_configs_to_larger_budgets(self):
+
+        search = successive_halving.SuccessiveHalving(self.sweep, _evaluate, self.db_path, 1, 9, max_workers=1)
+        trials = search.run()
+
+        # with a single worker, configs are evaluated in order, and since every config is better than all of the ones
+        # before, it is promoted as soon as the best third of its rung contains at least one config
+        self.assertEqual(9, len(trials))
+        self.assertEqual(
+                [(0.9, 2, 9), (0.8, 2, 9), (0.7, 2, 9), (0.6, 2, 9), (0.5, 2, 9), (0.4, 1, 3), (0.3, 1, 3)],
+                [(t.config.learning_rate, t.rung, t.budget) for t in trials[:7]]
+        )
+        self.assertEqual([(0.2, 0), (0.1, 0)], [(t.config.learning_rate, t.rung) for t in trials[7:]])
+
+    def test_run_evaluates_configs_in_parallel(self):
+
+        search = successive_halving.SuccessiveHalving(self.sweep, _evaluate, self.db_path, 1, 9, max_workers=2)
+        trials = search.run()
+
+        self.assertEqual(9, len(trials))
+        self.assertEqual((0.9, 2), (trials[0].config.learning_rate, trials[0].rung))
+        self.assertEqual([(0.2, 0), (0.1, 0)], [(t.config.learning_rate, t.rung) for t in trials[7:]])
+
+    def test_run_minimizes_scores_if_requested(self):
+
+        search = successive_halving.SuccessiveHalving(
+                self.sweep, _evaluate, self.db_path, 1, 9, minimize=True, max_workers=1
+        )
+        trials = search.run()
+
+        self.assertEqual((0.1, 2), (trials[0].config.learning_rate, trials[0].rung))
+
+    def test_run_replaces_nan_scores_with_the_worst_possible_score(self):
+
+        for minimize, worst_score in [(False, float("-inf")), (True, float("inf"))]:
+            with self.subTest(minimize=minimize):
+                db_path = os.path.join(self.temp_dir.name, f"search-{minimize}.db")
+                search = successive_halving.SuccessiveHalving(
+                        self.sweep, _evaluate_nan_for_extremes, db_path, 1, 9, minimize=minimize, max_workers=1
+                )
+                trials = search.run()
+
+                self.assertEqual(9, len(trials))
+                self.assertEqual(
+                        [(0, worst_score), (0, worst_score)],
+                        [(t.rung, t.score) for t in trials if t.config.learning_rate in (0.1, 0.9)]
+                )
+
+                # the search is restored from the database
+                self.assertEqual(
+                        [(t.config.learning_rate, t.rung, t.score) for t in trials],
+                        [(t.config.learning_rate, t.rung, t.score) for t in search.run()]
+                )
+
+    def test_run_samples_configs_lazily_and_stores_completed_trials_if_a_trial_fails(self):
+
+        search = successive_halving.SuccessiveHalving(
+                self.sweep, _fail_with_budget_3, self.db_path, 1, 9, max_workers=1
+        )
+        with self.assertRaises(RuntimeError):
+            search.run()
+
+        # the third config is the first one that is promoted, and no further configs are sampled after it failed
+        with contextlib.closing(sqlite3.connect(self.db_path)) as connection:
+            self.assertEqual(3, connection.execute("SELECT COUNT(*) FROM configs").fetchone()[0])
+            self.assertEqual(
+                    [(0, 0), (1, 0), (2, 0)],
+                    connection.execute("SELECT config_id, rung FROM trials ORDER BY config_id").fetchall()
+            )
+
+    def test_run_resumes_an_interrupted_search(self):
+
+        search = successive_halving.SuccessiveHalving(
+                self.sweep, _fail_with_budget_9, self.db_path, 1, 9, max_workers=1
+        )
+        with self.assertRaises(RuntimeError):
+            search.run()
+
+        # trials that have been completed before are not repeated -> this would violate the primary key of the database
+        search = successive_halving.SuccessiveHalving(self.sweep, _evaluate, self.db_path, 1, 9, max_workers=1)
+        trials = search.run()
+
+        other_db_path = os.path.join(self.temp_dir.name, "other-search.db")
+        other_search = successive_halving.SuccessiveHalving(self.sweep, _evaluate, other_db_path, 1, 9, max_workers=1)
+        self.assertEqual(
+                [(t.config.learning_rate, t.rung, t.score) for t in other_search.run()],
+                [(t.config.learning_rate, t.rung, t.score) for t in trials]
+        )
+
+    def test_run_raises_a_value_error_if_the_database_belongs_to_a_different_search(self):
+
+        successive_halving.SuccessiveHalving(self.sweep, _evaluate, self.db_path, 1, 9, max_workers=1).run()
+
+        with self.assertRaises(ValueError):
+            successive_halving.SuccessiveHalving(self.sweep, _evaluate, self.db_path, 1, 27, max_workers=1).run()
+
+
+def _evaluate(config: "_Config", budget: int) -> float:
+    return config.learning_rate
+
+
+def _evaluate_nan_for_extremes(config: "_Config", budget: int) -> float:
+    if config.learning_rate in (0.1, 0.9):
+        return float("nan")
+    return config.learning_rate
+
+
+def _fail_with_budget_3(config: "_Config", budget: int) -> float:
+    if budget == 3:
+        raise RuntimeError()
+    return config.learning_rate
+
+
+def _fail_with_budget_9(config: "_Config", budget: int) -> float:
+    if budget == 9:
+        raise RuntimeError()
+    return config.learning_rate
+
+
+class _Config(object):
+
+    def __init__(self):
+        self._learning_rate = None
+
+    @property
+    def learning_rate(self) -> float:
+        return self._learning_rate
+
+    @learning_rate.setter
+    def learning_rate(self, learning_rate: float) -> None:
+        self._learning_rate = learning_rate
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import concurrent.futures
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+import argmagiq.sweeps.grid_sweep as grid_sweep
+import argmagiq.sweeps.sweep_runner as sweep_runner
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+class SweepRunnerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.journal_path = os.path.join(self.temp_dir.name, "journal.jsonl")
+        self.sweep = grid_sweep.GridSweep(_Config, {"steps": {"range": [0, 20]}})
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    #  TEST: run  ######################################################################################################
+
+    def test_run_runs_all_configs_in_a_thread_pool(self):
+
+        runner = sweep_runner.SweepRunner(_double_steps, max_workers=4)
+        results = list(runner.run(self.sweep))
+
+        self.assertEqual(list(range(0, 40, 2)), sorted(r.result for r in results))
+        self.assertTrue(all(r.error is None for r in results))
+
+    def test_run_runs_all_configs_in_a_process_pool(self):
+
+        runner = sweep_runner.SweepRunner(_double_steps, executor="process", max_workers=2)
+        results = list(runner.run(self.sweep))
+
+        self.assertEqual(list(range(0, 40, 2)), sorted(r.result for r in results))
+
+    def test_run_limits_the_number_of_jobs_in_flight(self):
+
+        lock = threading.Lock()
+        num_running = [0, 0]  # -> current, maximum
+
+        def target(config):
+            with lock:
+                num_running[0] += 1
+                num_running[1] = max(num_running)
+            time.sleep(0.001)
+            with lock:
+                num_running[0] -= 1
+
+        # configs are drawn from the iterable lazily
+        num_drawn = [0]
+
+        def draw_configs():
+            for config in self.sweep:
+                num_drawn[0] += 1
+                yield config
+
+        runner = sweep_runner.SweepRunner(target, max_workers=8, max_pending=2)
+        results = runner.run(draw_configs())
+        next(results)
+
+        self.assertLessEqual(num_drawn[0], 3)
+
+        list(results)
+        self.assertEqual(20, num_drawn[0])
+        self.assertLessEqual(num_running[1], 2)
+
+    def test_run_reports_failed_and_timed_out_jobs(self):
+
+        release = threading.Event()
+
+        def target(config):
+            if config.steps == 1:
+                raise RuntimeError()
+            if config.steps == 2:
+                release.wait()
+            return config.steps
+
+        try:
+            runner = sweep_runner.SweepRunner(target, max_workers=4, timeout=0.2)
+            results = {r.config.steps: r for r in runner.run(self.sweep)}
+        finally:
+            release.set()
+
+        self.assertEqual(20, len(results))
+        self.assertIsInstance(results[1].error, RuntimeError)
+        self.assertIsInstance(results[2].error, concurrent.futures.TimeoutError)
+        self.assertEqual(3, results[3].result)
+
+    def test_run_counts_timed_out_jobs_as_in_flight_until_they_return(self):
+
+        lock = threading.Lock()
+        num_running = [0, 0]  # -> current, maximum
+        release = threading.Event()
+
+        def target(config):
+            with lock:
+                num_running[0] += 1
+                num_running[1] = max(num_running)
+            if config.steps == 0:
+                release.wait()
+            else:
+                time.sleep(0.02)  # -> the first job times out before all others are done
+            with lock:
+                num_running[0] -= 1
+
+        try:
+            runner = sweep_runner.SweepRunner(target, max_workers=4, max_pending=2, timeout=0.1)
+            results = {r.config.steps: r for r in runner.run(self.sweep)}
+        finally:
+            release.set()
+
+        self.assertEqual(20, len(results))
+        self.assertIsInstance(results[0].error, concurrent.futures.TimeoutError)
+        self.assertLessEqual(num_running[1], 2)
+
+    def test_run_measures_timeouts_from_the_start_of_jobs(self):
+
+        def target(config):
+            time.sleep(0.05)
+            return config.steps
+
+        # with a single worker, the last job starts long after it has been drawn
+        runner = sweep_runner.SweepRunner(target, max_workers=1, max_pending=10, timeout=0.5)
+        results = list(runner.run(self.sweep))
+
+        self.assertEqual(list(range(20)), sorted(r.result for r in results))
+        self.assertTrue(all(r.error is None for r in results))
+
+    def test_run_replaces_process_pools_that_contain_timed_out_jobs(self):
+
+        sweep = grid_sweep.GridSweep(_Config, {"steps": {"range": [0, 3]}})
+        runner = sweep_runner.SweepRunner(_sleep_if_steps_is_0, executor="process", max_workers=1, timeout=0.5)
+
+        start = time.monotonic()
+        results = {r.config.steps: r for r in runner.run(sweep)}
+
+        self.assertLess(time.monotonic() - start, 30)
+        self.assertIsInstance(results[0].error, concurrent.futures.TimeoutError)
+        self.assertEqual((1, 2), (results[1].result, results[2].result))
+
+    def test_run_skips_configs_that_have_been_completed_before(self):
+
+        def fail_odd_steps(config):
+            if config.steps % 2 == 1:
+                raise RuntimeError()
+
+        runner = sweep_runner.SweepRunner(fail_odd_steps, journal_path=self.journal_path, max_workers=4)
+        self.assertEqual(20, len(list(runner.run(self.sweep))))
+
+        # only the failed jobs are run again
+        runner = sweep_runner.SweepRunner(_double_steps, journal_path=self.journal_path, max_workers=4)
+        results = list(runner.run(self.sweep))
+
+        self.assertEqual(list(range(1, 20, 2)), sorted(r.config.steps for r in results))
+        self.assertTrue(all(r.error is None for r in results))
+        self.assertEqual([], list(runner.run(self.sweep)))
+
+
+def _double_steps(config: "_Config") -> int:
+    return 2 * config.steps
+
+
+def _sleep_if_steps_is_0(config: "_Config") -> int:
+    if config.steps == 0:
+        time.sleep(60)
+    return config.steps
+
+
+class _Config(object):
+
+    def __init__(self):
+        self._steps = None
+
+    @property
+    def steps(self) -> int:
+        return self._steps
+
+    @steps.setter
+    def steps(self, steps: int) -> None:
+        self._steps = steps
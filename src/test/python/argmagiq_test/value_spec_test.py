@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#                                                                                     #
+#   BSD 2-Clause License                                                              #
+#                                                                                     #
+#   Copyright (c) 2020, Patrick Hohenecker                                            #
+#   All rights reserved.                                                              #
+#                                                                                     #
+#   Redistribution and use in source and binary forms, with or without                #
+#   modification, are permitted provided that the following conditions are met:       #
+#                                                                                     #
+#   1. Redistributions of source code must retain the above copyright notice, this    #
+#      list of conditions and the following disclaimer.                               #
+#                                                                                     #
+#   2. Redistributions in binary form must reproduce the above copyright notice,      #
+#      this list of conditions and the following disclaimer in the documentation      #
+#      and/or other materials provided with the distribution.                         #
+#                                                                                     #
+#   THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"       #
+#   AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE         #
+#   IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE    #
+#   DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE      #
+#   FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL        #
+#   DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR        #
+#   SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER        #
+#   CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,     #
+#   OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE     #
+#   OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.              #
+#                                                                                     #
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import pickle
+import unittest
+
+import argmagiq.value_spec as value_spec
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = "Copyright (c) 2020, Patrick Hohenecker"
+__license__ = "BSD-2-Clause"
+__version__ = "0.1.0"
+__date__ = "29 Jun 2020"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "patrick.hohenecker@gmx.at"
+__status__ = "Development"
+
+
+class ValueSpecTest(unittest.TestCase):
+
+    #  TEST: __hash__  #################################################################################################
+
+    def test_hash_is_equal_for_equal_value_specs(self):
+
+        spec_1 = value_spec.ValueSpec("val", "A description.", int, False, 1)
+        spec_2 = value_spec.ValueSpec("val", "A description.", int, False, 1)
+
+        self.assertEqual(spec_1, spec_2)
+        self.assertEqual(hash(spec_1), hash(spec_2))
+        self.assertEqual(1, len({spec_1, spec_2}))
+
+    #  TEST: __reduce__  ###############################################################################################
+
+    def test_value_specs_can_be_pickled(self):
+
+        spec = value_spec.ValueSpec("val", "A description.", int, False, 1)
+        restored_spec = pickle.loads(pickle.dumps(spec))
+
+        self.assertEqual(spec, restored_spec)
+        self.assertEqual(hash(spec), hash(restored_spec))
+
+    #  TEST: __setattr__  ##############################################################################################
+
+    def test_value_specs_are_immutable(self):
+
+        spec = value_spec.ValueSpec("val", "A description.", int, False, 1)
+
+        with self.assertRaises(AttributeError):
+            spec._name = "another val"
+        with self.assertRaises(AttributeError):
+            spec.another_attribute = 1
+        with self.assertRaises(AttributeError):
+            del spec._name
+        self.assertFalse(hasattr(spec, "__dict__"))